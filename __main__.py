@@ -1,13 +1,128 @@
 import argparse
+import contextlib
+import os
+import sys
 
-from compiler import compile_c
+from _parser import DRIVERS, Parser
+from batch import compile_batch, expand_inputs, output_paths
+from buildcache import BuildCache, compile_incremental
+from errors import DIAGNOSTIC_FORMATS, Diagnostics
+from instrument import REPORT_FORMATS, ProductionProfile, Report
+from lexer import TOKENIZERS, TOKENTYPES
+from server import serve_socket, serve_stdio
 
 
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description='Prism Compiler')
+    parser = argparse.ArgumentParser(description='Prism Compiler', fromfile_prefix_chars='@')
     parser.add_argument('-o', '--output', metavar='output', type=str, help='path to output file')
-    parser.add_argument('input', metavar='input', type=str, help='path to input file')
+    parser.add_argument('-d', '--output-dir', metavar='dir', type=str, help='output directory for batch compiles')
+    parser.add_argument('-j', '--jobs', metavar='N', type=int, default=None, help='number of worker processes for batch compiles')
+    parser.add_argument('--lexer', choices=TOKENIZERS, default='regex', help='tokenizer engine')
+    parser.add_argument('--driver', choices=DRIVERS, default='compiled', help='parser driver, pratt parses expressions by hand')
+    parser.add_argument('--parse-jobs', metavar='N', type=int, default=1, help='parse the top-level declarations of a single input in N processes')
+    parser.add_argument('--lex-jobs', metavar='N', type=int, default=1, help='match the tokens of a single large input in N processes')
+    parser.add_argument('--mmap', action='store_true', help='memory-map inputs instead of reading them into memory')
+    parser.add_argument('--cache-dir', metavar='dir', type=str, help='reuse outputs whose input and includes are unchanged')
+    parser.add_argument('-MD', dest='depfile', action='store_true', help='write a make dependency file next to each output')
+    parser.add_argument('-MF', dest='depfile_path', metavar='file', type=str, help='path of the dependency file for a single input')
+    parser.add_argument('--max-errors', metavar='N', type=int, default=20, help='stop after N errors per file, 0 for no limit')
+    parser.add_argument('--diagnostics-format', choices=DIAGNOSTIC_FORMATS, default='text', help='print errors as text or as a JSON list')
+    parser.add_argument('--time-report', action='store_true', help='print time, counters and memory per compile stage to stderr')
+    parser.add_argument('--profile-productions', action='store_true', help='print calls and time per grammar production to stderr')
+    parser.add_argument('--time-report-format', choices=REPORT_FORMATS, default='text', help='time report and production profile as a table or as JSON')
+    parser.add_argument('--serve', action='store_true', help='compile JSON-lines requests from stdin until EOF')
+    parser.add_argument('--socket', metavar='path', type=str, help='compile JSON-lines requests on a unix socket')
+    parser.add_argument('input', metavar='input', type=str, nargs='*', help='path to input file, directory or glob pattern (@file reads arguments from a manifest)')
 
     args = parser.parse_args()
 
-    compile_c(args.input, args.output)
+    inputs = expand_inputs(args.input)
+
+    if args.mmap and args.lexer == 'chars':
+        parser.error("--mmap needs the regex or buffer lexer")
+
+    if args.lex_jobs != 1 and args.lexer == 'chars':
+        parser.error("--lex-jobs needs the regex or buffer lexer")
+
+    if args.serve:
+        serve_stdio(args.lexer, args.driver)
+
+    elif args.socket is not None:
+        try:
+            serve_socket(args.socket, args.lexer, args.driver)
+
+        except FileExistsError as e:
+            parser.error(str(e))
+
+    elif not inputs:
+        parser.error("no input files")
+
+    elif len(inputs) == 1 and args.output_dir is None:
+        # the workers of a parallel parse run their own copies of the productions
+        if args.profile_productions and args.parse_jobs > 1:
+            parser.error("--profile-productions needs a serial parse, leave out --parse-jobs")
+
+        # the output also names the target of the dependency file
+        if args.output is None:
+            parser.error("a single input needs -o, or -d for an output directory")
+
+        cache = BuildCache(args.cache_dir) if args.cache_dir is not None else None
+        depfile = args.depfile_path or (args.output + ".d" if args.depfile else None)
+
+        diagnostics = Diagnostics(args.max_errors, args.diagnostics_format)
+        report = Report() if args.time_report else contextlib.nullcontext()
+
+        prism = Parser(TOKENTYPES, driver=args.driver)
+        profile = ProductionProfile(prism) if args.profile_productions else contextlib.nullcontext()
+
+        try:
+            with report, profile:
+                compile_incremental(inputs[0], args.output, args.lexer, prism, cache, depfile, args.mmap, diagnostics,
+                                    args.parse_jobs, args.lex_jobs)
+
+        finally:
+            if args.time_report:
+                print(report.format(args.time_report_format), file=sys.stderr)
+
+            if args.profile_productions:
+                print(profile.format(args.time_report_format), file=sys.stderr)
+
+    else:
+        if args.output is not None or args.output_dir is None:
+            parser.error("batch compiles take --output-dir instead of --output")
+
+        if args.depfile_path is not None:
+            parser.error("-MF takes a single input, use -MD for batch compiles")
+
+        if args.time_report or args.profile_productions:
+            parser.error("--time-report and --profile-productions take a single input")
+
+        if args.parse_jobs != 1:
+            parser.error("--parse-jobs takes a single input, use -j for batch compiles")
+
+        if args.lex_jobs != 1:
+            parser.error("--lex-jobs takes a single input, use -j for batch compiles")
+
+        outputs = [os.path.realpath(outFile) for outFile in output_paths(inputs, args.output_dir)]
+
+        if len(set(outputs)) < len(outputs):
+            parser.error("an input file is given more than once")
+
+        if set(outputs) & {os.path.realpath(inFile) for inFile in inputs}:
+            parser.error("--output-dir would overwrite an input file")
+
+        failed = 0
+
+        for result in compile_batch(inputs, args.output_dir, args.jobs, args.lexer, args.cache_dir, args.depfile, args.mmap,
+                                     args.max_errors, args.diagnostics_format, args.driver):
+            if result.ok:
+                print(f"{'CACHED' if result.cached else 'OK':6} {result.inFile} -> {result.outFile}")
+
+            else:
+                failed += 1
+                print(f"FAILED {result.inFile}")
+                print(result.log)
+
+        print(f"{len(inputs) - failed} compiled, {failed} failed")
+
+        sys.exit(1 if failed else 0)
@@ -1,20 +1,73 @@
 from typing import Generator
 
-from rply import ParserGenerator
-from rply.token import Token
-
 from astree import *
 from errors import *
+from lexer import TOKENTYPES
+from lrparser import CompiledLRParser
+from prebuilt import Rules, TABLE_DIR, load_tables, store_tables
+from source import Token
 from util import ParserState
 
 
-EMPTY = EmptyNode()
+# binary operators from the loosest to the tightest binding, all left associative
+PRECEDENCE = [
+    ("left", ["LOR"]),
+    ("left", ["&&"]),
+    ("left", ["OR"]),
+    ("left", ["^"]),
+    ("left", ["&"]),
+    ("left", ["==", "!="]),
+    ("left", ["<", ">", "<=", ">="]),
+    ("left", ["<<", ">>"]),
+    ("left", ["+", "-"]),
+    ("left", ["*", "/", "%"]),
+]
+
+# loops that run the tables, chosen by Parser(driver=...): compiled runs the flat tables,
+# generic is rply's own loop and pratt parses expressions by hand (see pratt.py)
+DRIVERS = ["compiled", "generic", "pratt"]
+
+# one parser per worker process, built by the pool initializer of batch and parallel
+parser = None
 
 
 class Parser:
-    def __init__(self, tokens: list, precedence: list) -> None:
-        self.pg = ParserGenerator(tokens, precedence)
-        self.parser = self.generateParser()
+    def __init__(self, tokens: list, precedence: list = PRECEDENCE, cache_dir: str = TABLE_DIR, driver: str = "compiled") -> None:
+        if driver not in DRIVERS:
+            raise ValueError(f"unknown driver {driver!r}, expected one of {', '.join(DRIVERS)}")
+
+        self.driverName = driver
+
+        self.pg = Rules(tokens, precedence)
+        self.generateParser()
+
+        # the compiled driver starts from the generated tables module while it matches the
+        # grammar, which keeps rply's parser generator out of the import; the others need
+        # rply's tables, and a stale module is regenerated from them
+        tables = load_tables(self.pg, cache_dir) if driver == "compiled" else None
+
+        if tables is not None:
+            self.parser = None
+            self.grammar = self.pg
+            self.driver = CompiledLRParser.prebuilt(tables, self.pg, self.pg.error_handler)
+
+            return
+
+        self.parser = self.pg.generator(cache_dir).build()
+        self.grammar = self.parser.lr_table.grammar
+
+        if driver == "generic":
+            self.driver = self.parser
+
+        elif driver == "pratt":
+            from pratt import PrattLRParser
+
+            self.driver = PrattLRParser(self.parser.lr_table, self.parser.error_handler)
+
+        else:
+            self.driver = CompiledLRParser(self.parser.lr_table, self.parser.error_handler)
+
+            store_tables(self.pg, self.driver, cache_dir)
 
     def generateParser(self):
         # ------------------------------------------------
@@ -134,7 +187,7 @@ class Parser:
         @self.pg.production('type-qualifier : VOLATILE')
         @self.pg.production('type-qualifier : RESTRICT')
         def type_qualifier(state: ParserState, p):
-            return p[0]
+            return ValueNode(None, p[0].getstr(), p[0].getsourcepos())
 
         @self.pg.production('struct-declarator-list : struct-declarator')
         def struct_declarator_list(state: ParserState, p):
@@ -248,130 +301,42 @@ class Parser:
         # ------------------------------------------------
         # conditional-expression
         # ------------------------------------------------
-        @self.pg.production('cond-expr : lor-expr')
+        @self.pg.production('cond-expr : binary-expr')
         def cond_expr(state: ParserState, p):
             return p[0]
 
-        @self.pg.production('cond-expr : lor-expr ? expr DDOT cond-expr')
+        @self.pg.production('cond-expr : binary-expr ? expr DDOT cond-expr')
         def cond_expr_op(state: ParserState, p):
             return ConditionalNode(p[0], p[2], p[4], p[0].getsourcepos())
 
         # ------------------------------------------------
-        # logical-or-expression
-        # ------------------------------------------------
-        @self.pg.production('lor-expr : land-expr')
-        def lor_expr(state: ParserState, p):
-            return p[0]
-
-        @self.pg.production('lor-expr : lor-expr LOR land-expr')
-        def lor_expr_op(state: ParserState, p):
-            return BinaryOpNode(p[1].getstr(), p[0], p[2], p[0].getsourcepos())
-
-        # ------------------------------------------------
-        # logical-and-expression
-        # ------------------------------------------------
-        @self.pg.production('land-expr : or-expr')
-        def land_expr(state: ParserState, p):
-            return p[0]
-
-        @self.pg.production('land-expr : land-expr && or-expr')
-        def land_expr_op(state: ParserState, p):
-            return BinaryOpNode(p[1].getstr(), p[0], p[2], p[0].getsourcepos())
-
-        # ------------------------------------------------
-        # bitwise-or-expression
-        # ------------------------------------------------
-        @self.pg.production('or-expr : xor-expr')
-        def or_expr(state: ParserState, p):
-            return p[0]
-
-        @self.pg.production('or-expr : or-expr OR xor-expr')
-        def or_expr_op(state: ParserState, p):
-            return BinaryOpNode(p[1].getstr(), p[0], p[2], p[0].getsourcepos())
-
-        # ------------------------------------------------
-        # bitwise-xor-expression
-        # ------------------------------------------------
-        @self.pg.production('xor-expr : and-expr')
-        def xor_expr(state: ParserState, p):
-            return p[0]
-
-        @self.pg.production('xor-expr : xor-expr ^ and-expr')
-        def xor_expr_op(state: ParserState, p):
-            return BinaryOpNode(p[1].getstr(), p[0], p[2], p[0].getsourcepos())
-
-        # ------------------------------------------------
-        # bitwise-and-expression
-        # ------------------------------------------------
-        @self.pg.production('and-expr : eq-expr')
-        def and_expr(state: ParserState, p):
-            return p[0]
-
-        @self.pg.production('and-expr : and-expr & eq-expr')
-        def and_expr_op(state: ParserState, p):
-            return BinaryOpNode(p[1].getstr(), p[0], p[2], p[0].getsourcepos())
-
-        # ------------------------------------------------
-        # equality-expression
-        # ------------------------------------------------
-        @self.pg.production('eq-expr : rel-expr')
-        def eq_expr(state: ParserState, p):
-            return p[0]
-
-        @self.pg.production('eq-expr : eq-expr == rel-expr')
-        @self.pg.production('eq-expr : eq-expr != rel-expr')
-        def eq_expr_op(state: ParserState, p):
-            return BinaryOpNode(p[1].getstr(), p[0], p[2], p[0].getsourcepos())
-
-        # ------------------------------------------------
-        # relation-expression
-        # ------------------------------------------------
-        @self.pg.production('rel-expr : shift-expr')
-        def rel_expr(state: ParserState, p):
-            return p[0]
-
-        @self.pg.production('rel-expr : rel-expr < shift-expr')
-        @self.pg.production('rel-expr : rel-expr > shift-expr')
-        @self.pg.production('rel-expr : rel-expr <= shift-expr')
-        @self.pg.production('rel-expr : rel-expr >= shift-expr')
-        def rel_expr_(state: ParserState, p):
-            return BinaryOpNode(p[1].getstr(), p[0], p[2], p[0].getsourcepos())
-
-        # ------------------------------------------------
-        # shift-expression
-        # ------------------------------------------------
-        @self.pg.production('shift-expr : add-expr')
-        def shift_expr(state: ParserState, p):
-            return p[0]
-
-        @self.pg.production('shift-expr : shift-expr << add-expr')
-        @self.pg.production('shift-expr : shift-expr >> add-expr')
-        def shift_expr_op(state: ParserState, p):
-            return BinaryOpNode(p[1].getstr(), p[0], p[2], p[0].getsourcepos())
-
-        # ------------------------------------------------
-        # addiditve-expression
-        # ------------------------------------------------
-        @self.pg.production('add-expr : mult-expr')
-        def add_expr(state: ParserState, p):
-            return p[0]
-
-        @self.pg.production('add-expr : add-expr + mult-expr')
-        @self.pg.production('add-expr : add-expr - mult-expr')
-        def add_expr_op(state: ParserState, p):
-            return BinaryOpNode(p[1].getstr(), p[0], p[2], p[0].getsourcepos())
-
-        # ------------------------------------------------
-        # multiplicative-expression
-        # ------------------------------------------------
-        @self.pg.production('mult-expr : cast-expr')
-        def mult_expr(state: ParserState, p):
-            return p[0]
-
-        @self.pg.production('mult-expr : mult-expr * cast-expr')
-        @self.pg.production('mult-expr : mult-expr / cast-expr')
-        @self.pg.production('mult-expr : mult-expr % cast-expr')
-        def mult_expr_op(state: ParserState, p):
+        # binary-expression
+        # ------------------------------------------------
+        # logical-or down to multiplicative expressions in one nonterminal, PRECEDENCE
+        # resolves the levels, so an operand takes one reduction instead of ten
+        @self.pg.production('binary-expr : cast-expr')
+        def binary_expr(state: ParserState, p):
+            return p[0]
+
+        @self.pg.production('binary-expr : binary-expr LOR binary-expr')
+        @self.pg.production('binary-expr : binary-expr && binary-expr')
+        @self.pg.production('binary-expr : binary-expr OR binary-expr')
+        @self.pg.production('binary-expr : binary-expr ^ binary-expr')
+        @self.pg.production('binary-expr : binary-expr & binary-expr')
+        @self.pg.production('binary-expr : binary-expr == binary-expr')
+        @self.pg.production('binary-expr : binary-expr != binary-expr')
+        @self.pg.production('binary-expr : binary-expr < binary-expr')
+        @self.pg.production('binary-expr : binary-expr > binary-expr')
+        @self.pg.production('binary-expr : binary-expr <= binary-expr')
+        @self.pg.production('binary-expr : binary-expr >= binary-expr')
+        @self.pg.production('binary-expr : binary-expr << binary-expr')
+        @self.pg.production('binary-expr : binary-expr >> binary-expr')
+        @self.pg.production('binary-expr : binary-expr + binary-expr')
+        @self.pg.production('binary-expr : binary-expr - binary-expr')
+        @self.pg.production('binary-expr : binary-expr * binary-expr')
+        @self.pg.production('binary-expr : binary-expr / binary-expr')
+        @self.pg.production('binary-expr : binary-expr % binary-expr')
+        def binary_expr_op(state: ParserState, p):
             return BinaryOpNode(p[1].getstr(), p[0], p[2], p[0].getsourcepos())
 
         # ------------------------------------------------
@@ -383,7 +348,7 @@ class Parser:
 
         @self.pg.production('cast-expr : ( type-name ) cast-expr')
         def cast_expr_type(state: ParserState, p):
-            return CastNode(p[1], p[3], p[0].getstr())
+            return CastNode(p[1], p[3], p[0].getsourcepos())
 
         # ------------------------------------------------
         # unary-expression
@@ -446,7 +411,7 @@ class Parser:
         @self.pg.production('postfix-expr : postfix-expr ++')
         @self.pg.production('postfix-expr : postfix-expr --')
         def postfix_expr(state: ParserState, p):
-            return CombinationNode(p[0], ValueNode(None, p[1].getstr(), p[1].getsourcepos()), p[0].getsourcepos())
+            return CombinationNode(p[0], leaf(p[1]), p[0].getsourcepos())
 
         @self.pg.production('postfix-expr : ( type-name ) { initalizer-list }')
         @self.pg.production('postfix-expr : ( type-name ) { initalizer-list , }')
@@ -547,11 +512,11 @@ class Parser:
 
         @self.pg.production('direct-abstract-declarator : [ * ]')
         def direct_abstract_declarator(state: ParserState, p):
-            return BracketNode(ValueNode(None, "*", p[1].getsourcepos()), "[]", p[0].getsourcepos())
+            return BracketNode(leaf(p[1]), "[]", p[0].getsourcepos())
 
         @self.pg.production('direct-abstract-declarator : direct-abstract-declarator [ * ]')
         def direct_abstract_declarator(state: ParserState, p):
-            bracket = BracketNode(ValueNode(None, "*", p[2].getsourcepos()), "[]", p[1].getsourcepos())
+            bracket = BracketNode(leaf(p[2]), "[]", p[1].getsourcepos())
             return CombinationNode(p[0], bracket, p[0].getsourcepos())
 
         @self.pg.production('direct-abstract-declarator : ( )')
@@ -853,7 +818,9 @@ class Parser:
                     position,
                     state.filename,
                     state.source,
-                    f"Unexpected Token: {token.name}, \n {state.traceback}"
+                    f"Unexpected Token: {token.name}, \n {state.traceback}",
+                    state.lines,
+                    state.diagnostics
                 )
 
             elif token.gettokentype() == '$end':
@@ -861,7 +828,9 @@ class Parser:
                     position,
                     state.filename,
                     state.source,
-                    f"Unexpected End, \n {state.traceback}"
+                    f"Unexpected End, \n {state.traceback}",
+                    state.lines,
+                    state.diagnostics
                 )
 
             else:
@@ -875,7 +844,11 @@ class Parser:
                 #     f"Unexpected Token: {token.name}"
                 # )
 
-        return self.pg.build()
-
     def parse(self, tokens: Generator[Token, None, None], state: ParserState = None):
-        return self.parser.parse(tokens, state)
+        return self.driver.parse(tokens, state)
+
+
+def init_worker(driver: str = "compiled") -> None:
+    global parser
+
+    parser = Parser(TOKENTYPES, driver=driver)
@@ -1,28 +1,101 @@
 from __future__ import annotations
-from rply.token import BaseBox, SourcePosition
+from typing import Generator, Iterable, TextIO
 
+import io
+import sys
+
+from source import SourcePosition, Token
+
+
+# node positions are packed into one int: line in the high bits, column in the low 24 bits;
+# a column that does not fit, as on a long generated line, keeps its SourcePosition instead
+COLUMN_BITS = 24
+
+
+def pack_position(position: SourcePosition) -> int | SourcePosition:
+    if not 0 <= position.colno < 1 << COLUMN_BITS:
+        return position
+
+    return position.lineno << COLUMN_BITS | position.colno
+
+
+def unpack_position(packed: int | SourcePosition) -> SourcePosition:
+    if not isinstance(packed, int):
+        return packed
+
+    return SourcePosition(0, packed >> COLUMN_BITS, packed & (1 << COLUMN_BITS) - 1)
+
+
+# nodes use __slots__ throughout, every class lists only the attributes it adds
+class Node:
+    __slots__ = ("value", "_position")
 
-class Node(BaseBox):
     def __init__(self, value: Node | str, position: SourcePosition) -> None:
         self.value = value
         self.position = position
 
+    @property
+    def position(self) -> SourcePosition:
+        return unpack_position(self._position)
+
+    @position.setter
+    def position(self, position: SourcePosition) -> None:
+        self._position = pack_position(position)
+
     def getsourcepos(self) -> SourcePosition:
         return self.position
 
+    # code generation: every node lists its output as strings and child nodes,
+    # emit writes them in order into one shared output
+    def fragments(self) -> Iterable[Node | str]:
+        return ()
+
+    def emit(self, out: TextIO) -> None:
+        write = out.write
+
+        for fragment in walk(self):
+            if isinstance(fragment, str):
+                write(fragment)
+
     def clang(self) -> str:
-        pass
+        out = io.StringIO()
+        self.emit(out)
+
+        return out.getvalue()
+
+
+def walk(root: Node) -> Generator[Node | str, None, None]:
+    # depth first over the fragments of root with an explicit stack instead of recursion,
+    # every node is yielded right before its own fragments, so strings come out in code order
+    yield root
+
+    stack = [iter(root.fragments())]
+
+    while stack:
+        for fragment in stack[-1]:
+            yield fragment
+
+            if not isinstance(fragment, str):
+                stack.append(iter(fragment.fragments()))
+                break
+
+        else:
+            stack.pop()
 
 
 class EmptyNode(Node):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
-    def clang(self) -> str:
-        return ""
+    def fragments(self) -> Iterable[Node | str]:
+        return ()
 
 
 class BlockNode(Node):
+    __slots__ = ("statements",)
+
     def __init__(self, value: Node, position: SourcePosition) -> None:
         self.statements = [value]
         self.position = position
@@ -30,11 +103,17 @@ class BlockNode(Node):
     def add(self, value: Node):
         self.statements.append(value)
 
-    def clang(self) -> str:
-        return "\n".join(statement.clang() for statement in self.statements)
+    def fragments(self) -> Iterable[Node | str]:
+        for i, statement in enumerate(self.statements):
+            if i:
+                yield "\n"
+
+            yield statement
 
 
 class ListNode(Node):
+    __slots__ = ("separator", "_list")
+
     def __init__(self, value: Node | str, separator: str, position: SourcePosition) -> None:
         self.separator = separator
         self._list = [value]
@@ -43,34 +122,44 @@ class ListNode(Node):
     def add(self, value: Node | str):
         self._list.append(value)
 
-    def clang(self) -> str:
-        return self.separator.join(element.clang() for element in self._list)
+    def fragments(self) -> Iterable[Node | str]:
+        for i, element in enumerate(self._list):
+            if i:
+                yield self.separator
+
+            yield element
 
 
 class BracketNode(Node):
+    __slots__ = ("brackets",)
+
     def __init__(self, value: Node, brackets: str, position: SourcePosition) -> None:
         self.brackets = brackets
         super().__init__(value, position)
 
-    def clang(self) -> str:
-        return self.brackets[0] + self.value.clang() + self.brackets[1]
+    def fragments(self) -> Iterable[Node | str]:
+        return self.brackets[0], self.value, self.brackets[1]
 
 
 class CurlyNode(BracketNode):
+    __slots__ = ()
+
     def __init__(self, value: Node, position: SourcePosition) -> None:
         super().__init__(value, "{}", position)
 
 
 class CombinationNode(Node):
+    __slots__ = ("value_2",)
+
     def __init__(self, value: Node, value_2: Node, position: SourcePosition) -> None:
         self.value_2 = value_2
         super().__init__(value, position)
 
-    def clang(self) -> str:
+    def fragments(self) -> Iterable[Node | str]:
         if isinstance(self.value_2, EmptyNode):
-            return self.value.clang()
+            return self.value,
 
-        return f"{self.value.clang()} {self.value_2.clang()}"
+        return self.value, " ", self.value_2
 
 
 # --------------------------------------------------------------------------------------------------
@@ -79,37 +168,47 @@ class CombinationNode(Node):
 
 
 class FunctionNode(Node):
+    __slots__ = ("_type", "signature", "body")
+
     def __init__(self, _type: Node, signature: Node, body: Node, position: SourcePosition) -> None:
         self._type = _type
         self.signature = signature
         self.body = body
         self.position = position
 
-    def clang(self) -> str:
-        return f"{self._type.clang()} {self.signature.clang()} {self.body.clang()}"
+    def fragments(self) -> Iterable[Node | str]:
+        return self._type, " ", self.signature, " ", self.body
 
 
 class ExpressionNode(Node):
-    def clang(self) -> str:
-        return f"{self.value.clang()} ;"
+    __slots__ = ()
+
+    def fragments(self) -> Iterable[Node | str]:
+        return self.value, " ;"
 
 
 class WhileNode(Node):
+    __slots__ = ("condition", "body")
+
     def __init__(self, condition: Node, body: Node, position: SourcePosition) -> None:
         self.condition = condition
         self.body = body
         self.position = position
 
-    def clang(self) -> str:
-        return f"while ( {self.condition.clang()} ) {self.body.clang()}"
+    def fragments(self) -> Iterable[Node | str]:
+        return "while ( ", self.condition, " ) ", self.body
 
 
 class DoWhileNode(WhileNode):
-    def clang(self) -> str:
-        return f"do {self.body.clang()} while ( {self.condition.clang()} ) ;"
+    __slots__ = ()
+
+    def fragments(self) -> Iterable[Node | str]:
+        return "do ", self.body, " while ( ", self.condition, " ) ;"
 
 
 class ForNode(Node):
+    __slots__ = ("declaration", "condition", "increment", "body")
+
     def __init__(self, declaration: Node, condition: Node, increment: Node, body: Node, position: SourcePosition) -> None:
         self.declaration = declaration
         self.condition = condition
@@ -117,158 +216,186 @@ class ForNode(Node):
         self.body = body
         self.position = position
 
-    def clang(self) -> str:
-        return f"for ( {self.declaration.clang()} {self.condition.clang()} ; {self.increment.clang()} ) {self.body.clang()}"
+    def fragments(self) -> Iterable[Node | str]:
+        return "for ( ", self.declaration, " ", self.condition, " ; ", self.increment, " ) ", self.body
 
 
 class IfElseNode(Node):
+    __slots__ = ("condition", "body", "else_body")
+
     def __init__(self, condition: Node, body: Node, else_body, position: SourcePosition) -> None:
         self.condition = condition
         self.body = body
         self.else_body = else_body
         self.position = position
 
-    def clang(self) -> str:
-        return f"if ( {self.condition.clang()} ) {self.body.clang()} else {self.else_body.clang()}"
+    def fragments(self) -> Iterable[Node | str]:
+        return "if ( ", self.condition, " ) ", self.body, " else ", self.else_body
 
 
 class IfNode(Node):
+    __slots__ = ("condition", "body")
+
     def __init__(self, condition: Node, body: Node, position: SourcePosition) -> None:
         self.condition = condition
         self.body = body
         self.position = position
 
-    def clang(self) -> str:
-        return f"if ( {self.condition.clang()} ) {self.body.clang()}"
+    def fragments(self) -> Iterable[Node | str]:
+        return "if ( ", self.condition, " ) ", self.body
 
 
 class SwitchNode(Node):
+    __slots__ = ("condition",)
+
     def __init__(self, condition: Node, value: Node, position: SourcePosition) -> None:
         self.condition = condition
         super().__init__(value, position)
 
-    def clang(self) -> str:
-        return f"switch ( {self.condition.clang()} ) {self.value.clang()}"
+    def fragments(self) -> Iterable[Node | str]:
+        return "switch ( ", self.condition, " ) ", self.value
 
 
 class CaseNode(Node):
+    __slots__ = ("case",)
+
     def __init__(self, case: Node, value: Node, position: SourcePosition) -> None:
         self.case = case
         super().__init__(value, position)
 
-    def clang(self) -> str:
-        return f"case {self.case.clang()} : {self.value.clang()}"
+    def fragments(self) -> Iterable[Node | str]:
+        return "case ", self.case, " : ", self.value
 
 
 class CaseDefaultNode(Node):
-    def clang(self) -> str:
-        return f"default : {self.value.clang()}"
+    __slots__ = ()
+
+    def fragments(self) -> Iterable[Node | str]:
+        return "default : ", self.value
 
 
 class JumpNode(Node):
+    __slots__ = ("_type",)
+
     def __init__(self, _type: str,  value: Node, position: SourcePosition) -> None:
         self._type = _type
         super().__init__(value, position)
 
-    def clang(self) -> str:
+    def fragments(self) -> Iterable[Node | str]:
         if self._type in ["continue", "break"]:
-            return self._type
+            return self._type,
 
-        return f"return {self.value.clang()} ;"
+        return "return ", self.value, " ;"
 
 
 # -----------------------------
 
 class PointerNode(Node):
+    __slots__ = ()
+
     def __init__(self, value: Node | str, position: SourcePosition) -> None:
         super().__init__(value, position)
 
-    def clang(self) -> str:
-        return f"*{self.value.clang()}"
+    def fragments(self) -> Iterable[Node | str]:
+        return "*", self.value
 
 # -----------------------------
 
 
 class StructOrUnionNode(Node):
+    __slots__ = ("s_o_u", "ident", "decl")
+
     def __init__(self, s_o_u: Node, ident: Node, decl: Node, position: SourcePosition) -> None:
         self.s_o_u = s_o_u
         self.ident = ident
         self.decl = decl
         self.position = position
 
-    def clang(self) -> str:
-        return f"{self.s_o_u.clang()} {self.ident.clang()} {{ {self.decl.clang()} }}"
+    def fragments(self) -> Iterable[Node | str]:
+        return self.s_o_u, " ", self.ident, " { ", self.decl, " }"
 
 
 class StructDeclarationNode(Node):
+    __slots__ = ("specifier", "declarator")
+
     def __init__(self, specifier: Node, declarator: Node, position: SourcePosition) -> None:
         self.specifier = specifier
         self.declarator = declarator
         self.position = position
 
-    def clang(self) -> str:
-        return f"{self.specifier.clang()} {self.declarator.clang()} ;"
+    def fragments(self) -> Iterable[Node | str]:
+        return self.specifier, " ", self.declarator, " ;"
 
 # -----------------------------
 
 
 class DesignationNode(Node):
+    __slots__ = ()
+
     def __init__(self, value: Node, position: SourcePosition) -> None:
         super().__init__(value, position)
 
-    def clang(self) -> str:
-        return f"{self.value.clang()} = "
+    def fragments(self) -> Iterable[Node | str]:
+        return self.value, " = "
 
 
 class DesignatorNode(Node):
+    __slots__ = ("_type",)
+
     def __init__(self, value: Node | str, _type: int, position: SourcePosition) -> None:
         self._type = _type
         super().__init__(value, position)
 
-    def clang(self) -> str:
+    def fragments(self) -> Iterable[Node | str]:
         if self._type:
-            return f".{self.value}"
+            return f".{self.value}",
 
-        return f"[{self.value.clang()}]"
+        return "[", self.value, "]"
 
 # -----------------------------
 
 
 class EnumSpecifierNode(Node):
+    __slots__ = ("qualifier", "enum_list")
+
     def __init__(self, qualifier: Node, enum_list: Node, position: SourcePosition) -> None:
         self.qualifier = qualifier
         self.enum_list = enum_list
         self.position = position
 
-    def clang(self) -> str:
+    def fragments(self) -> Iterable[Node | str]:
         if isinstance(self.enum_list, EmptyNode):
-            return self.qualifier.clang()
+            return self.qualifier,
 
-        return f"{self.qualifier.clang()} {self.enum_list.clang()}"
+        return self.qualifier, " ", self.enum_list
 
 
 class EnumQualifierNode(Node):
+    __slots__ = ()
+
     def __init__(self, value: str | EmptyNode, position: SourcePosition) -> None:
         super().__init__(value, position)
 
-    def clang(self) -> str:
+    def fragments(self) -> Iterable[Node | str]:
         if isinstance(self.value, EmptyNode):
-            return "enum"
+            return "enum",
 
-        return f"enum {self.value}"
+        return f"enum {self.value}",
 
 
 class EnumeratorNode(Node):
+    __slots__ = ("enum_const", "const_expr")
+
     def __init__(self, enum_const: Node, const_expr: Node, position: SourcePosition) -> None:
         self.enum_const = enum_const
         self.const_expr = const_expr
         self.position = position
 
-    def clang(self) -> str:
+    def fragments(self) -> Iterable[Node | str]:
         if isinstance(self.const_expr, EmptyNode):
-            return self.enum_const.clang()
+            return self.enum_const,
 
-        return f"{self.enum_const.clang()} = {self.const_expr.clang()}"
+        return self.enum_const, " = ", self.const_expr
 
 # -----------------------------
 
@@ -276,153 +403,202 @@ class EnumeratorNode(Node):
 
 
 class DirectDeclaratorNode(Node):
+    __slots__ = ("decl",)
+
     def __init__(self, decl: Node, value: Node, position: SourcePosition) -> None:
         self.decl = decl
         super().__init__(value, position)
 
-    def clang(self) -> str:
-        return f"{self.decl.clang()} {self.value.clang()}"
+    def fragments(self) -> Iterable[Node | str]:
+        return self.decl, " ", self.value
 
 
 class DeclaratorNode(Node):
+    __slots__ = ("ptr",)
+
     def __init__(self, ptr: Node, value: Node | str, position: SourcePosition) -> None:
         self.ptr = ptr
         super().__init__(value, position)
 
-    def clang(self) -> str:
+    def fragments(self) -> Iterable[Node | str]:
         if isinstance(self.ptr, EmptyNode):
-            return self.value.clang()
+            return self.value,
 
-        return f"{self.ptr.clang()} {self.value.clang()}"
+        return self.ptr, " ", self.value
 
 
 class DeclarationNode(Node):
+    __slots__ = ("specifiers", "declaration_list")
+
     def __init__(self, specifiers: Node, declaration_list: Node, position: SourcePosition) -> None:
         self.specifiers = specifiers
         self.declaration_list = declaration_list
         self.position = position
 
-    def clang(self) -> str:
-        return f"{self.specifiers.clang()} {self.declaration_list.clang()} ;"
+    def fragments(self) -> Iterable[Node | str]:
+        return self.specifiers, " ", self.declaration_list, " ;"
 
 
 class DeclaratorInitNode(Node):
+    __slots__ = ("declarator", "initalizer")
+
     def __init__(self, declarator: Node, initalizer: Node, position: SourcePosition) -> None:
         self.declarator = declarator
         self.initalizer = initalizer
         self.position = position
 
-    def clang(self) -> str:
+    def fragments(self) -> Iterable[Node | str]:
         if isinstance(self.initalizer, EmptyNode):
-            return self.declarator.clang()
+            return self.declarator,
 
-        return f"{self.declarator.clang()} = {self.initalizer.clang()}"
+        return self.declarator, " = ", self.initalizer
 
 # -----------------------------
 
 
 class ConditionalNode(Node):
+    __slots__ = ("expr_1", "expr_2", "expr_3")
+
     def __init__(self, expr_1: Node, expr_2: Node, expr_3: Node, position: SourcePosition) -> None:
         self.expr_1 = expr_1
         self.expr_2 = expr_2
         self.expr_3 = expr_3
         self.position = position
 
-    def clang(self) -> str:
-        return f"{self.expr_1} ? {self.expr_2} : {self.expr_3}"
+    def fragments(self) -> Iterable[Node | str]:
+        return self.expr_1, " ? ", self.expr_2, " : ", self.expr_3
 
 
 class BinaryOpNode(Node):
+    __slots__ = ("operand", "left", "right")
+
     def __init__(self, operand: str, left: Node, right: Node, position: SourcePosition) -> None:
         self.operand = operand
         self.left = left
         self.right = right
         self.position = position
 
-    def clang(self) -> str:
-        return f"{self.left.clang()} {self.operand} {self.right.clang()}"
+    def fragments(self) -> Iterable[Node | str]:
+        return self.left, f" {self.operand} ", self.right
 
 
 class CastNode(Node):
+    __slots__ = ("_type",)
+
     def __init__(self, _type: Node, value: Node, position: SourcePosition) -> None:
         self._type = _type
         super().__init__(value, position)
 
-    def clang(self) -> str:
-        return f"({self._type.clang()}){self.value.clang()}"
+    def fragments(self) -> Iterable[Node | str]:
+        return "(", self._type, ")", self.value
 
 
 class UnaryOpNode(Node):
+    __slots__ = ("operand",)
+
     def __init__(self, operand: str, value: Node, position: SourcePosition) -> None:
         self.operand = operand
         super().__init__(value, position)
 
-    def clang(self) -> str:
-        return f"{self.operand}{self.value.clang()}"
+    def fragments(self) -> Iterable[Node | str]:
+        return self.operand, self.value
 
 
 class ArrayAccessNode(Node):
+    __slots__ = ("postfix",)
+
     def __init__(self, postfix: Node, value: Node, position: SourcePosition) -> None:
         self.postfix = postfix
         super().__init__(value, position)
 
-    def clang(self) -> str:
-        return f"{self.postfix.clang()} [ {self.value.clang()} ]"
+    def fragments(self) -> Iterable[Node | str]:
+        return self.postfix, " [ ", self.value, " ]"
 
 
 class FunctionCallNode(Node):
+    __slots__ = ("name", "parameters")
+
     def __init__(self, name: Node, parameters: Node, position: SourcePosition) -> None:
         self.name = name
         self.parameters = parameters
         self.position = position
 
-    def clang(self) -> str:
-        return f"{self.name.clang()} ( {self.parameters.clang()} )"
+    def fragments(self) -> Iterable[Node | str]:
+        return self.name, " ( ", self.parameters, " )"
 
 
 class AttributeNode(Node):
+    __slots__ = ("name", "attribute")
+
     def __init__(self, name: Node, attribute: str, position: SourcePosition) -> None:
         self.name = name
         self.attribute = attribute
         self.position = position
 
-    def clang(self) -> str:
-        return f"{self.name.clang()}.{self.attribute}"
+    def fragments(self) -> Iterable[Node | str]:
+        return self.name, f".{self.attribute}"
 
 
 class AttributeArrowNode(AttributeNode):
-    def clang(self) -> str:
-        return f"{self.name.clang()} -> {self.attribute}"
+    __slots__ = ()
+
+    def fragments(self) -> Iterable[Node | str]:
+        return self.name, f" -> {self.attribute}"
 
 
 class ArrayNode(Node):
+    __slots__ = ("_type",)
+
     def __init__(self, _type: Node, value: Node, position: SourcePosition) -> None:
         self._type = _type
         super().__init__(value, position)
 
-    def clang(self) -> str:
-        return f"({self._type.clang()}) {{ {self.value.clang()} }}"
+    def fragments(self) -> Iterable[Node | str]:
+        return "(", self._type, ") { ", self.value, " }"
 
 
 class SizeOfNode(Node):
+    __slots__ = ()
+
     def __init__(self, value: Node | str, position: SourcePosition) -> None:
         super().__init__(value, position)
 
-    def clang(self) -> str:
-        return f"sizeof({self.value.clang()})"
+    def fragments(self) -> Iterable[Node | str]:
+        return "sizeof(", self.value, ")"
 
 
 class TypeNode(Node):
+    __slots__ = ()
+
     def __init__(self, value: str, position: SourcePosition) -> None:
         super().__init__(value, position)
 
-    def clang(self) -> str:
-        return self.value
+    def fragments(self) -> Iterable[Node | str]:
+        return self.value,
 
 
 class ValueNode(Node):
+    __slots__ = ()
+
     def __init__(self, _type: None, value: str, position: SourcePosition) -> None:
         super().__init__(value, position)
 
-    def clang(self) -> str:
-        return self.value
+    def fragments(self) -> Iterable[Node | str]:
+        return self.value,
+
+
+EMPTY = EmptyNode()
+
+# operator lexemes become shared, immutable leaves; like EMPTY they carry no position of
+# their own, so they only go where the parent takes its position from another child
+LEAVES = {}
+
+
+def leaf(token: Token) -> ValueNode:
+    node = LEAVES.get(token.getstr())
+
+    if node is None:
+        value = sys.intern(token.getstr())
+        node = LEAVES[value] = ValueNode(None, value, SourcePosition(0, 0, 0))
+
+    return node
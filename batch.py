@@ -0,0 +1,92 @@
+import contextlib
+import glob
+import io
+import os
+from functools import partial
+from typing import Generator
+
+import _parser
+from buildcache import BuildCache, compile_incremental
+from errors import Diagnostics
+
+
+class BatchResult:
+    def __init__(self, inFile: str, outFile: str, ok: bool, log: str, cached: bool = False) -> None:
+        self.inFile = inFile
+        self.outFile = outFile
+        self.ok = ok
+        self.log = log
+        self.cached = cached
+
+
+def expand_inputs(patterns: list) -> list:
+    inputs = []
+
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            inputs.extend(sorted(glob.glob(os.path.join(pattern, "*.c"))))
+
+        else:
+            inputs.extend(sorted(glob.glob(pattern)) or [pattern])
+
+    return inputs
+
+
+def output_paths(inputs: list, outDir: str) -> list:
+    # inputs keep their path below the deepest directory they share, so a/x.c and b/x.c
+    # end up in outDir/a/x.c and outDir/b/x.c instead of overwriting each other
+    paths = [os.path.abspath(inFile) for inFile in inputs]
+    root = os.path.commonpath([os.path.dirname(path) for path in paths]) if paths else ""
+
+    return [os.path.join(outDir, os.path.relpath(path, root)) for path in paths]
+
+
+def compile_one(inFile: str, outFile: str, engine: str, cacheDir: str = None, depfile: bool = False,
+                mapped: bool = False, maxErrors: int = 20, diagnosticsFormat: str = "text") -> BatchResult:
+    cache = BuildCache(cacheDir) if cacheDir is not None else None
+    diagnostics = Diagnostics(maxErrors, diagnosticsFormat)
+
+    log = io.StringIO()
+    ok = True
+    cached = False
+
+    with contextlib.redirect_stdout(log):
+        try:
+            depfilePath = outFile + ".d" if depfile else None
+            cached = not compile_incremental(inFile, outFile, engine, _parser.parser, cache, depfilePath, mapped, diagnostics)
+
+        # errors.Error prints its diagnostic and exits
+        except SystemExit:
+            ok = False
+
+        except Exception as e:
+            print(f"{e.__class__.__name__}: {e}")
+            ok = False
+
+    return BatchResult(inFile, outFile, ok, log.getvalue(), cached)
+
+
+def compile_batch(inputs: list, outDir: str, jobs: int = None, engine: str = "regex",
+                  cacheDir: str = None, depfiles: bool = False, mapped: bool = False, maxErrors: int = 20,
+                  diagnosticsFormat: str = "text", driver: str = "compiled") -> Generator[BatchResult, None, None]:
+    outputs = output_paths(inputs, outDir)
+
+    for directory in sorted({os.path.dirname(outFile) for outFile in outputs} | {outDir}):
+        os.makedirs(directory, exist_ok=True)
+
+    # everything but the file names is the same for each compile
+    job = partial(compile_one, engine=engine, cacheDir=cacheDir, depfile=depfiles, mapped=mapped,
+                  maxErrors=maxErrors, diagnosticsFormat=diagnosticsFormat)
+
+    if jobs == 1:
+        _parser.init_worker(driver)
+
+        yield from map(job, inputs, outputs)
+
+        return
+
+    # the process pool takes longer to import than a small compile, so only when it is used
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_parser.init_worker, initargs=(driver,)) as executor:
+        yield from executor.map(job, inputs, outputs)
@@ -0,0 +1,176 @@
+# synthetic C sources within the grammar Prism supports, scaled by a size argument
+#   python benchmarks/corpus.py <corpus> [size]      prints the generated source
+
+import os
+import random
+import sys
+
+
+def functions(size: int) -> str:
+    # many small functions with the usual statements
+    out = []
+
+    for i in range(size):
+        out.append(
+            f"int f{i}(int a, int b) {{\n"
+            f"    int c = a * {i} + b - (a << 2) / 3;\n"
+            f"    if (c > b && a != 0) {{ c = c + b; }} else {{ c = -c; }}\n"
+            f"    while (c < 100) {{ c += a | b; }}\n"
+            f"    for (int i = 0; i < {i % 16 + 1}; i++) {{ c = c ^ i; }}\n"
+            f"    return f{i}(c, b) ? c : b;\n"
+            f"}}\n"
+        )
+
+    return "".join(out)
+
+
+def expression(depth: int, rng: random.Random) -> str:
+    if depth == 0:
+        return rng.choice(["a", "b", "c", str(rng.randrange(1000))])
+
+    operator = rng.choice(["+", "-", "*", "/", "%", "<<", ">>", "&", "|", "^", "&&", "||", "<", "==", "!="])
+
+    return f"({expression(depth - 1, rng)} {operator} {expression(depth - 1, rng)})"
+
+
+def expressions(size: int) -> str:
+    # deeply nested binary expressions, size statements of depth 8
+    rng = random.Random(size)
+    out = ["int deep(int a, int b, int c) {\n"]
+
+    for _ in range(size):
+        out.append(f"    a = {expression(8, rng)};\n")
+
+    out.append("    return a;\n}\n")
+
+    return "".join(out)
+
+
+def operand(depth: int, rng: random.Random) -> str:
+    if depth == 0:
+        return rng.choice(["a", "b", "p->x", "v[a]", "s.y", str(rng.randrange(1000))])
+
+    inner = operand(depth - 1, rng)
+    kind = rng.randrange(8)
+
+    if kind == 0:
+        return f"~{inner}"
+
+    if kind == 1:
+        return f"(long) {inner}"
+
+    if kind == 2:
+        return f"sizeof(int) * {inner}"
+
+    if kind == 3:
+        return f"g({inner}, {operand(depth - 1, rng)})"
+
+    if kind == 4:
+        return f"v[{inner} & 7]"
+
+    if kind == 5:
+        return f"{inner} > {operand(depth - 1, rng)} ? {inner} : b"
+
+    return f"({inner} {rng.choice(['+', '*', '<<', '|', '&&'])} {operand(depth - 1, rng)})"
+
+
+def operators(size: int) -> str:
+    # every kind of expression: unary, casts, sizeof, calls, subscripts, members,
+    # conditionals and compound assignments, size statements of depth 4
+    rng = random.Random(size)
+    out = [
+        "struct point { int x; int y; } s;\n"
+        "int g(int a, int b) { return a; }\n"
+        "int ops(int a, int b, int *v, struct point *p) {\n"
+    ]
+
+    for _ in range(size):
+        out.append(f"    a {rng.choice(['=', '+=', '|=', '<<='])} {operand(4, rng)};\n")
+
+    out.append("    return a;\n}\n")
+
+    return "".join(out)
+
+
+def initializers(size: int) -> str:
+    # struct declarations and long compound literal initializer lists
+    out = ["struct point { int x; int y; int z; } origin;\n"]
+
+    for i in range(size):
+        values = ", ".join(str(i * 64 + j) for j in range(64))
+        points = ", ".join(f"(struct point) {{ .x = {j}, .y = {i}, .z = {j * i} }}" for j in range(8))
+
+        out.append(
+            f"int init{i}() {{\n"
+            f"    int *values = (int[]) {{ {values} }};\n"
+            f"    struct point *points = (struct point[]) {{ {points} }};\n"
+            f"    return values[{i % 64}] + points[{i % 8}].x;\n"
+            f"}}\n"
+        )
+
+    return "".join(out)
+
+
+def typedefs(size: int) -> str:
+    # typedef names used as types, shadowed by objects and redeclared in blocks
+    out = []
+
+    for i in range(size):
+        out.append(
+            f"typedef unsigned long size{i};\n"
+            f"typedef struct node{i} {{ size{i} value; struct node{i} *next; }} node{i};\n"
+            f"size{i} count{i}(node{i} *list) {{\n"
+            f"    size{i} n = 0;\n"
+            f"    node{i} *it = list;\n"
+            f"    while (it) {{ n++; it = it->next; }}\n"
+            f"    {{ int size{i} = 2; n = n * size{i}; }}\n"
+            f"    return n;\n"
+            f"}}\n"
+        )
+
+    return "".join(out)
+
+
+def includes(size: int, directory: str) -> str:
+    # include fan-out for the preprocessor, size headers each including the next two;
+    # the include lines are not valid for the parser, so this corpus is preprocessed only
+    os.makedirs(directory, exist_ok=True)
+
+    for i in range(size):
+        lines = [f"include {os.path.join(directory, f'h{j}.h')}\n" for j in (2 * i + 1, 2 * i + 2) if j < size]
+        lines.append(f"int h{i}(int a) {{ return a + {i}; }}\n")
+
+        with open(os.path.join(directory, f"h{i}.h"), "w") as file:
+            file.write("".join(lines))
+
+    return f"include {os.path.join(directory, 'h0.h')}\n" + functions(size)
+
+
+# name -> (generator, default size, parses)
+CORPORA = {
+    "functions": (functions, 2000, True),
+    "expressions": (expressions, 200, True),
+    "operators": (operators, 1000, True),
+    "initializers": (initializers, 500, True),
+    "typedefs": (typedefs, 1000, True),
+    "includes": (includes, 500, False),
+}
+
+
+def generate(name: str, size: int = None, directory: str = None) -> str:
+    generator, default, _ = CORPORA[name]
+    size = default if size is None else size
+
+    if generator is includes:
+        return includes(size, directory)
+
+    return generator(size)
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    name = sys.argv[1]
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    print(generate(name, size, tempfile.mkdtemp(prefix="prism-includes-")), end="")
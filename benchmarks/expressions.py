@@ -0,0 +1,166 @@
+# the hand-written expression parser (driver "pratt") against the tables alone (driver "compiled"):
+# checks that both build the same trees and report the same errors, then times their parses
+#   python benchmarks/expressions.py [corpus ...] [--scale F] [--repeat N] [--mutations N] [--seed S]
+# exits 1 if the drivers disagree on any input
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _parser import Parser
+from astree import Node
+from corpus import CORPORA, generate
+from errors import Diagnostics, ErrorExit
+from lexer import tokenize, TOKENTYPES
+from util import ParserState
+
+
+DRIVERS = ("compiled", "pratt")
+
+# inserted by the mutations, mostly tokens that break or change expressions
+NOISE = [";", "}", "{", "(", ")", ",", "?", ":", "[", "]", "=", "+", "*", "-", "x", "1", "int", "sizeof", "(int)"]
+
+# nesting past pratt.MAX_DEPTH, which the expression parser has to leave to the tables
+DEEP = [
+    "int f(int a) {\n  a = " + "(" * depth + "a" + ")" * depth + ";\n  return a;\n}"
+    for depth in (140, 160, 200)
+] + [
+    "int f(int a) {\n  a = " + operator * 300 + "a;\n  return a;\n}"
+    for operator in ("- ", "b = ", "a ? b : ", "(int) ")
+]
+
+
+def shape(ast) -> list:
+    # node types, positions and emitted strings in tree order; unlike walk() this
+    # also takes the raw tokens some productions leave in the tree
+    out = []
+    stack = [ast]
+
+    while stack:
+        fragment = stack.pop()
+
+        if isinstance(fragment, Node):
+            position = fragment.position if hasattr(fragment, "_position") else None
+            out.append((type(fragment).__name__, position and (position.lineno, position.colno)))
+            stack.extend(reversed(list(fragment.fragments())))
+
+        else:
+            out.append(fragment if isinstance(fragment, str) else repr(fragment))
+
+    return out
+
+
+def outcome(parser: Parser, source: str):
+    # the tree of a parse, or the errors it reported
+    state = ParserState("input.c", source, Diagnostics(0))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            ast = parser.parse(tokenize(state, "regex"), state)
+            state.diagnostics.finish()
+
+        except ErrorExit as e:
+            return "errors", [error.asdict() for error in e.errors]
+
+    return "tree", shape(ast)
+
+
+def mutate(source: str, rng: random.Random) -> str:
+    words = source.split(" ")
+
+    for _ in range(rng.randint(1, 4)):
+        i = rng.randrange(len(words))
+        op = rng.random()
+
+        if op < 0.4:
+            del words[i]
+
+        elif op < 0.8:
+            words.insert(i, rng.choice(NOISE))
+
+        else:
+            words[i] = rng.choice(words)
+
+    return " ".join(words)
+
+
+def differ(parsers: dict, sources: list) -> int:
+    # number of sources on which the drivers disagree
+    mismatches = 0
+
+    for source in sources:
+        outcomes = [outcome(parser, source) for parser in parsers.values()]
+
+        if any(other != outcomes[0] for other in outcomes[1:]):
+            mismatches += 1
+
+    return mismatches
+
+
+def timing(parsers: dict, source: str, repeat: int) -> dict:
+    # fastest parse per driver, the drivers take turns so both see the same machine load
+    state = ParserState("input.c", source)
+    tokens = list(tokenize(state, "regex"))
+    seconds = dict.fromkeys(parsers, None)
+
+    for _ in range(repeat):
+        for name, parser in parsers.items():
+            start = time.perf_counter()
+            parser.parse(iter(tokens), ParserState("input.c", source))
+            elapsed = time.perf_counter() - start
+
+            seconds[name] = elapsed if seconds[name] is None else min(seconds[name], elapsed)
+
+    return {name: (elapsed, len(tokens) / elapsed) for name, elapsed in seconds.items()}
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+
+    parser = argparse.ArgumentParser(description='Prism expression parser differential test and benchmark')
+    parser.add_argument('corpora', metavar='corpus', nargs='*', help='corpora to run, expressions, operators and functions by default')
+    parser.add_argument('--scale', type=float, default=1.0, help='multiply the default corpus sizes')
+    parser.add_argument('--repeat', type=int, default=5, help='parses per driver, the fastest counts')
+    parser.add_argument('--mutations', type=int, default=200, help='randomly broken variants of each corpus to compare')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the mutations')
+
+    args = parser.parse_args()
+
+    for name in args.corpora:
+        if name not in CORPORA or not CORPORA[name][2]:
+            parser.error(f"unknown or preprocess-only corpus {name}")
+
+    parsers = {name: Parser(TOKENTYPES, driver=name) for name in DRIVERS}
+    rng = random.Random(args.seed)
+    failed = False
+
+    # at the default recursion limit, so a parser that recurses without bound fails here
+    mismatches = differ(parsers, DEEP)
+    failed = mismatches > 0
+
+    print(f"{'deep':14} {mismatches} of {len(DEEP)} inputs differ")
+
+    for name in args.corpora or ["expressions", "operators", "functions"]:
+        source = generate(name, max(1, int(CORPORA[name][1] * args.scale)))
+
+        # mutations run on a small instance, errors stop a parse early anyway
+        small = generate(name, 20)
+        mismatches = differ(parsers, [source] + [mutate(small, rng) for _ in range(args.mutations)])
+        failed = failed or mismatches > 0
+
+        times = timing(parsers, source, args.repeat)
+        speedup = times["compiled"][0] / times["pratt"][0]
+
+        for driver, (seconds, rate) in times.items():
+            print(f"{name:14} {driver:10} {seconds * 1000:10.2f} ms  {rate:12,.0f} tokens/s")
+
+        print(f"{name:14} {'speedup':10} {speedup:10.2f} x   {mismatches} of {args.mutations + 1} inputs differ")
+
+    sys.exit(1 if failed else 0)
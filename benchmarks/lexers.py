@@ -0,0 +1,140 @@
+# the tokenizer engines against each other: chars is the reference, regex and buffer have to
+# produce the same tokens (names, lexemes, lines and columns) and the same errors; the parallel
+# matcher (--lex-jobs) is checked the same way. Then times each engine
+#   python benchmarks/lexers.py [corpus ...] [--scale F] [--repeat N] [--mutations N] [--seed S]
+# exits 1 if any engine disagrees with chars on any input
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parallel
+from corpus import CORPORA, generate
+from errors import Diagnostics, ErrorExit
+from lexer import tokenize, TOKENIZERS
+from util import ParserState
+
+
+# (engine, jobs), the first is the reference
+ENGINES = [(engine, 1) for engine in TOKENIZERS] + [("regex", 2), ("buffer", 2)]
+
+# inserted by the mutations, mostly the chars where the engines could cut tokens differently
+NOISE = ['"', "'", "/*", "*/", "//", "#", "\n", "\\", "'ab'", '"a b"', "...", "->", ">>=", "1.5f", "$", "@", "T"]
+
+# inputs the corpora do not cover
+SNIPPETS = [
+    "",
+    "int",
+    "a /* open comment",
+    'char *s = "open string',
+    "char c = 'x",
+    "char c = 'xy';",
+    "#pragma once\nint a;",
+    'char *s = "a \\" b";\nchar c = \'\\\'\';',
+    "x = a-->b;\ny = c...d;",
+    "/* a\n * b\n */ int a; // c\nint b;",
+    '#include "a.h"\nint x;',
+    "#define X 'a'\nint x;",
+]
+
+
+def outcome(source: str, engine: str, jobs: int):
+    # the tokens of a lex and the errors it reported
+    state = ParserState("input.c", source, Diagnostics(0))
+    tokens = []
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            for token in tokenize(state, engine, jobs):
+                tokens.append((token.name, token.value, token.source_pos.lineno, token.source_pos.colno))
+
+            state.diagnostics.finish()
+
+        except ErrorExit as e:
+            return tokens, [error.asdict() for error in e.errors]
+
+    return tokens, []
+
+
+def mutate(source: str, rng: random.Random) -> str:
+    for _ in range(rng.randint(1, 4)):
+        i = rng.randrange(len(source) + 1)
+        source = source[:i] + rng.choice(NOISE) + source[i:]
+
+    return source
+
+
+def differ(sources: list) -> int:
+    # number of sources on which an engine disagrees with the first one
+    mismatches = 0
+
+    for source in sources:
+        outcomes = [outcome(source, engine, jobs) for engine, jobs in ENGINES]
+
+        if any(other != outcomes[0] for other in outcomes[1:]):
+            mismatches += 1
+
+    return mismatches
+
+
+def timing(source: str, repeat: int) -> dict:
+    # fastest lex per engine, the engines take turns so all see the same machine load
+    seconds = dict.fromkeys(TOKENIZERS, None)
+    count = 0
+
+    for _ in range(repeat):
+        for engine in TOKENIZERS:
+            start = time.perf_counter()
+            count = sum(1 for _ in tokenize(ParserState("input.c", source), engine))
+            elapsed = time.perf_counter() - start
+
+            seconds[engine] = elapsed if seconds[engine] is None else min(seconds[engine], elapsed)
+
+    return {engine: (elapsed, count / elapsed) for engine, elapsed in seconds.items()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Prism tokenizer differential test and benchmark')
+    parser.add_argument('corpora', metavar='corpus', nargs='*', help='corpora to run, all that parse by default')
+    parser.add_argument('--scale', type=float, default=0.25, help='multiply the default corpus sizes')
+    parser.add_argument('--repeat', type=int, default=3, help='lexes per engine, the fastest counts')
+    parser.add_argument('--mutations', type=int, default=100, help='randomly broken variants of each corpus to compare')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the mutations')
+
+    args = parser.parse_args()
+
+    for name in args.corpora:
+        if name not in CORPORA or not CORPORA[name][2]:
+            parser.error(f"unknown or preprocess-only corpus {name}")
+
+    # small enough that the parallel matcher cuts even the mutated inputs
+    parallel.MIN_SOURCE = 0
+
+    rng = random.Random(args.seed)
+    failed = False
+
+    mismatches = differ(SNIPPETS)
+    failed = mismatches > 0
+
+    print(f"{'snippets':14} {mismatches} of {len(SNIPPETS)} inputs differ")
+
+    for name in args.corpora or [name for name, (_, _, parses) in CORPORA.items() if parses]:
+        source = generate(name, max(1, int(CORPORA[name][1] * args.scale)))
+
+        # mutations run on a small instance
+        small = generate(name, 20)
+        mismatches = differ([source] + [mutate(small, rng) for _ in range(args.mutations)])
+        failed = failed or mismatches > 0
+
+        for engine, (seconds, rate) in timing(source, args.repeat).items():
+            print(f"{name:14} {engine:10} {seconds * 1000:10.2f} ms  {rate:12,.0f} tokens/s")
+
+        print(f"{name:14} {mismatches} of {args.mutations + 1} inputs differ")
+
+    sys.exit(1 if failed else 0)
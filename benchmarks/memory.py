@@ -0,0 +1,54 @@
+# bytes per AST node for a synthetic translation unit
+#   python benchmarks/memory.py [functions]
+
+import os
+import sys
+import tracemalloc
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _parser import Parser
+from astree import walk
+from lexer import tokenize, TOKENTYPES
+from util import ParserState
+
+
+FUNCTION = """
+int f{0}(int a, int b) {{
+    int c = a * {0} + b - (a << 2) / 3;
+    int d[] = (int[]) {{ a, b, c, {0} }};
+    if (c > b && a != 0) {{ c = c + d[1]; }} else {{ c = -c; }}
+    while (c < 100) {{ c += a | b; }}
+    return f{0}(c, d[2]) ? c : b;
+}}
+"""
+
+
+def source(functions: int) -> str:
+    return "".join(FUNCTION.format(i) for i in range(functions))
+
+
+def measure(functions: int) -> tuple:
+    state = ParserState("<memory>", source(functions))
+    parser = Parser(TOKENTYPES)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    ast = parser.parse(tokenize(state), state)
+
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    nodes = sum(1 for fragment in walk(ast) if not isinstance(fragment, str))
+
+    return nodes, after - before
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+
+    nodes, size = measure(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
+
+    print(f"{nodes} nodes, {size} bytes retained, {size / nodes:.1f} bytes/node")
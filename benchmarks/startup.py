@@ -0,0 +1,111 @@
+# start-up time of the command line: fresh interpreters running --help and a small compile,
+# and what the compile spends on imports according to python -X importtime
+#   python benchmarks/startup.py [--repeat N] [--budget MS] [--top N]
+# exits 1 if the compile starts slower than the budget or imports a module that should load lazily
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import generate
+
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# only needed by the fallback without prebuilt tables, batch compiles, the socket server or the build cache
+LAZY = ["rply", "concurrent.futures", "multiprocessing", "socketserver", "hashlib", "tempfile"]
+
+
+def environment() -> dict:
+    # measured like an installed copy, whose bytecode is cached
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    return env
+
+
+def run(args: list) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable] + args, cwd=PACKAGE_DIR, env=environment(), capture_output=True, text=True)
+
+
+def best(repeat: int, args: list) -> float:
+    # fastest wall time of repeat runs in ms
+    seconds = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(args)
+        elapsed = time.perf_counter() - start
+
+        seconds = elapsed if seconds is None else min(seconds, elapsed)
+
+    return seconds * 1000
+
+
+def imports(args: list) -> list:
+    # (module, self ms, cumulative ms) of every import, in import order
+    rows = []
+
+    for line in run(["-X", "importtime"] + args).stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+
+        own, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(own) / 1000, int(cumulative) / 1000))
+
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Prism start-up benchmark')
+    parser.add_argument('--repeat', type=int, default=10, help='runs per measurement, the fastest counts')
+    parser.add_argument('--budget', type=float, default=80.0, help='ms a small compile may take on top of a bare interpreter')
+    parser.add_argument('--top', type=int, default=15, help='number of the slowest imports to list')
+
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="prism-startup-") as directory:
+        source = os.path.join(directory, "small.c")
+        command = [".", source, "-o", os.path.join(directory, "small.out.c")]
+
+        with open(source, "w") as file:
+            file.write(generate("functions", 5))
+
+        # the first run writes the bytecode caches and, if missing, the prebuilt tables
+        if run(command).returncode != 0:
+            sys.exit("the compile of the small input failed")
+
+        bare = best(args.repeat, ["-c", "pass"])
+        usage = best(args.repeat, [".", "--help"])
+        single = best(args.repeat, command)
+
+        rows = imports(command)
+
+    print(f"{'interpreter':12} {bare:8.1f} ms")
+    print(f"{'--help':12} {usage:8.1f} ms  {usage - bare:+8.1f} ms")
+    print(f"{'compile':12} {single:8.1f} ms  {single - bare:+8.1f} ms  budget {args.budget:.1f} ms")
+
+    print()
+    print(f"{sum(own for _, own, _ in rows):.1f} ms in {len(rows)} imports of the compile")
+    print(f"{'self ms':>9} {'total ms':>9}  module")
+
+    for name, own, cumulative in sorted(rows, key=lambda row: row[1], reverse=True)[:args.top]:
+        print(f"{own:9.2f} {cumulative:9.2f}  {name}")
+
+    loaded = [name for name, _, _ in rows if any(name == lazy or name.startswith(lazy + ".") for lazy in LAZY)]
+    failed = single - bare > args.budget
+
+    if loaded:
+        print()
+        print(f"imported although only needed lazily: {', '.join(loaded)}")
+
+    if failed:
+        print()
+        print(f"OVER BUDGET by {single - bare - args.budget:.1f} ms")
+
+    sys.exit(1 if failed or loaded else 0)
@@ -0,0 +1,153 @@
+# preprocessor, lexer, parser and emitter throughput on the synthetic corpora
+#   python benchmarks/throughput.py [corpus ...] [--scale F] [--repeat N] [--lexer engine] [--driver name]
+#                                   [--save name] [--compare name] [--threshold percent]
+# baselines are saved to benchmarks/baselines/<name>.json with the corpus scale, lexer and driver
+# they ran with, only runs with the same ones are compared. Only compare runs of the same machine
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _parser import DRIVERS, Parser
+from astree import Node, walk
+from corpus import CORPORA, generate
+from lexer import tokenize, TOKENIZERS, TOKENTYPES
+from preprocessor import preprocess
+from util import ParserState
+
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+
+def best(repeat: int, run) -> tuple:
+    # fastest of repeat runs and the result of the last one
+    seconds = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - start
+
+        seconds = elapsed if seconds is None else min(seconds, elapsed)
+
+    return seconds, result
+
+
+def measure(name: str, size: int, repeat: int, engine: str, parser: Parser) -> dict:
+    with tempfile.TemporaryDirectory(prefix="prism-bench-") as directory:
+        source = generate(name, size, directory)
+        size = len(source.encode())
+
+        results = {}
+
+        # the preprocessor reports every include on stdout
+        with contextlib.redirect_stdout(io.StringIO()):
+            seconds, _ = best(repeat, lambda: preprocess(source, set()))
+
+        results["preprocess"] = {"seconds": seconds, "bytes/s": size / seconds}
+
+    if not CORPORA[name][2]:
+        return results
+
+    seconds, tokens = best(repeat, lambda: list(tokenize(ParserState(name, source), engine)))
+    results["lex"] = {"seconds": seconds, "bytes/s": size / seconds, "tokens/s": len(tokens) / seconds}
+
+    # tokens are classified already, the parser gets a fresh state for its own feedback
+    seconds, ast = best(repeat, lambda: parser.parse(iter(tokens), ParserState(name, source)))
+    nodes = sum(1 for fragment in walk(ast) if isinstance(fragment, Node))
+    results["parse"] = {"seconds": seconds, "tokens/s": len(tokens) / seconds, "nodes/s": nodes / seconds}
+
+    seconds, _ = best(repeat, lambda: ast.emit(io.StringIO()))
+    results["emit"] = {"seconds": seconds, "nodes/s": nodes / seconds, "bytes/s": len(ast.clang()) / seconds}
+
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    # (corpus, stage, change in percent) for every stage that got slower than threshold,
+    # by the first rate of the stage so corpora of a different size still compare
+    regressions = []
+
+    for name, stages in results.items():
+        for stage, metrics in stages.items():
+            before = baseline.get(name, {}).get(stage)
+
+            if before is None:
+                continue
+
+            unit = next(unit for unit in metrics if unit != "seconds")
+            change = (before[unit] / metrics[unit] - 1) * 100
+
+            print(f"{name:14} {stage:12} {before[unit]:14,.0f} -> {metrics[unit]:14,.0f} {unit:8} {change:+7.1f}%")
+
+            if change > threshold:
+                regressions.append((name, stage, change))
+
+    return regressions
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+
+    parser = argparse.ArgumentParser(description='Prism throughput benchmarks')
+    parser.add_argument('corpora', metavar='corpus', nargs='*', help=f"corpora to run ({', '.join(CORPORA)}), all by default")
+    parser.add_argument('--scale', type=float, default=1.0, help='multiply the default corpus sizes')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement, the fastest counts')
+    parser.add_argument('--lexer', choices=TOKENIZERS, default='regex', help='tokenizer engine')
+    parser.add_argument('--driver', choices=DRIVERS, default='compiled', help='LR driver running the parse tables')
+    parser.add_argument('--save', metavar='name', help='save the results as baseline name')
+    parser.add_argument('--compare', metavar='name', help='compare against baseline name')
+    parser.add_argument('--threshold', type=float, default=10.0, help='slowdown in percent that counts as a regression')
+
+    args = parser.parse_args()
+
+    for name in args.corpora:
+        if name not in CORPORA:
+            parser.error(f"unknown corpus {name}")
+
+    # what a baseline has to share with a run to be compared
+    settings = {"scale": args.scale, "lexer": args.lexer, "driver": args.driver}
+
+    baseline = None
+
+    if args.compare:
+        with open(os.path.join(BASELINE_DIR, f"{args.compare}.json"), "r") as file:
+            baseline = json.load(file)
+
+        if baseline.get("settings") != settings:
+            parser.error(f"baseline {args.compare} ran with {baseline.get('settings')}, this run with {settings}")
+
+    prism = Parser(TOKENTYPES, driver=args.driver)
+    results = {}
+
+    for name in args.corpora or CORPORA:
+        size = max(1, int(CORPORA[name][1] * args.scale))
+        results[name] = measure(name, size, args.repeat, args.lexer, prism)
+
+        for stage, metrics in results[name].items():
+            rates = "  ".join(f"{value:12,.0f} {unit}" for unit, value in metrics.items() if unit != "seconds")
+
+            print(f"{name:14} {stage:12} {metrics['seconds'] * 1000:10.2f} ms  {rates}")
+
+    if args.save:
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+
+        with open(os.path.join(BASELINE_DIR, f"{args.save}.json"), "w") as file:
+            json.dump({"settings": settings, "results": results}, file, indent=2)
+
+    if baseline is not None:
+        print()
+        regressions = compare(results, baseline["results"], args.threshold)
+
+        for name, stage, change in regressions:
+            print(f"REGRESSION {name} {stage} {change:+.1f}%")
+
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import json
+import os
+
+from _parser import Parser
+from compiler import compile_c
+from errors import Diagnostics
+
+
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# a change to any of these invalidates every cached output, the parse tables included
+COMPILER_FILES = ["_parser.py", "astree.py", "compiler.py", "errors.py", "lexer.py", "lrparser.py", "parallel.py", "pratt.py",
+                  "prebuilt.py", "preprocessor.py", "source.py", "tablecache.py", "util.py",
+                  os.path.join("tables", "prism_tables.py")]
+
+_compiler_hash = None
+
+
+# hashlib, shutil and tempfile are imported where they are used, compiles without
+# --cache-dir need none of them and they add up to a good part of the startup
+
+def file_hash(path: str) -> str | None:
+    import hashlib
+
+    hasher = hashlib.sha256()
+
+    try:
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 16), b""):
+                hasher.update(chunk)
+
+    except OSError:
+        return None
+
+    return hasher.hexdigest()
+
+
+def compiler_hash() -> str:
+    global _compiler_hash
+
+    if _compiler_hash is None:
+        import hashlib
+
+        hasher = hashlib.sha256()
+
+        for name in COMPILER_FILES:
+            hasher.update(name.encode())
+            hasher.update(str(file_hash(os.path.join(SOURCE_DIR, name))).encode())
+
+        _compiler_hash = hasher.hexdigest()
+
+    return _compiler_hash
+
+
+class BuildCache:
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    def key(self, inFile: str, lexer: str, driver: str = "compiled") -> str:
+        import hashlib
+
+        # includes are resolved against the working directory, so it is part of the key
+        hasher = hashlib.sha256()
+        hasher.update(compiler_hash().encode())
+
+        for part in (os.getcwd(), os.path.abspath(inFile), lexer, driver):
+            hasher.update(b"\0" + part.encode())
+
+        return hasher.hexdigest()
+
+    def lookup(self, inFile: str, lexer: str, driver: str = "compiled") -> dict | None:
+        key = self.key(inFile, lexer, driver)
+
+        try:
+            with open(os.path.join(self.directory, key + ".json"), "r") as file:
+                entry = json.load(file)
+
+        except (OSError, ValueError):
+            return None
+
+        if not os.path.isfile(os.path.join(self.directory, key + ".c")):
+            return None
+
+        for path, digest in entry["dependencies"].items():
+            if file_hash(path) != digest:
+                return None
+
+        entry["output"] = os.path.join(self.directory, key + ".c")
+
+        return entry
+
+    def store(self, inFile: str, lexer: str, dependencies: list, outFile: str, driver: str = "compiled") -> None:
+        import shutil
+        import tempfile
+
+        key = self.key(inFile, lexer, driver)
+        entry = {
+            "input": inFile,
+            "dependencies": {path: file_hash(path) for path in dependencies},
+        }
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        # write both files atomically, parallel batch workers share the directory
+        with tempfile.NamedTemporaryFile(dir=self.directory, delete=False) as file:
+            with open(outFile, "rb") as output:
+                shutil.copyfileobj(output, file)
+
+        os.replace(file.name, os.path.join(self.directory, key + ".c"))
+
+        with tempfile.NamedTemporaryFile(dir=self.directory, delete=False, mode="w") as file:
+            json.dump(entry, file)
+
+        os.replace(file.name, os.path.join(self.directory, key + ".json"))
+
+
+def write_depfile(path: str, target: str, dependencies: list) -> None:
+    def escape(name: str) -> str:
+        return name.replace("$", "$$").replace(" ", "\\ ").replace("#", "\\#")
+
+    with open(path, "w") as file:
+        file.write(f"{escape(target)}: {' '.join(escape(dep) for dep in dependencies)}\n")
+
+        # phony targets for the includes, so removed headers do not break make (like -MP)
+        for dep in dependencies[1:]:
+            file.write(f"\n{escape(dep)}:\n")
+
+
+def compile_incremental(inFile, outFile, lexer="regex", parser: Parser = None, cache: BuildCache = None, depfile: str = None,
+                        mapped: bool = False, diagnostics: Diagnostics = None, jobs: int = 1,
+                        lexJobs: int = 1) -> bool:
+    driver = parser.driverName if parser is not None else "compiled"
+    entry = cache.lookup(inFile, lexer, driver) if cache is not None else None
+
+    if entry is not None:
+        import shutil
+
+        shutil.copyfile(entry["output"], outFile)
+        dependencies = list(entry["dependencies"])
+
+    else:
+        includes = set()
+        compile_c(inFile, outFile, lexer, parser, includes, mapped, diagnostics, jobs, lexJobs)
+        dependencies = [inFile] + sorted(includes)
+
+        if cache is not None:
+            cache.store(inFile, lexer, dependencies, outFile, driver)
+
+    if depfile is not None:
+        write_depfile(depfile, outFile, dependencies)
+
+    # False if the output was reused from the cache
+    return entry is None
@@ -1,25 +1,63 @@
+import instrument
 from _parser import ParserState, Parser
+from errors import Diagnostics
 from lexer import tokenize, TOKENTYPES
-from preprocessor import preprocess
+from parallel import MIN_PARSE_SOURCE, parse_parallel
+from preprocessor import expand
+from source import SourceFile
 
 
-def compile_c(inFile, outFile):
-    with open(inFile, "r") as file:
-        source = file.read()
-
+def compile_source(source: str, filename: str, lexer="regex", parser: Parser = None, includes: set = None,
+                   diagnostics: Diagnostics = None, jobs: int = 1, lexJobs: int = 1):
     # source = preprocess(source)
 
-    state = ParserState(inFile, source)
+    state = ParserState(filename, source, diagnostics)
+
+    instrument.count("read", "bytes", len(source))
+
+    # the expanded text is not used yet, only the includes are collected
+    with instrument.measure("preprocess"):
+        for _ in expand(source, includes):
+            pass
+
+    if parser is None:
+        parser = Parser(TOKENTYPES)
+
+    if jobs > 1 and len(source) >= MIN_PARSE_SOURCE:
+        ast = parse_parallel(state, lexer, parser, jobs, lexJobs)
+
+    else:
+        # the buffer lexer does its work here, the others while the parser pulls tokens
+        with instrument.measure("lex"):
+            tokens = instrument.timed("lex", tokenize(state, lexer, lexJobs), "tokens")
+
+        with instrument.measure("parse"):
+            ast = parser.parse(tokens, state)
+
+        instrument.count("parse", "reductions", parser.driver.reductions)
+        instrument.count_nodes(ast)
+
+    # raises if errors were collected along the way
+    if diagnostics is not None:
+        diagnostics.finish()
 
-    source = preprocess(source)
+    return ast
 
-    tokens = tokenize(state)
 
-    parser = Parser(TOKENTYPES, [])
+def compile_c(inFile, outFile, lexer="regex", parser: Parser = None, includes: set = None, mapped: bool = False,
+              diagnostics: Diagnostics = None, jobs: int = 1, lexJobs: int = 1):
+    if mapped:
+        # lex straight from the page cache instead of reading and decoding the whole file
+        with SourceFile(inFile) as source:
+            ast = compile_source(source.data, inFile, lexer, parser, includes, diagnostics, jobs, lexJobs)
 
-    ast = parser.parse(tokens, state)
+    else:
+        with instrument.measure("read"):
+            with open(inFile, "r") as file:
+                source = file.read()
 
-    ccode = ast.clang()
+        ast = compile_source(source, inFile, lexer, parser, includes, diagnostics, jobs, lexJobs)
 
-    with open(outFile, "w") as file:
-        file.write(ccode)
+    with instrument.measure("emit"):
+        with open(outFile, "w") as file:
+            ast.emit(file)
@@ -1,30 +1,54 @@
-import sys
+from __future__ import annotations
 
-from rply.token import SourcePosition
+import json
+
+from source import LineIndex, SourcePosition
 
 
 class Error:
-    def __init__(self, position: SourcePosition, filename: str, source: str, message: str) -> None:
+    def __init__(self, position: SourcePosition, filename: str, source: str, message: str, lines: LineIndex = None,
+                 diagnostics: Diagnostics = None) -> None:
         self.position =  position if position else SourcePosition(0, 0, 0)
         self.filename = filename
         self.source = source
         self.message = message
 
+        # pass the file's LineIndex when formatting many errors for the same source
+        self.lines = lines
+
+        # without a collector the first error ends the compile
+        self.diagnostics = diagnostics
+
         self.raiseError()
 
     def raiseError(self):
+        if self.diagnostics is not None:
+            self.diagnostics.report(self)
+            return
+
         print(str(self))
 
-        sys.exit(1)
+        raise ErrorExit(self)
+
+    def asdict(self) -> dict:
+        return {
+            "type": self.__class__.__name__,
+            "file": self.filename,
+            "line": self.position.lineno,
+            "column": self.position.colno,
+            "message": self.message,
+        }
 
     def __str__(self) -> str:
-        lines = self.source.splitlines()
+        if self.lines is None:
+            self.lines = LineIndex(self.source)
+
         lineno = self.position.lineno
 
         output = f"FILE {self.filename}, line {lineno}\n"
 
         # output += f"{self.position.lineno - 1:03}| " + lines[self.position.lineno - 1] + "\n"
-        output += f"{self.position.lineno:03}|>" + lines[self.position.lineno] + "\n"
+        output += f"{self.position.lineno:03}|>" + self.lines.line(self.position.lineno) + "\n"
         output += "-" * (self.position.colno + 4) + "^" + "\n"
         # output += f"{self.position.lineno + 1:03}| " + lines[self.position.lineno + 1] + "\n"
 
@@ -33,6 +57,48 @@ class Error:
         return output
 
 
+class ErrorExit(SystemExit):
+    # exits like sys.exit(1) but keeps the error(s) for callers that catch it
+    def __init__(self, error: Error, errors: list = None) -> None:
+        super().__init__(1)
+        self.error = error
+        self.errors = errors if errors else [error]
+
+
+DIAGNOSTIC_FORMATS = ["text", "json"]
+
+
+class Diagnostics:
+    # collects the errors of one compile, text errors are printed as they come,
+    # json errors as one list when the compile ends
+    def __init__(self, limit: int = 20, format: str = "text") -> None:
+        self.limit = limit
+        self.format = format
+        self.errors = []
+
+    def report(self, error: Error) -> None:
+        self.errors.append(error)
+
+        if self.format == "text":
+            print(str(error))
+
+        if self.limit and len(self.errors) >= self.limit:
+            if self.format == "text":
+                print(f"stopping after {self.limit} errors")
+
+            self.finish()
+
+    def finish(self) -> None:
+        # raises ErrorExit if anything was reported
+        if not self.errors:
+            return
+
+        if self.format == "json":
+            print(json.dumps([error.asdict() for error in self.errors], indent=2))
+
+        raise ErrorExit(self.errors[0], self.errors)
+
+
 class LexerError(Error):
     pass
 
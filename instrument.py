@@ -0,0 +1,324 @@
+import json
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from astree import Node, walk
+
+try:
+    import resource
+
+except ImportError:
+    resource = None
+
+
+# report of the compile that is currently measured, None when nothing is
+ACTIVE = None
+
+# called with (report, stage) whenever a stage finishes
+HOOKS = []
+
+
+def add_hook(hook) -> None:
+    HOOKS.append(hook)
+
+
+def remove_hook(hook) -> None:
+    HOOKS.remove(hook)
+
+
+def max_rss() -> int:
+    # high-water mark of the process in KiB, None where resource is unavailable
+    if resource is None:
+        return None
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+class Stage:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.counters = Counter()
+
+        # high-water mark of the whole process when the stage last finished, and how much
+        # the stage raised it while it ran (stages nested in it included)
+        self.peak = None
+        self.growth = None
+
+        # wall time of stages timed while this one was being measured, by name
+        self.lent = Counter()
+
+    def asdict(self) -> dict:
+        return {
+            "wall": self.wall,
+            "cpu": self.cpu,
+            "process_peak_kib": self.peak,
+            "peak_growth_kib": self.growth,
+            "counters": dict(self.counters),
+        }
+
+
+class Report:
+    # wall / cpu time, counters and growth of the memory high-water mark per pipeline stage;
+    # use as a context manager around a compile to make it the active report
+    def __init__(self) -> None:
+        self.stages = {}
+        self.nodes = Counter()
+
+        # stages that are being measured right now, innermost last
+        self.open = []
+
+    def __enter__(self):
+        global ACTIVE
+
+        self.previous = ACTIVE
+        ACTIVE = self
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        global ACTIVE
+
+        ACTIVE = self.previous
+
+    def stage(self, name: str) -> Stage:
+        if name not in self.stages:
+            self.stages[name] = Stage(name)
+
+        return self.stages[name]
+
+    @contextmanager
+    def measure(self, name: str):
+        stage = self.stage(name)
+        self.open.append(stage)
+
+        lent = Counter(stage.lent)
+
+        peak = max_rss()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+
+        try:
+            yield stage
+
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+
+            stage.wall += wall
+            stage.cpu += cpu
+            stage.peak = max_rss()
+
+            if peak is not None:
+                stage.growth = (stage.growth or 0) + stage.peak - peak
+
+            # timed stages only take wall time, they get the matching share of the cpu time
+            for other, lentWall in (stage.lent - lent).items():
+                share = cpu * lentWall / wall if wall else 0.0
+
+                stage.cpu -= share
+                self.stages[other].cpu += share
+
+            self.open.pop()
+
+            for hook in HOOKS:
+                hook(self, stage)
+
+    def timed(self, name: str, iterable, counter: str):
+        # times every next() on iterable as stage name and counts the items; the time
+        # is taken out of the stage pulling from it, so lexing inside the parse is split off.
+        # only the cheap wall clock is read per item, process_time() costs more than a token
+        stage = self.stage(name)
+        iterator = iter(iterable)
+
+        perf_counter = time.perf_counter
+
+        while True:
+            wall = perf_counter()
+
+            item = next(iterator, None)
+
+            wall = perf_counter() - wall
+
+            stage.wall += wall
+
+            if self.open:
+                self.open[-1].wall -= wall
+                self.open[-1].lent[name] += wall
+
+            if item is None:
+                break
+
+            stage.counters[counter] += 1
+
+            yield item
+
+        # the growth while lexing on demand goes to the stage pulling the tokens
+        stage.peak = max_rss()
+
+    def asdict(self) -> dict:
+        return {
+            "stages": {name: stage.asdict() for name, stage in self.stages.items()},
+            "nodes": dict(self.nodes.most_common()),
+        }
+
+    def table(self) -> str:
+        lines = [f"{'stage':12} {'wall ms':>10} {'cpu ms':>10} {'+peak KiB':>10} {'process peak KiB':>17}  counters"]
+
+        for stage in self.stages.values():
+            counters = " ".join(f"{key}={value}" for key, value in stage.counters.items())
+            growth = "-" if stage.growth is None else stage.growth
+            peak = "-" if stage.peak is None else stage.peak
+
+            lines.append(f"{stage.name:12} {stage.wall * 1000:10.2f} {stage.cpu * 1000:10.2f} {growth:>10} {peak:>17}  {counters}")
+
+        wall = sum(stage.wall for stage in self.stages.values())
+        cpu = sum(stage.cpu for stage in self.stages.values())
+
+        lines.append(f"{'total':12} {wall * 1000:10.2f} {cpu * 1000:10.2f}")
+
+        if self.nodes:
+            lines.append("")
+            lines.append(f"{sum(self.nodes.values())} AST nodes")
+
+            for name, count in self.nodes.most_common():
+                lines.append(f"  {name:24} {count:>10}")
+
+        return "\n".join(lines)
+
+    def format(self, kind: str = "text") -> str:
+        return json.dumps(self.asdict(), indent=2) if kind == "json" else self.table()
+
+
+REPORT_FORMATS = ["text", "json"]
+
+
+# the pipeline calls these, they do nothing unless a Report is active
+
+@contextmanager
+def measure(name: str):
+    if ACTIVE is None:
+        yield None
+
+    else:
+        with ACTIVE.measure(name) as stage:
+            yield stage
+
+
+def timed(name: str, iterable, counter: str):
+    return iterable if ACTIVE is None else ACTIVE.timed(name, iterable, counter)
+
+
+def count(name: str, counter: str, n: int = 1) -> None:
+    if ACTIVE is not None:
+        ACTIVE.stage(name).counters[counter] += n
+
+
+def count_nodes(ast) -> None:
+    # no tree when error recovery ran into the end of the input
+    if ACTIVE is not None and ast is not None:
+        # shared leaves are counted once per place they appear in
+        ACTIVE.nodes.update(type(node).__name__ for node in walk(ast) if isinstance(node, Node))
+
+
+class ProductionProfile:
+    # calls and time of every grammar production's reduce action; use as a context
+    # manager around parses, the actions are wrapped on enter and restored on exit
+    def __init__(self, parser) -> None:
+        self.parser = parser
+        self.grammar = parser.grammar
+
+        # rule -> [calls, seconds]
+        self.productions = {}
+        self.functions = {}
+
+    def __enter__(self):
+        for production in self.grammar.productions:
+            # the augmented start production has no action
+            if production.func is None:
+                continue
+
+            self.functions[production] = production.func
+            production.func = self.wrap(production)
+
+        self.rebind()
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        for production, func in self.functions.items():
+            production.func = func
+
+        self.functions = {}
+        self.rebind()
+
+    def rebind(self) -> None:
+        # drivers that copy the actions up front have to pick up the wrapped ones
+        if hasattr(self.parser.driver, "bind"):
+            self.parser.driver.bind()
+
+    def wrap(self, production):
+        func = production.func
+        stats = self.productions.setdefault(f"{production.name} : {' '.join(production.prod)}", [0, 0.0])
+
+        perf_counter = time.perf_counter
+
+        def profiled(*args):
+            start = perf_counter()
+
+            try:
+                return func(*args)
+
+            finally:
+                stats[0] += 1
+                stats[1] += perf_counter() - start
+
+        return profiled
+
+    def ranked(self) -> list:
+        # (rule, calls, seconds) of the productions that ran, most time first
+        rows = [(rule, calls, seconds) for rule, (calls, seconds) in self.productions.items() if calls]
+
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+    def nonterminals(self) -> list:
+        # the same summed up per nonterminal
+        totals = {}
+
+        for rule, calls, seconds in self.ranked():
+            name = rule.split(" : ")[0]
+            total = totals.setdefault(name, [0, 0.0])
+            total[0] += calls
+            total[1] += seconds
+
+        return sorted(((name, calls, seconds) for name, (calls, seconds) in totals.items()), key=lambda row: row[2], reverse=True)
+
+    def asdict(self) -> dict:
+        return {
+            "productions": [{"rule": rule, "calls": calls, "seconds": seconds} for rule, calls, seconds in self.ranked()],
+            "nonterminals": [{"name": name, "calls": calls, "seconds": seconds} for name, calls, seconds in self.nonterminals()],
+        }
+
+    def table(self, limit: int = 30) -> str:
+        total = sum(seconds for _, _, seconds in self.ranked()) or 1.0
+
+        lines = [f"{'calls':>10} {'total ms':>10} {'mean us':>9} {'share':>7}  production"]
+
+        for rule, calls, seconds in self.ranked()[:limit]:
+            lines.append(f"{calls:10} {seconds * 1000:10.2f} {seconds / calls * 1e6:9.2f} {seconds / total:7.1%}  {rule}")
+
+        lines.append("")
+        lines.append(f"{'calls':>10} {'total ms':>10} {'mean us':>9} {'share':>7}  nonterminal")
+
+        for name, calls, seconds in self.nonterminals()[:limit]:
+            lines.append(f"{calls:10} {seconds * 1000:10.2f} {seconds / calls * 1e6:9.2f} {seconds / total:7.1%}  {name}")
+
+        return "\n".join(lines)
+
+    def format(self, kind: str = "text") -> str:
+        return json.dumps(self.asdict(), indent=2) if kind == "json" else self.table()
@@ -6,10 +6,14 @@
 from __future__ import annotations
 from typing import Generator
 
+from array import array
+
+import re
 import string
+import sys
 from enum import Enum
 
-from rply.token import SourcePosition, Token
+from source import LineIndex, SourcePosition, Token
 
 from errors import LexerError
 from util import ParserState
@@ -79,10 +83,6 @@ TOKENTYPES = [SUBSTITUTE[token] if token in SUBSTITUTE else token for token in T
 
 # --------------------------------------------------------------------------------------------------
 
-typedef = False
-customTypes = []
-
-
 class TokenType(Enum):
     UNSET = 0
     COMMENT = 1
@@ -93,11 +93,99 @@ class TokenType(Enum):
     OPERATOR = 6
 
 
+# keywords after which an identifier is the declarator and not a type
+declaration_types = types + ["signed", "unsigned"]
+declaration_qualifiers = ["const", "volatile", "restrict"]
+
+# keywords followed by a tag, which lives in its own namespace
+tag_keywords = ["struct", "union", "enum"]
+
+
+def track_keyword(state: ParserState, token: str) -> None:
+    if token == "typedef":
+        state.typedef = state.symbols.depth
+
+    state.declarator = token in declaration_types or (state.declarator and token in declaration_qualifiers)
+    state.tag = token in tag_keywords
+    # a for loop's declarations are scoped like parameters
+    state.parameters = token == "for"
+    state.body = []
+
+
+def track_symbol(state: ParserState, token: str) -> None:
+    symbols = state.symbols
+    body = []
+
+    if token == ";" and state.typedef == symbols.depth:
+        state.typedef = None
+
+    elif token == "{":
+        symbols.push()
+
+        # a function body sees its parameters, `int f(int T) { ... }` hides T up to its "}"
+        for name in state.body:
+            symbols.declareObject(name)
+
+    elif token == "}":
+        symbols.pop()
+
+        if state.typedef is not None and state.typedef > symbols.depth:
+            state.typedef = None
+
+    elif token == "(":
+        # a "(" after a declarator starts a parameter list, other ones only group
+        if state.parameters:
+            symbols.push()
+
+        state.parens.append(state.parameters)
+
+    elif token == ")":
+        if state.parens and state.parens.pop():
+            body = symbols.pop()
+
+    state.declarator = state.declarator and token == "*"
+    state.tag = False
+    state.parameters = token == ")" or token == "]"
+    state.body = body
+
+
+def classify_identifier(state: ParserState, token: str) -> str:
+    symbols = state.symbols
+
+    # `struct T` names a tag and is followed by a declarator like a type keyword
+    if state.tag:
+        state.tag = False
+        state.declarator = True
+
+        return "IDENTIFIER"
+
+    # names declared by a typedef at its own scope depth, `int T;` inside a typedef redeclares T
+    if state.typedef == symbols.depth and (state.declarator or not symbols.isType(token)):
+        symbols.declareType(token)
+        name = "IDENTIFIER"
+
+    elif symbols.isType(token) and not state.declarator:
+        name = "TYPEDIDENT"
+
+    else:
+        # `int T;` / `T T;` hides the typedef name T until the end of the block
+        if state.declarator and symbols.isType(token):
+            symbols.declareObject(token)
+
+        name = "IDENTIFIER"
+
+    state.declarator = name == "TYPEDIDENT"
+    state.parameters = name == "IDENTIFIER"
+    state.body = []
+
+    return name
+
+
 def consists_of(value, chars):
     return len(value) and all(map(lambda char: char in chars, value))
 
 
-def tokenize(state: ParserState) -> Generator[Token, None, None]:
+def tokenize_chars(state: ParserState) -> Generator[Token, None, None]:
     symbols = string.punctuation.replace("_", "")
     floatdigits = string.digits + "."
 
@@ -108,11 +196,6 @@ def tokenize(state: ParserState) -> Generator[Token, None, None]:
     tokentype = TokenType.UNSET
 
     def _token():
-        global typedef, customTypes
-
-        if typedef and token == ";":
-            typedef = False
-
         if tokentype == TokenType.STRING:
             return Token("STRING", token, SourcePosition(0, line, column))
 
@@ -120,6 +203,8 @@ def tokenize(state: ParserState) -> Generator[Token, None, None]:
             return Token("PRAGMA", token, SourcePosition(0, line, column))
 
         elif token in operators or token in symbols:
+            track_symbol(state, token)
+
             if token in SUBSTITUTE:
                 return Token(SUBSTITUTE[token], token, SourcePosition(0, line, column))
 
@@ -129,18 +214,11 @@ def tokenize(state: ParserState) -> Generator[Token, None, None]:
             return Token("CONSTANT", token, SourcePosition(0, line, column))
 
         elif token in keywords:
-            if token == "typedef":
-                typedef = True
+            track_keyword(state, token)
 
             return Token(token.upper(), token, SourcePosition(0, line, column))
 
-        elif token in customTypes:
-            return Token("TYPEDIDENT", token, SourcePosition(0, line, column))
-
-        if typedef:
-            customTypes.append(token)
-
-        return Token("IDENTIFIER", token, SourcePosition(0, line, column))
+        return Token(classify_identifier(state, token), token, SourcePosition(0, line, column))
 
     for char in state.source:
         column += 1
@@ -205,18 +283,26 @@ def tokenize(state: ParserState) -> Generator[Token, None, None]:
 
             token += char
 
+            if char == "\n":
+                line += 1
+                column = 0
+
         # in char / char end
         elif tokentype == TokenType.CHAR:
             if token.endswith("\\"):
                 # escape
                 token += char
 
+                if char == "\n":
+                    line += 1
+                    column = 0
+
             # end
             elif char == "'":
                 token += char
 
                 if len(token) != 3:
-                    LexerError(SourcePosition(0, line, column), state.filename, state.source, f"Character {token} to long!")
+                    LexerError(SourcePosition(0, line, column), state.filename, state.source, f"Character {token} to long!", state.lines, state.diagnostics)
 
                 yield _token()
 
@@ -227,6 +313,10 @@ def tokenize(state: ParserState) -> Generator[Token, None, None]:
             else:
                 token += char
 
+                if char == "\n":
+                    line += 1
+                    column = 0
+
         # char start
         elif char == "'" and tokentype != TokenType.STRING:
             if token != "":
@@ -290,6 +380,302 @@ def tokenize(state: ParserState) -> Generator[Token, None, None]:
             yield _token()
 
 
+# --------------------------------------------------------------------------------------------------
+
+SYMBOLS = string.punctuation.replace("_", "")
+KEYWORDS = set(keywords)
+
+# operators reachable by growing a token one char at a time, "..." is not (".." is no operator)
+MUNCH_OPERATORS = sorted(
+    {op for op in operators if all(op[:i] in operators for i in range(1, len(op)))},
+    key=lambda op: (-len(op), op)
+)
+
+WORD = rf"[^{re.escape(SYMBOLS)} \t\n\r\x0b\x0c]"
+
+# alternatives are tried in order, quotes / comments / pragmas win over plain symbols
+TOKEN_PATTERN = re.compile("|".join([
+    r"(?P<SPACE>[ \t\n\r\x0b\x0c]+)",
+    r"(?P<COMMENT>//[^\n]*|/\*(?:(?:[\s\S]*?\*)??\n*/|[\s\S]*))",
+    r"(?P<PRAGMA>#[^\n]*)",
+    r'(?P<STRING>"(?:[^"]|(?<=\\)")*"?)',
+    r"(?P<CHAR>'(?:[^']|(?<=\\)')*(?P<CHAREND>')?)",
+    fr"(?P<WORD>[0-9]+\.{WORD}*|{WORD}+)",
+    "(?P<SYMBOL>" + "|".join(map(re.escape, MUNCH_OPERATORS)) + f"|[{re.escape(SYMBOLS)}])",
+]))
+
+# same pattern for bytes and memory-mapped sources, non-ascii bytes are word characters
+BYTES_PATTERN = re.compile(TOKEN_PATTERN.pattern.encode())
+
+
+# kinds of the matched tokens before classification, the parallel lexer stores their index
+MATCH_KINDS = ["WORD", "SYMBOL", "STRING", "CHAR", "OPENCHAR", "PRAGMA", "COMMENT"]
+
+
+def match_tokens(source, lines: LineIndex, start: int = 0) -> Generator[tuple, None, None]:
+    # (kind, start, end, line, column) of every token from start on, without the state the
+    # lexer keeps: no classification and no errors yet. Comments come along so a cut through
+    # an unterminated one can be seen, whitespace does not
+    end = len(source)
+
+    # line and column come from the file's line index, only tokens that end past the
+    # start of the next line need a lookup
+    starts = lines.starts
+    lineno = lines.lineno
+
+    line = lineno(start)
+    linestart = starts[line]
+    nextstart = starts[line + 1] if line + 1 < len(starts) else end + 1
+    pos = start
+
+    # mapped sources are scanned in place, columns are byte offsets there
+    match = TOKEN_PATTERN.match if isinstance(source, str) else BYTES_PATTERN.match
+
+    while pos < end:
+        m = match(source, pos)
+        kind = m.lastgroup
+        start, pos = m.span()
+
+        if pos >= nextstart:
+            line = lineno(pos)
+            linestart = starts[line]
+            nextstart = starts[line + 1] if line + 1 < len(starts) else end + 1
+
+        if kind == "SPACE":
+            continue
+
+        # positions match tokenize_chars: the column of the char that ended the token
+        if kind == "STRING" or kind == "CHAR" or pos == end:
+            column = pos - linestart
+
+        else:
+            column = pos - linestart + 1
+
+        if kind == "CHAR" and m.group("CHAREND") is None:
+            # unterminated at the end of the source
+            kind = "OPENCHAR"
+
+        yield kind, start, pos, line, column
+
+
+def classify(state: ParserState, matched, lexemes: bool = True) -> Generator[tuple, None, None]:
+    # (name, lexeme, start, end, line, column) of matched tokens in source order: keywords,
+    # symbols and identifiers go through the typedef tracking, which needs every token before.
+    # Without lexemes only the tokens classified by their text get sliced, the lexeme of
+    # strings, pragmas and chars is None
+    source = state.source
+    decode = None if isinstance(source, str) else bytes.decode
+
+    intern = sys.intern
+    substitute = SUBSTITUTE.get
+
+    for kind, start, end, line, column in matched:
+        if lexemes or kind == "WORD" or kind == "SYMBOL" or kind == "OPENCHAR" or (kind == "CHAR" and end - start != 3):
+            token = source[start:end]
+
+            if decode:
+                token = decode(token)
+
+        else:
+            token = None
+
+        if kind == "WORD":
+            if token[0] in "0123456789":
+                name = "CONSTANT"
+
+            elif token in KEYWORDS:
+                token = intern(token)
+                track_keyword(state, token)
+                name = token.upper()
+
+            else:
+                name = classify_identifier(state, token)
+
+        elif kind == "SYMBOL":
+            # operator lexemes end up in BinaryOpNode / UnaryOpNode, share one string each
+            token = intern(token)
+            track_symbol(state, token)
+            name = substitute(token, token)
+
+        elif kind == "COMMENT":
+            continue
+
+        elif kind == "OPENCHAR":
+            if token in SYMBOLS:
+                track_symbol(state, token)
+                name = token
+
+            else:
+                name = "CONSTANT"
+
+        elif kind == "CHAR":
+            if token is not None and len(token) != 3:
+                LexerError(SourcePosition(0, line, column), state.filename, state.source, f"Character {token} to long!", state.lines, state.diagnostics)
+
+            name = "CONSTANT"
+
+        else:
+            name = kind
+
+        yield name, token, start, end, line, column
+
+
+def scan(state: ParserState, jobs: int = 1, lexemes: bool = True) -> Generator[tuple, None, None]:
+    # (name, lexeme, start, end, line, column) for every token
+    if jobs > 1:
+        # the pool is only imported when it is used, see parallel.py
+        from parallel import match_parallel
+
+        return classify(state, match_parallel(state, jobs), lexemes)
+
+    return classify(state, match_tokens(state.source, state.lines), lexemes)
+
+
+def tokenize_regex(state: ParserState, jobs: int = 1) -> Generator[Token, None, None]:
+    for name, token, start, end, line, column in scan(state, jobs):
+        yield Token(name, token, SourcePosition(0, line, column))
+
+
+# --------------------------------------------------------------------------------------------------
+
+# token kinds are stored as indices into KINDS
+KINDS = list(dict.fromkeys(TOKENTYPES + ["TYPEDIDENT"]))
+KIND_IDS = {name: i for i, name in enumerate(KINDS)}
+
+# strings and chars end in a quote unless they run to the end of the source, no other token does
+QUOTES = "\"'"
+BYTE_QUOTES = tuple(QUOTES.encode())
+
+# keywords and operators always have the same lexeme, no need to slice the source for them
+LEXEMES = {
+    (token.upper() if token in keywords else SUBSTITUTE.get(token, token)): sys.intern(token)
+    for token in keywords + operators + ["[", "]", "(", ")", "{", "}", ";", ","]
+}
+
+
+class TokenBuffer:
+    # kind, start and end offset of every token; lexemes are sliced and positions computed
+    # from the line index only when the parser pulls a token
+    def __init__(self, state: ParserState, jobs: int = 1) -> None:
+        self.state = state
+        self.source = state.source
+
+        self.names = list(KINDS)
+        self.kindIds = dict(KIND_IDS)
+
+        self.kinds = array("H")
+        self.starts = array("q")
+        self.ends = array("q")
+
+        for name, _, start, end, _, _ in scan(state, jobs, False):
+            kind = self.kindIds.get(name)
+
+            # odd symbols like "$" or "@" get a kind of their own
+            if kind is None:
+                kind = self.kindIds[name] = len(self.names)
+                self.names.append(name)
+
+            self.kinds.append(kind)
+            self.starts.append(start)
+            self.ends.append(end)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def name(self, i: int) -> str:
+        return self.names[self.kinds[i]]
+
+    def lexeme(self, i: int) -> str:
+        lexeme = self.source[self.starts[i]:self.ends[i]]
+
+        return lexeme if isinstance(lexeme, str) else lexeme.decode()
+
+    def column(self, i: int, linestart: int) -> int:
+        # like scan(): the column of the char that ended the token, which is the closing quote
+        # of strings and chars and the last char of the source, one more for everything else.
+        # Chars are the constants that start with a quote
+        source = self.source
+        quotes = QUOTES if isinstance(source, str) else BYTE_QUOTES
+        name = self.name(i)
+        end = self.ends[i]
+
+        if end == len(source) or name == "STRING" or (name == "CONSTANT" and source[self.starts[i]] in quotes):
+            return end - linestart
+
+        return end - linestart + 1
+
+    def position(self, i: int) -> SourcePosition:
+        lines = self.state.lines
+        line = lines.lineno(self.ends[i])
+
+        return SourcePosition(0, line, self.column(i, lines.starts[line]))
+
+    def tokens(self, start: int = 0, stop: int = None) -> Generator[Token, None, None]:
+        # Tokens are only built here, while the parser pulls them
+        names = self.names
+        source = self.source
+        lexemes = LEXEMES
+        kinds = self.kinds
+        starts = self.starts
+        ends = self.ends
+        stop = len(self) if stop is None else stop
+
+        # tokens come in source order, the line only needs a lookup when a token ends past
+        # the start of the next one
+        lines = self.state.lines
+        linestarts = lines.starts
+        last = len(source)
+        quotes = QUOTES if isinstance(source, str) else BYTE_QUOTES
+
+        line = lines.lineno(ends[start]) if start < stop else 0
+        linestart = linestarts[line]
+        nextstart = linestarts[line + 1] if line + 1 < len(linestarts) else last + 1
+
+        for i in range(start, stop):
+            name = names[kinds[i]]
+            end = ends[i]
+
+            if end >= nextstart:
+                line = lines.lineno(end)
+                linestart = linestarts[line]
+                nextstart = linestarts[line + 1] if line + 1 < len(linestarts) else last + 1
+
+            lexeme = lexemes.get(name)
+
+            if lexeme is None:
+                lexeme = source[starts[i]:end]
+
+                if not isinstance(lexeme, str):
+                    lexeme = lexeme.decode()
+
+            if end == last or name == "STRING" or (name == "CONSTANT" and source[starts[i]] in quotes):
+                column = end - linestart
+
+            else:
+                column = end - linestart + 1
+
+            yield Token(name, lexeme, SourcePosition(0, line, column))
+
+
+def tokenize_buffer(state: ParserState, jobs: int = 1) -> Generator[Token, None, None]:
+    return TokenBuffer(state, jobs).tokens()
+
+
+TOKENIZERS = {
+    "chars": tokenize_chars,
+    "regex": tokenize_regex,
+    "buffer": tokenize_buffer,
+}
+
+
+def tokenize(state: ParserState, engine: str = "regex", jobs: int = 1) -> Generator[Token, None, None]:
+    # jobs > 1 matches large sources in that many processes, the char lexer always runs serially
+    if jobs > 1 and engine != "chars":
+        return TOKENIZERS[engine](state, jobs)
+
+    return TOKENIZERS[engine](state)
+
+
 if __name__ == "__main__":
     source = """
         switch (2 < 3) {
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from source import Token
+
+
+# panic mode skips input up to and including one of these
+SYNC_TOKENS = {";", "}"}
+
+# errors within this many shifted tokens after a recovery are not reported again
+QUIET_TOKENS = 3
+
+
+class CompiledLRParser:
+    # the same LALR tables in a form made for Prism's driver loop: terminals and
+    # nonterminals are numbered, action / goto are flat lists indexed by
+    # state * width + kind (None for an error), and every production is a prebuilt
+    # (action, length, nonterminal) triple; recovery works like RecoveringLRParser
+    def __init__(self, lr_table, error_handler) -> None:
+        self.lr_table = lr_table
+        self.grammar = grammar = lr_table.grammar
+        self.error_handler = error_handler
+
+        self.kinds = {name: i for i, name in enumerate(sorted(set(grammar.terminals) | {"$end"}))}
+        self.nonterminals = {name: i for i, name in enumerate(sorted(grammar.nonterminals))}
+
+        self.width = len(self.kinds)
+        self.gotoWidth = len(self.nonterminals)
+
+        self.action = [None] * (len(lr_table.lr_action) * self.width)
+        self.goto = [None] * (len(lr_table.lr_goto) * self.gotoWidth)
+
+        for state, actions in enumerate(lr_table.lr_action):
+            for name, t in actions.items():
+                self.action[state * self.width + self.kinds[name]] = t
+
+        for state, gotos in enumerate(lr_table.lr_goto):
+            for name, t in gotos.items():
+                self.goto[state * self.gotoWidth + self.nonterminals[name]] = t
+
+        self.defaults = list(lr_table.default_reductions)
+
+        self.setup()
+
+    @classmethod
+    def prebuilt(cls, tables, grammar, error_handler) -> CompiledLRParser:
+        # the driver from a generated tables module (see prebuilt.py) instead of rply's LRTable;
+        # grammar only needs the productions, numbered like rply's
+        self = cls.__new__(cls)
+
+        self.lr_table = None
+        self.grammar = grammar
+        self.error_handler = error_handler
+
+        self.kinds = tables.KINDS
+        self.nonterminals = tables.NONTERMINALS
+
+        self.width = len(self.kinds)
+        self.gotoWidth = len(self.nonterminals)
+
+        self.action = tables.ACTION
+        self.goto = tables.GOTO
+        self.defaults = tables.DEFAULTS
+
+        self.setup()
+
+        return self
+
+    def setup(self) -> None:
+        # state * width + kind -> (nonterminal, argument) of the shifts a subclass parses by
+        # other means through enter(), which returns the nonterminal's value or None
+        self.entries = {}
+
+        self.reductions = 0
+        self.bind()
+
+    def bind(self) -> None:
+        # (re)reads the production actions, call after wrapping them
+        self.productions = [
+            (p.func, len(p.prod), self.nonterminals.get(p.name)) for p in self.grammar.productions
+        ]
+
+    def parse(self, tokenizer, state=None):
+        action = self.action
+        goto = self.goto
+        width = self.width
+        gotoWidth = self.gotoWidth
+        defaults = self.defaults
+        productions = self.productions
+        kinds = self.kinds.get
+        end = self.kinds["$end"]
+        entries = self.entries
+
+        lookahead = None
+        kind = None
+
+        statestack = [0]
+        symstack = [Token("$end", "$end")]
+
+        quiet = 0
+        reductions = 0
+
+        current = 0
+
+        try:
+            while True:
+                t = defaults[current]
+
+                if not t:
+                    if lookahead is None:
+                        lookahead = next(tokenizer, None)
+
+                        if lookahead is None:
+                            lookahead = Token("$end", "$end")
+                            kind = end
+
+                        else:
+                            kind = kinds(lookahead.name)
+
+                    t = action[current * width + kind] if kind is not None else None
+
+                    if t is None:
+                        if not quiet:
+                            if state is None:
+                                self.error_handler(lookahead)
+                            else:
+                                self.error_handler(state, lookahead)
+
+                        lookahead = self.recover(lookahead, tokenizer, statestack, symstack)
+
+                        if lookahead is None:
+                            return None
+
+                        kind = kinds(lookahead.name)
+                        current = statestack[-1]
+                        quiet = QUIET_TOKENS
+                        continue
+
+                    if t > 0:
+                        entry = entries.get(current * width + kind) if entries else None
+
+                        if entry is not None:
+                            value, lookahead, tokenizer, shifted = self.enter(entry, lookahead, tokenizer, statestack, state)
+
+                            # taken over: continue as if the nonterminal had just been reduced
+                            if value is not None:
+                                current = goto[current * gotoWidth + entry[0]]
+                                statestack.append(current)
+                                symstack.append(value)
+                                kind = kinds(lookahead.name)
+
+                                quiet = max(quiet - shifted, 0)
+
+                                continue
+
+                        statestack.append(t)
+                        symstack.append(lookahead)
+                        current = t
+                        lookahead = None
+
+                        if quiet:
+                            quiet -= 1
+
+                        continue
+
+                    if t == 0:
+                        return symstack[-1]
+
+                # reduce by production -t
+                func, length, nonterminal = productions[-t]
+
+                if length:
+                    args = symstack[-length:]
+                    del symstack[-length:]
+                    del statestack[-length:]
+
+                else:
+                    args = []
+
+                symstack.append(func(args) if state is None else func(state, args))
+
+                current = goto[statestack[-1] * gotoWidth + nonterminal]
+                statestack.append(current)
+
+                reductions += 1
+
+        finally:
+            self.reductions = reductions
+
+    def accepts(self, state: int, name: str) -> int:
+        # action of state on the terminal name, None if it is an error
+        kind = self.kinds.get(name)
+
+        return None if kind is None else self.action[state * self.width + kind]
+
+    def recover(self, lookahead, tokenizer, statestack, symstack):
+        # same panic mode as RecoveringLRParser.recover
+        while True:
+            while lookahead.gettokentype() not in SYNC_TOKENS:
+                if lookahead.gettokentype() == "$end":
+                    return None
+
+                lookahead = next(tokenizer, None) or Token("$end", "$end")
+
+            lookahead = next(tokenizer, None) or Token("$end", "$end")
+            ltype = lookahead.gettokentype()
+
+            for shift in (True, False):
+                for i in range(len(statestack) - 1, -1, -1):
+                    action = self.accepts(statestack[i], ltype)
+
+                    if action is not None and (action > 0 or not shift):
+                        del statestack[i + 1:]
+                        del symstack[i + 1:]
+
+                        return lookahead
+
+            if ltype == "$end":
+                return None
@@ -0,0 +1,295 @@
+import string
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+
+import _parser
+import instrument
+from _parser import Parser
+from astree import BlockNode
+from errors import Diagnostics
+from lexer import match_tokens, tokenize, MATCH_KINDS
+from source import LineIndex, SourcePosition, Token
+from util import ParserState
+
+
+# inputs with fewer chars are parsed in one piece, starting the pool costs more than it saves
+MIN_PARSE_SOURCE = 1 << 15
+
+# sources with fewer chars are matched in one piece
+MIN_SOURCE = 1 << 16
+
+# chunks per worker, so one slow chunk does not leave the other workers idle
+CHUNKS_PER_JOB = 4
+
+# a source is cut before lines starting with one of these, which mostly begin a declaration
+# or close a function; a cut through a comment or a string anyway is caught in match_parallel
+LINE_STARTS = string.ascii_letters + "_}"
+
+
+def declaration_ends(names: list) -> list:
+    # the index after every top-level declaration: a ";" or a pragma outside of braces and
+    # parentheses, or the "}" that closes a function body. Other "}" at depth 0 close a struct
+    # or an initializer and the declaration goes on, as in `struct s { ... } a, b;`, so a
+    # typedef always ends with its ";" and the lexer has declared its names by then
+    ends = []
+    depth = 0
+    parens = 0
+    body = False
+    previous = None
+
+    for i, name in enumerate(names):
+        if name == "{":
+            if depth == 0:
+                body = previous == ")"
+
+            depth += 1
+
+        elif name == "}":
+            depth -= 1
+
+            # unbalanced input goes to the serial parse, which reports it
+            if depth < 0:
+                return []
+
+            if depth == 0 and parens == 0 and body:
+                ends.append(i + 1)
+
+        elif name == "(":
+            parens += 1
+
+        elif name == ")":
+            parens -= 1
+
+        elif depth == 0 and parens == 0 and (name == ";" or name == "PRAGMA"):
+            ends.append(i + 1)
+
+        previous = name
+
+    return ends
+
+
+def split(names: list, parts: int) -> list:
+    # (start, stop) of about parts runs of whole declarations, anything after the last
+    # complete declaration stays with the last run
+    size = len(names) / parts
+    chunks = []
+    start = 0
+
+    for end in declaration_ends(names):
+        if end - start >= size:
+            chunks.append((start, end))
+            start = end
+
+    if start < len(names):
+        if chunks:
+            chunks[-1] = (chunks[-1][0], len(names))
+
+        else:
+            chunks.append((start, len(names)))
+
+    return chunks
+
+
+def line_cuts(source, parts: int) -> list:
+    # offsets that cut source into about parts slices, each at the start of a line
+    newline = "\n" if isinstance(source, str) else b"\n"
+    starts = LINE_STARTS if isinstance(source, str) else LINE_STARTS.encode()
+    size = len(source) // parts
+    cuts = [0]
+
+    for i in range(1, parts):
+        pos = source.find(newline, max(i * size, cuts[-1]))
+
+        while pos != -1 and pos + 1 < len(source) and source[pos + 1:pos + 2] not in starts:
+            pos = source.find(newline, pos + 1)
+
+        if pos == -1 or pos + 1 >= len(source):
+            break
+
+        cuts.append(pos + 1)
+
+    return cuts
+
+
+def match_chunk(source, offset: int, line: int) -> tuple:
+    # arrays of the kind index, start, end, line and column of every token in a slice of the
+    # file that begins at the start of line, positions rebased onto the file. Columns stay,
+    # the slice starts a line, and only the last slice ends where the file does
+    kinds = array("B")
+    starts = array("q")
+    ends = array("q")
+    lines = array("q")
+    columns = array("q")
+
+    index = {kind: i for i, kind in enumerate(MATCH_KINDS)}
+
+    for kind, start, end, lineno, column in match_tokens(source, LineIndex(source)):
+        kinds.append(index[kind])
+        starts.append(start + offset)
+        ends.append(end + offset)
+        lines.append(lineno + line)
+        columns.append(column)
+
+    return kinds, starts, ends, lines, columns
+
+
+def match_parallel(state: ParserState, jobs: int):
+    # match_tokens over state.source in jobs processes, stitched in source order. The slices
+    # are only matched there, classifying identifiers needs the typedefs declared before and
+    # is left to the lexer. A slice cut through a comment or a string ends in a token that
+    # runs to its very end, from that token on the source is matched here until a token
+    # starts where one of the following slices starts one too, from there on both agree
+    source = state.source
+    cuts = line_cuts(source, jobs * CHUNKS_PER_JOB) if len(source) >= MIN_SOURCE else []
+
+    if len(cuts) < 2:
+        yield from match_tokens(source, state.lines)
+        return
+
+    newline = "\n" if isinstance(source, str) else b"\n"
+    stops = cuts[1:] + [len(source)]
+
+    # slices of a mapped source are bytes
+    slices = [source[start:stop] for start, stop in zip(cuts, stops)]
+    lines = [0]
+
+    for chunk in slices[:-1]:
+        lines.append(lines[-1] + chunk.count(newline))
+
+    # the pool takes longer to import than a small compile, so only when it is used
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        chunks = executor.map(match_chunk, slices, cuts, lines)
+
+        instrument.count("lex", "chunks", len(cuts))
+
+        # the matcher run here, where it started and the next token it matched
+        rematch = None
+        restart = 0
+        token = None
+
+        for stop, (kinds, starts, ends, linenos, columns) in zip(stops, chunks):
+            if rematch is not None:
+                while token is not None and token[1] < stop:
+                    first = bisect_left(starts, token[1])
+
+                    if first < len(starts) and starts[first] == token[1]:
+                        break
+
+                    yield token
+                    token = next(rematch, None)
+
+                else:
+                    if token is not None:
+                        # the whole slice was matched here
+                        continue
+
+                    # a comment or string that runs to the end of the source
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    instrument.count("lex", "rematched", len(source) - restart)
+                    return
+
+                instrument.count("lex", "rematched", token[1] - restart)
+                rematch = None
+
+                if first:
+                    kinds, starts, ends, linenos, columns = kinds[first:], starts[first:], ends[first:], linenos[first:], columns[first:]
+
+            kinds = map(MATCH_KINDS.__getitem__, kinds)
+
+            if not ends or ends[-1] != stop or stop == len(source):
+                yield from zip(kinds, starts, ends, linenos, columns)
+                continue
+
+            yield from zip(kinds, starts[:-1], ends[:-1], linenos[:-1], columns[:-1])
+
+            restart = starts[-1]
+            rematch = match_tokens(source, state.lines, restart)
+            token = next(rematch, None)
+
+
+def parse_chunk(filename: str, tokens: list):
+    # (statements, reductions) of a run of declarations, None if it has syntax errors
+    state = ParserState(filename, "", Diagnostics(0, "json"))
+
+    ast = _parser.parser.parse(tokens_of(tokens), state)
+
+    if ast is None or state.diagnostics.errors:
+        return None
+
+    return ast.statements, _parser.parser.driver.reductions
+
+
+def tokens_of(tokens: list):
+    return (Token(name, value, SourcePosition(0, line, column)) for name, value, line, column in tokens)
+
+
+def parse_parallel(state: ParserState, engine: str, parser: Parser, jobs: int, lexJobs: int = 1):
+    # state.source parsed as runs of top-level declarations in jobs processes, merged in order.
+    # The file is lexed here in one go, as the lexer classifies typedef names with everything
+    # declared before, so each run gets the TYPEDIDENT tokens the serial parse would see.
+    # An input that can not be split or that has errors is parsed here in one piece from the
+    # same tokens; callers only come here for inputs of at least MIN_PARSE_SOURCE chars
+    scratch = ParserState(state.filename, state.source, Diagnostics(0, "json"))
+
+    with instrument.measure("lex"):
+        tokens = [
+            (token.name, token.value, token.source_pos.lineno, token.source_pos.colno)
+            for token in instrument.timed("lex", tokenize(scratch, engine, lexJobs), "tokens")
+        ]
+
+    chunks = [] if scratch.diagnostics.errors else split([token[0] for token in tokens], jobs * CHUNKS_PER_JOB)
+    results = None
+
+    if len(chunks) > 1:
+        # the pool takes longer to import than a small compile, so only when it is used
+        from concurrent.futures import ProcessPoolExecutor
+
+        with instrument.measure("parse"):
+            try:
+                with ProcessPoolExecutor(max_workers=jobs, initializer=_parser.init_worker, initargs=(parser.driverName,)) as executor:
+                    results = list(executor.map(parse_chunk, repeat(state.filename), [tokens[start:stop] for start, stop in chunks]))
+
+            except Exception:
+                # a worker that died or a result that could not be sent back
+                results = None
+
+    if results is None or None in results:
+        return parse_serial(state, parser, tokens, scratch.diagnostics.errors)
+
+    ast = None
+
+    # the runs' statements end up in one BlockNode, as in the serial parse
+    for statements, reductions in results:
+        if ast is None:
+            ast = BlockNode(statements[0], statements[0].position)
+            statements = statements[1:]
+
+        for statement in statements:
+            ast.add(statement)
+
+        instrument.count("parse", "reductions", reductions)
+
+    instrument.count("parse", "chunks", len(chunks))
+    instrument.count_nodes(ast)
+
+    return ast
+
+
+def parse_serial(state: ParserState, parser: Parser, tokens: list, errors: list):
+    # the tokens of parse_parallel parsed in one piece. Lexer errors are reported first,
+    # as with the buffer lexer, then the parser reports its own with the usual recovery
+    for error in errors:
+        error.lines = state.lines
+        error.diagnostics = state.diagnostics
+        error.raiseError()
+
+    with instrument.measure("parse"):
+        ast = parser.parse(tokens_of(tokens), state)
+
+    instrument.count("parse", "reductions", parser.driver.reductions)
+    instrument.count_nodes(ast)
+
+    return ast
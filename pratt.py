@@ -0,0 +1,502 @@
+from rply.parsergenerator import LRTable
+from rply.utils import Counter
+
+from astree import *
+from lrparser import CompiledLRParser
+from source import Token
+
+
+# productions of the expression grammar in _parser.py the hand-written parser mirrors;
+# a shift into a state whose items all belong to these starts an expression
+EXPRESSIONS = {
+    "assgn-expr", "assgn-op", "cond-expr", "binary-expr", "cast-expr",
+    "unary-expr", "unary-op", "postfix-expr", "primary-expr",
+}
+
+ASSIGNMENT_OPERATORS = {"=", "*=", "/=", "%=", "+=", "-=", ">>=", "<<=", "&=", "^=", "OREQ"}
+UNARY_OPERATORS = {"&", "*", "+", "-", "~", "!"}
+POSTFIX_OPERATORS = {"[", "(", ".", "->", "++", "--"}
+PRIMARY = {"IDENTIFIER", "CONSTANT", "STRING"}
+
+# sub-expressions nested deeper than this are left to the tables, which do not recurse;
+# a level takes up to about 18 frames, this stays well below the default recursion limit
+MAX_DEPTH = 32
+
+
+class Backtrack(Exception):
+    # input the expression parser leaves to the tables: compound literals, syntax errors
+    pass
+
+
+class Replay:
+    # tokens handed back in front of the rest of the input; handing more back to a
+    # Replay adds to it instead of nesting iterators
+    def __init__(self, tokenizer) -> None:
+        self.tokenizer = tokenizer
+        self.tokens = []
+
+    @classmethod
+    def of(cls, tokens: list, tokenizer):
+        if not tokens:
+            return tokenizer
+
+        if not isinstance(tokenizer, cls):
+            tokenizer = cls(tokenizer)
+
+        tokenizer.tokens.extend(reversed(tokens))
+
+        return tokenizer
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Token:
+        if self.tokens:
+            return self.tokens.pop()
+
+        return next(self.tokenizer)
+
+
+class TokenStream:
+    # tokens pulled by one expression parse, kept so they can be handed back to the tables
+    def __init__(self, lookahead: Token, tokenizer) -> None:
+        self.tokenizer = tokenizer
+        self.token = lookahead
+        self.pulled = []
+        self.peeked = None
+        self.depth = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Token:
+        if self.peeked is not None:
+            token, self.peeked = self.peeked, None
+
+            return token
+
+        token = next(self.tokenizer, None)
+
+        if token is None:
+            return Token("$end", "$end")
+
+        self.pulled.append(token)
+
+        return token
+
+    def advance(self) -> None:
+        # next(self), spelled out as it runs for every token
+        if self.peeked is not None:
+            self.token, self.peeked = self.peeked, None
+            return
+
+        token = next(self.tokenizer, None)
+
+        if token is None:
+            token = Token("$end", "$end")
+
+        else:
+            self.pulled.append(token)
+
+        self.token = token
+
+    def peek(self) -> Token:
+        if self.peeked is None:
+            self.peeked = next(self)
+
+        return self.peeked
+
+    def replay(self):
+        # the input as it was before the parse, less the first token
+        return Replay.of(self.pulled, self.tokenizer)
+
+    def rest(self):
+        # the input after the current token
+        return Replay.of([self.peeked] if self.peeked is not None else [], self.tokenizer)
+
+
+class PrattLRParser(CompiledLRParser):
+    # the compiled driver with a hand-written precedence climbing parser for expressions:
+    # at every shift that starts an assgn-expr or cond-expr the expression is parsed
+    # directly, type names inside it run on the tables again. Anything it does not
+    # handle is backtracked and parsed by the tables, so errors and recovery are the same
+    def __init__(self, lr_table, error_handler) -> None:
+        super().__init__(lr_table, error_handler)
+
+        grammar = lr_table.grammar
+
+        # binary operator -> (level, level of its right operand)
+        self.operators = {}
+
+        for production in grammar.productions:
+            if production.name == "binary-expr" and len(production.prod) == 3:
+                assoc, level = grammar.precedence[production.prod[1]]
+                self.operators[production.prod[1]] = (level, level + 1 if assoc == "left" else level)
+
+        self.typeStart = set(grammar.first["type-name"])
+        self.typeName = self.nonterminals["type-name"]
+
+        # state in which a type name is parsed for casts and sizeof
+        self.typeBase = None
+
+        self.findEntries()
+
+    def findEntries(self) -> None:
+        grammar = self.lr_table.grammar
+        actions = self.lr_table.lr_action
+        gotos = self.lr_table.lr_goto
+
+        # the item sets are not part of the cached tables and are cheap to rebuild, but rply
+        # numbers them in set iteration order, which changes with the hash seed; so they are
+        # rebuilt along the transitions of the tables, which gives them the tables' numbers
+        addCount = Counter()
+        gotoCache = {}
+
+        items = [None] * len(actions)
+        items[0] = LRTable.lr0_closure([grammar.productions[0].lr_next], addCount)
+        pending = [0]
+
+        while pending:
+            state = pending.pop()
+
+            for symbol in {item.lr_next.lr_before for item in items[state] if item.lr_next}:
+                target = actions[state].get(symbol) or gotos[state].get(symbol)
+
+                # shifts that precedence turned into reductions lead nowhere
+                if target is None or target <= 0 or items[target] is not None:
+                    continue
+
+                items[target] = LRTable.lr0_goto(items[state], symbol, addCount, gotoCache)
+                pending.append(target)
+
+        if None in items:
+            return
+
+        kernels = [{item.name for item in state if item.lr_index} for state in items]
+
+        passthrough = next(-p.number for p in grammar.productions if p.name == "assgn-expr" and p.prod == ["cond-expr"])
+
+        for state, targets in enumerate(gotos):
+            if "assgn-expr" in targets:
+                # a cond-expr here must only ever become an assgn-expr
+                after = targets["cond-expr"]
+
+                if self.defaults[after] != passthrough and set(actions[after].values()) != {passthrough}:
+                    continue
+
+                entry = (self.nonterminals["assgn-expr"], True)
+
+            elif "cond-expr" in targets:
+                entry = (self.nonterminals["cond-expr"], False)
+
+            else:
+                continue
+
+            for name in grammar.first["assgn-expr"]:
+                t = actions[state].get(name)
+
+                if t is None or t <= 0 or not kernels[t] <= EXPRESSIONS:
+                    continue
+
+                self.entries[state * self.width + self.kinds[name]] = entry
+
+                if name == "(" and self.typeBase is None and "type-name" in gotos[t]:
+                    self.typeBase = t
+
+    def enter(self, entry: tuple, lookahead: Token, tokenizer, statestack: list, state):
+        # (value, lookahead, tokenizer, tokens consumed) of the expression at lookahead,
+        # value is None and the tokens are put back if the tables have to parse it
+        nonterminal, assignment = entry
+
+        # replayed tokens are used up, go back to the plain input
+        if isinstance(tokenizer, Replay) and not tokenizer.tokens:
+            tokenizer = tokenizer.tokenizer
+
+        stream = TokenStream(lookahead, tokenizer)
+
+        try:
+            value = self.assignment(stream, state) if assignment else self.conditional(stream, state)
+
+            # a syntax error right after the expression is left to the tables as well, so
+            # recovery unwinds the same stack as without this parser
+            if not self.viable(statestack, nonterminal, stream.token):
+                raise Backtrack()
+
+        except Backtrack:
+            return None, lookahead, stream.replay(), 0
+
+        return value, stream.token, stream.rest(), len(stream.pulled)
+
+    def viable(self, statestack: list, nonterminal: int, lookahead: Token) -> bool:
+        # whether the tables shift lookahead after nonterminal, running the reductions
+        # in between on a copy of the part of the stack they touch
+        kind = self.kinds.get(lookahead.name)
+
+        if kind is None:
+            return False
+
+        # statestack[:depth] below the states in stack
+        depth = len(statestack)
+        stack = [self.goto[statestack[-1] * self.gotoWidth + nonterminal]]
+
+        while True:
+            current = stack[-1]
+            t = self.defaults[current] or self.action[current * self.width + kind]
+
+            if t is None:
+                return False
+
+            if t >= 0:
+                return True
+
+            _, length, reduced = self.productions[-t]
+
+            if length <= len(stack):
+                del stack[len(stack) - length:]
+
+            else:
+                depth -= length - len(stack)
+                stack = []
+
+            below = stack[-1] if stack else statestack[depth - 1]
+            stack.append(self.goto[below * self.gotoWidth + reduced])
+
+    # ------------------------------------------------
+    # expressions, building the same nodes as the productions in _parser.py
+    # ------------------------------------------------
+    def nested(self, stream: TokenStream, parse, state) -> Node:
+        # a sub-expression one level further in
+        if stream.depth == MAX_DEPTH:
+            raise Backtrack()
+
+        stream.depth += 1
+        node = parse(stream, state)
+        stream.depth -= 1
+
+        return node
+
+    def expect(self, stream: TokenStream, name: str) -> None:
+        if stream.token.name != name:
+            raise Backtrack()
+
+        stream.advance()
+
+    def expression(self, stream: TokenStream, state) -> ListNode:
+        # expr and argument-expression-list
+        first = self.assignment(stream, state)
+        node = ListNode(first, ",", first.getsourcepos())
+
+        while stream.token.name == ",":
+            stream.advance()
+            node.add(self.assignment(stream, state))
+
+        return node
+
+    def assignment(self, stream: TokenStream, state) -> Node:
+        left = self.conditional(stream, state)
+
+        if stream.token.name not in ASSIGNMENT_OPERATORS:
+            return left
+
+        # only a unary-expr can be assigned to
+        if isinstance(left, (BinaryOpNode, CastNode, ConditionalNode)):
+            raise Backtrack()
+
+        operator = stream.token.getstr()
+        stream.advance()
+
+        return BinaryOpNode(operator, left, self.nested(stream, self.assignment, state), left.getsourcepos())
+
+    def conditional(self, stream: TokenStream, state) -> Node:
+        condition = self.binary(stream, state, 0)
+
+        if stream.token.name != "?":
+            return condition
+
+        stream.advance()
+        then = self.nested(stream, self.expression, state)
+        self.expect(stream, "DDOT")
+
+        return ConditionalNode(condition, then, self.nested(stream, self.conditional, state), condition.getsourcepos())
+
+    def binary(self, stream: TokenStream, state, level: int) -> Node:
+        left = self.cast(stream, state)
+
+        while True:
+            operator = stream.token
+            binding = self.operators.get(operator.name)
+
+            if binding is None or binding[0] < level:
+                return left
+
+            stream.advance()
+            right = self.binary(stream, state, binding[1])
+
+            left = BinaryOpNode(operator.getstr(), left, right, left.getsourcepos())
+
+    def cast(self, stream: TokenStream, state) -> Node:
+        token = stream.token
+
+        # most operands are a bare identifier or constant
+        if token.name in PRIMARY:
+            stream.advance()
+            node = ValueNode(None, token.getstr(), token.getsourcepos())
+
+            return self.postfix(stream, state, node) if stream.token.name in POSTFIX_OPERATORS else node
+
+        if token.name != "(" or stream.peek().name not in self.typeStart:
+            return self.unary(stream, state)
+
+        stream.advance()
+        typeName = self.type(stream, state)
+
+        return CastNode(typeName, self.nested(stream, self.cast, state), token.getsourcepos())
+
+    def unary(self, stream: TokenStream, state) -> Node:
+        token = stream.token
+
+        if token.name in UNARY_OPERATORS:
+            stream.advance()
+
+            return UnaryOpNode(token.getstr(), self.nested(stream, self.cast, state), token.getsourcepos())
+
+        if token.name == "SIZEOF":
+            stream.advance()
+
+            if stream.token.name == "(" and stream.peek().name in self.typeStart:
+                stream.advance()
+
+                return SizeOfNode(self.type(stream, state), token.getsourcepos())
+
+            return SizeOfNode(self.nested(stream, self.unary, state), token.getsourcepos())
+
+        return self.postfix(stream, state, self.primary(stream, state))
+
+    def postfix(self, stream: TokenStream, state, node: Node) -> Node:
+        while True:
+            token = stream.token
+            name = token.name
+
+            if name == "[":
+                stream.advance()
+                index = self.nested(stream, self.expression, state)
+                self.expect(stream, "]")
+
+                node = ArrayAccessNode(node, index, node.getsourcepos())
+
+            elif name == "(":
+                stream.advance()
+                arguments = EMPTY if stream.token.name == ")" else self.nested(stream, self.expression, state)
+                self.expect(stream, ")")
+
+                node = FunctionCallNode(node, arguments, node.getsourcepos())
+
+            elif name == "." or name == "->":
+                stream.advance()
+
+                if stream.token.name != "IDENTIFIER":
+                    raise Backtrack()
+
+                attribute = AttributeNode if name == "." else AttributeArrowNode
+                node = attribute(node, stream.token.getstr(), node.getsourcepos())
+
+                stream.advance()
+
+            elif name == "++" or name == "--":
+                stream.advance()
+
+                node = CombinationNode(node, leaf(token), node.getsourcepos())
+
+            else:
+                return node
+
+    def primary(self, stream: TokenStream, state) -> Node:
+        token = stream.token
+
+        if token.name in PRIMARY:
+            stream.advance()
+
+            return ValueNode(None, token.getstr(), token.getsourcepos())
+
+        if token.name != "(":
+            raise Backtrack()
+
+        stream.advance()
+
+        if stream.token.name in self.typeStart:
+            raise Backtrack()
+
+        node = self.nested(stream, self.expression, state)
+        self.expect(stream, ")")
+
+        return node
+
+    def type(self, stream: TokenStream, state) -> Node:
+        # "type-name )" after the "(" of a cast or sizeof, on the tables
+        if self.typeBase is None:
+            raise Backtrack()
+
+        value, stream.token = self.reduceTo(self.typeBase, self.typeName, stream.token, stream, state)
+        self.expect(stream, ")")
+
+        # a compound literal, postfix-expr : ( type-name ) { initalizer-list }
+        if stream.token.name == "{":
+            raise Backtrack()
+
+        return value
+
+    def reduceTo(self, base: int, nonterminal: int, lookahead: Token, tokenizer, state):
+        # runs the tables from state base until nonterminal is reduced right on top of it,
+        # returns its value and the lookahead; errors backtrack instead of being reported
+        action = self.action
+        goto = self.goto
+        width = self.width
+        gotoWidth = self.gotoWidth
+        defaults = self.defaults
+        productions = self.productions
+        kinds = self.kinds.get
+
+        statestack = [base]
+        symstack = [None]
+
+        current = base
+        kind = kinds(lookahead.name)
+
+        while True:
+            t = defaults[current]
+
+            if not t:
+                if lookahead is None:
+                    lookahead = next(tokenizer)
+                    kind = kinds(lookahead.name)
+
+                t = action[current * width + kind] if kind is not None else None
+
+                if not t:
+                    raise Backtrack()
+
+                if t > 0:
+                    statestack.append(t)
+                    symstack.append(lookahead)
+                    current = t
+                    lookahead = None
+                    continue
+
+            func, length, reduced = productions[-t]
+
+            if length:
+                args = symstack[-length:]
+                del symstack[-length:]
+                del statestack[-length:]
+
+            else:
+                args = []
+
+            value = func(args) if state is None else func(state, args)
+
+            if reduced == nonterminal and len(statestack) == 1:
+                return value, next(tokenizer) if lookahead is None else lookahead
+
+            current = goto[statestack[-1] * gotoWidth + reduced]
+            statestack.append(current)
+            symstack.append(value)
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+
+
+# prebuilt tables are shipped next to the sources: rply's tables keyed by the grammar hash
+# (see tablecache.py) and a generated module the compiled driver runs without rply
+TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tables")
+
+MODULE = "prism_tables"
+
+# bump when the layout of the generated module changes
+FORMAT = 1
+
+
+class Production:
+    # the parts of rply's Production the drivers and the production profile use
+    __slots__ = ("name", "prod", "func", "precedence", "number")
+
+    def __init__(self, name: str, prod: list, func, precedence: str, number: int) -> None:
+        self.name = name
+        self.prod = prod
+        self.func = func
+        self.precedence = precedence
+        self.number = number
+
+    def __repr__(self) -> str:
+        return f"Production({self.name} : {' '.join(self.prod)})"
+
+
+class Rules:
+    # the grammar _parser.py declares, through the same decorators as rply's ParserGenerator;
+    # productions are numbered like rply's Grammar, 0 is the augmented start production
+    def __init__(self, tokens: list, precedence: list = None) -> None:
+        self.tokens = tokens
+        self.precedence = precedence or []
+        self.productions = [Production("S'", [], None, None, 0)]
+        self.error_handler = None
+
+    def production(self, rule: str, precedence: str = None):
+        name, colon, *body = rule.split()
+
+        if colon != ":":
+            raise ValueError(f"Expecting : in {rule!r}")
+
+        def inner(func):
+            for syms in " ".join(body).split("|"):
+                # the first production names the start symbol
+                if len(self.productions) == 1:
+                    self.productions[0].prod = [name]
+
+                self.productions.append(Production(name, syms.split(), func, precedence, len(self.productions)))
+
+            return func
+
+        return inner
+
+    def error(self, func):
+        self.error_handler = func
+
+        return func
+
+    def signature(self) -> list:
+        # everything the tables depend on, stored in the generated module to tell if it is current
+        return [
+            FORMAT,
+            list(self.tokens),
+            [[assoc, list(terms)] for assoc, terms in self.precedence],
+            [f"{p.name} : {' '.join(p.prod)}" for p in self.productions[1:]],
+        ]
+
+    def generator(self, cache_dir: str = TABLE_DIR):
+        # rply's generator for the same grammar, builds (or loads) the full tables
+        from tablecache import CachedParserGenerator
+
+        pg = CachedParserGenerator(self.tokens, self.precedence, cache_dir=cache_dir)
+
+        for p in self.productions[1:]:
+            pg.productions.append((p.name, p.prod, p.func, p.precedence))
+
+        pg.error_handler = self.error_handler
+
+        return pg
+
+
+def module_path(cache_dir: str = TABLE_DIR) -> str:
+    return os.path.join(cache_dir, MODULE + ".py")
+
+
+def load_tables(rules: Rules, cache_dir: str = TABLE_DIR):
+    # the generated module if it was built from exactly this grammar, None otherwise
+    path = module_path(cache_dir)
+
+    if not os.path.exists(path):
+        return None
+
+    try:
+        spec = importlib.util.spec_from_file_location(MODULE, path)
+        tables = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(tables)
+
+    except Exception:
+        # a broken module is rebuilt like a stale one
+        return None
+
+    if getattr(tables, "SIGNATURE", None) != rules.signature():
+        return None
+
+    return tables
+
+
+def store_tables(rules: Rules, driver, cache_dir: str = TABLE_DIR) -> None:
+    # writes the flat tables of a CompiledLRParser as a module, the reduce actions stay in
+    # _parser.py and are matched up by production number
+    import pprint
+    import tempfile
+
+    def rows(table: list, width: int) -> list:
+        # one line per state, "." for an error; a list literal of this size takes longer to
+        # compile than the rest of the startup wherever no bytecode cache gets written
+        cells = ["." if t is None else str(t) for t in table]
+
+        return [" ".join(cells[i:i + width]) for i in range(0, len(cells), width)]
+
+    lines = [
+        "# generated by prebuilt.py from the grammar in _parser.py, do not edit",
+        "# rebuilt whenever the grammar changes, or with: python tablecache.py",
+        "",
+        "",
+        "def table(text):",
+        "    return [None if t == \".\" else int(t) for t in text.split()]",
+        "",
+        "",
+        f"SIGNATURE = {pprint.pformat(rules.signature(), width=120, compact=True)}",
+        "",
+        f"KINDS = {pprint.pformat(driver.kinds, width=120, compact=True, sort_dicts=False)}",
+        "",
+        f"NONTERMINALS = {pprint.pformat(driver.nonterminals, width=120, compact=True, sort_dicts=False)}",
+        "",
+        f"DEFAULTS = {pprint.pformat(driver.defaults, width=120, compact=True)}",
+        "",
+        "# state * len(KINDS) + kind -> shift to state (> 0), reduce by production (< 0), accept (0) or error (None)",
+        "ACTION = table(\"\"\"",
+        *rows(driver.action, driver.width),
+        "\"\"\")",
+        "",
+        "# state * len(NONTERMINALS) + nonterminal -> state",
+        "GOTO = table(\"\"\"",
+        *rows(driver.goto, driver.gotoWidth),
+        "\"\"\")",
+        "",
+    ]
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False, mode="w", suffix=".py") as file:
+            file.write("\n".join(lines))
+
+        os.chmod(file.name, 0o644)
+        os.replace(file.name, module_path(cache_dir))
+
+    except OSError:
+        # read-only installs keep running the full tables
+        pass
@@ -1,48 +1,45 @@
 import os
+from typing import Generator
 
+from source import split_lines
 
-def preprocess(source: str):
-    idx = 0
-    INCLUDE_PATHS = []
-    included = True
 
-    while included:
-        included = False
+def expand(source: str, included: set = None) -> Generator[str, None, None]:
+    # paths already in included are skipped, newly included paths are added to it
+    INCLUDE_PATHS = set() if included is None else included
 
-        for line in source.splitlines(True):
-            length = len(line)
+    # one line iterator per file that is currently being expanded
+    stack = [split_lines(source)]
 
+    while stack:
+        for line in stack[-1]:
             if line.strip().startswith("include"):
-                included = True
                 path = line.replace("include", "").strip()
 
                 print("INCLUDE PATH:", path)
 
                 if path in INCLUDE_PATHS:
                     print("FILE ALREADY INCLUDED")
-                    source = source[:idx] + source[idx + length:]
-                    break
 
-                else:
-                    if os.path.isfile(path):
-                        with open(path, "r") as file:
-                            include_source = file.read()
+                elif os.path.isfile(path):
+                    with open(path, "r") as file:
+                        include_source = file.read()
 
-                        source = source[:idx] + include_source + source[idx + length:]
+                    INCLUDE_PATHS.add(path)
+                    stack.append(split_lines(include_source))
+                    break
 
-                        INCLUDE_PATHS.append(path)
-                        idx = 0
-                        break
+                else:
+                    print("PATH DOES NOT EXIST")
+                    yield line
 
-                    else:
-                        print("PATH DOES NOT EXIST")
+            else:
+                yield line
 
-            idx += length
+        else:
+            # file exhausted, continue with the file that included it
+            stack.pop()
 
-    print("----------")
-    print("----------")
-    print(source)
-    print("----------")
-    print("----------")
 
-    return source
+def preprocess(source: str, included: set = None) -> str:
+    return "".join(expand(source, included))
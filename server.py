@@ -0,0 +1,127 @@
+import contextlib
+import io
+import json
+import os
+import sys
+from typing import TextIO
+
+from _parser import Parser
+from compiler import compile_source
+from errors import Diagnostics, ErrorExit
+from lexer import TOKENTYPES
+
+
+# requests and responses are JSON objects, one per line:
+#   {"id": 1, "source": "int x;", "filename": "x.c"}   or   {"id": 2, "path": "x.c"}
+#   {"id": 1, "ok": true, "code": "int x ;"}
+#   {"id": 2, "ok": false, "log": "...", "error": {"type": ..., "file": ..., "line": ..., "column": ..., "message": ...},
+#    "errors": [...]}
+# a request may set "max_errors" (default 20, 0 for no limit)
+
+
+def handle(request: dict, parser: Parser, engine: str = "regex") -> dict:
+    response = {"id": request.get("id"), "ok": False}
+
+    log = io.StringIO()
+
+    with contextlib.redirect_stdout(log):
+        try:
+            if "source" in request:
+                source = request["source"]
+                filename = request.get("filename", "<source>")
+
+            else:
+                filename = request["path"]
+
+                with open(filename, "r") as file:
+                    source = file.read()
+
+            diagnostics = Diagnostics(request.get("max_errors", 20))
+
+            ast = compile_source(source, filename, request.get("lexer", engine), parser, diagnostics=diagnostics)
+
+            response["code"] = ast.clang()
+            response["ok"] = True
+
+        except ErrorExit as e:
+            response["error"] = e.error.asdict()
+            response["errors"] = [error.asdict() for error in e.errors]
+
+        except Exception as e:
+            response["error"] = {"type": e.__class__.__name__, "message": str(e)}
+
+    response["log"] = log.getvalue()
+
+    return response
+
+
+def serve(instream: TextIO, outstream: TextIO, parser: Parser, engine: str = "regex") -> None:
+    for line in instream:
+        if not line.strip():
+            continue
+
+        try:
+            request = json.loads(line)
+
+        except ValueError as e:
+            response = {"id": None, "ok": False, "error": {"type": "InvalidRequest", "message": str(e)}}
+
+        else:
+            if isinstance(request, dict):
+                response = handle(request, parser, engine)
+
+            else:
+                message = f"expected a JSON object, got {type(request).__name__}"
+                response = {"id": None, "ok": False, "error": {"type": "InvalidRequest", "message": message}}
+
+        outstream.write(json.dumps(response) + "\n")
+        outstream.flush()
+
+
+def serve_stdio(engine: str = "regex", driver: str = "compiled") -> None:
+    serve(sys.stdin, sys.stdout, Parser(TOKENTYPES, driver=driver), engine)
+
+
+def remove_stale_socket(path: str) -> None:
+    # a socket left behind by a server that is gone is removed, anything else stays
+    import socket
+    import stat
+
+    if not os.path.lexists(path):
+        return
+
+    if not stat.S_ISSOCK(os.lstat(path).st_mode):
+        raise FileExistsError(f"{path} exists and is not a socket")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(path)
+
+        except OSError:
+            os.remove(path)
+            return
+
+    raise FileExistsError(f"a server is already listening on {path}")
+
+
+def serve_socket(path: str, engine: str = "regex", driver: str = "compiled") -> None:
+    import socketserver
+
+    remove_stale_socket(path)
+
+    parser = Parser(TOKENTYPES, driver=driver)
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            instream = io.TextIOWrapper(self.rfile, encoding="utf-8")
+            outstream = io.TextIOWrapper(self.wfile, encoding="utf-8", write_through=True)
+
+            serve(instream, outstream, parser, engine)
+
+    # connections are served one after another, log capture redirects the process wide stdout
+    with socketserver.UnixStreamServer(path, Handler) as server:
+        try:
+            server.serve_forever()
+
+        finally:
+            os.remove(path)
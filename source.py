@@ -0,0 +1,129 @@
+import mmap
+import os
+from array import array
+from bisect import bisect_right
+
+
+class SourceFile:
+    # read-only memory map of a source file, the lexer scans the mapped bytes in place
+    # and only the text of single tokens and lines gets decoded
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+        with open(path, "rb") as file:
+            # empty files can not be mapped
+            if os.fstat(file.fileno()).st_size:
+                self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            else:
+                self.data = b""
+
+    def close(self) -> None:
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def split_lines(source):
+    # like str.splitlines(True) but also for bytes and memory maps, without a full copy
+    if isinstance(source, str):
+        yield from source.splitlines(True)
+        return
+
+    start = 0
+    end = len(source)
+
+    while start < end:
+        stop = source.find(b"\n", start)
+        stop = end if stop == -1 else stop + 1
+
+        yield source[start:stop].decode()
+
+        start = stop
+
+
+class LineIndex:
+    # offsets of every line start, built once per file with a single scan for newlines;
+    # offset -> line is a binary search and line -> text a slice of the source
+    def __init__(self, source) -> None:
+        self.source = source
+        self.newline = "\n" if isinstance(source, str) else b"\n"
+
+        self.starts = array("q", [0])
+
+        find = source.find
+        newline = self.newline
+        pos = find(newline)
+
+        while pos != -1:
+            self.starts.append(pos + 1)
+            pos = find(newline, pos + 1)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def lineno(self, offset: int) -> int:
+        return bisect_right(self.starts, offset) - 1
+
+    def column(self, offset: int) -> int:
+        return offset - self.starts[self.lineno(offset)]
+
+    def line(self, lineno: int) -> str:
+        if not 0 <= lineno < len(self.starts):
+            return ""
+
+        start = self.starts[lineno]
+        stop = self.starts[lineno + 1] - 1 if lineno + 1 < len(self.starts) else len(self.source)
+
+        line = self.source[start:stop]
+
+        if not isinstance(line, str):
+            line = line.decode(errors="replace")
+
+        return line.rstrip("\r")
+
+
+class SourcePosition:
+    # same interface as rply's, which the lexer and parser used before; importing rply.token
+    # loads the whole rply package including its parser generator
+    __slots__ = ("idx", "lineno", "colno")
+
+    def __init__(self, idx: int, lineno: int, colno: int) -> None:
+        self.idx = idx
+        self.lineno = lineno
+        self.colno = colno
+
+    def __repr__(self) -> str:
+        return f"SourcePosition(idx={self.idx}, lineno={self.lineno}, colno={self.colno})"
+
+
+class Token:
+    __slots__ = ("name", "value", "source_pos")
+
+    def __init__(self, name: str, value: str, source_pos: SourcePosition = None) -> None:
+        self.name = name
+        self.value = value
+        self.source_pos = source_pos
+
+    def __repr__(self) -> str:
+        return f"Token({self.name!r}, {self.value!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Token):
+            return NotImplemented
+
+        return self.name == other.name and self.value == other.value
+
+    def gettokentype(self) -> str:
+        return self.name
+
+    def getsourcepos(self) -> SourcePosition:
+        return self.source_pos
+
+    def getstr(self) -> str:
+        return self.value
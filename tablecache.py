@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import warnings
+
+from rply import ParserGenerator
+from rply.errors import ParserGeneratorWarning, ParsingError
+from rply.grammar import Grammar
+from rply.parser import LRParser
+from rply.parsergenerator import LRTable
+
+from lrparser import QUIET_TOKENS, SYNC_TOKENS
+from prebuilt import TABLE_DIR
+from source import Token
+
+
+class RecoveringLRParser(LRParser):
+    # rply's LR driver, except that an error handler which returns (instead of raising)
+    # makes the parser recover and continue, so one run can report several errors
+    def parse(self, tokenizer, state=None):
+        lookahead = None
+        lookaheadstack = []
+
+        statestack = [0]
+        symstack = [Token("$end", "$end")]
+
+        quiet = 0
+
+        # read by the instrumentation after a parse
+        self.reductions = 0
+
+        current_state = 0
+        while True:
+            if self.lr_table.default_reductions[current_state]:
+                t = self.lr_table.default_reductions[current_state]
+                current_state = self._reduce_production(t, symstack, statestack, state)
+                self.reductions += 1
+                continue
+
+            if lookahead is None:
+                if lookaheadstack:
+                    lookahead = lookaheadstack.pop()
+                else:
+                    lookahead = next(tokenizer, None)
+
+                if lookahead is None:
+                    lookahead = Token("$end", "$end")
+
+            ltype = lookahead.gettokentype()
+            if ltype in self.lr_table.lr_action[current_state]:
+                t = self.lr_table.lr_action[current_state][ltype]
+                if t > 0:
+                    statestack.append(t)
+                    current_state = t
+                    symstack.append(lookahead)
+                    lookahead = None
+
+                    if quiet:
+                        quiet -= 1
+
+                    continue
+                elif t < 0:
+                    current_state = self._reduce_production(t, symstack, statestack, state)
+                    self.reductions += 1
+                    continue
+                else:
+                    n = symstack[-1]
+                    return n
+            else:
+                if self.error_handler is None:
+                    raise ParsingError(None, lookahead.getsourcepos())
+
+                if not quiet:
+                    if state is None:
+                        self.error_handler(lookahead)
+                    else:
+                        self.error_handler(state, lookahead)
+
+                lookahead = self.recover(lookahead, tokenizer, statestack, symstack)
+
+                if lookahead is None:
+                    return None
+
+                current_state = statestack[-1]
+                quiet = QUIET_TOKENS
+
+    def recover(self, lookahead, tokenizer, statestack, symstack):
+        # drop tokens through the next ";" or "}", then unwind the stack to the innermost
+        # state that shifts the token after it (any action if none does, expression states
+        # reduce on "}" because of initializer lists); None if the input ends first
+        actions = self.lr_table.lr_action
+
+        while True:
+            while lookahead.gettokentype() not in SYNC_TOKENS:
+                if lookahead.gettokentype() == "$end":
+                    return None
+
+                lookahead = next(tokenizer, None) or Token("$end", "$end")
+
+            lookahead = next(tokenizer, None) or Token("$end", "$end")
+            ltype = lookahead.gettokentype()
+
+            for shift in (True, False):
+                for i in range(len(statestack) - 1, -1, -1):
+                    action = actions[statestack[i]].get(ltype)
+
+                    if action is not None and (action > 0 or not shift):
+                        del statestack[i + 1:]
+                        del symstack[i + 1:]
+
+                        return lookahead
+
+            if ltype == "$end":
+                return None
+
+
+class CachedParserGenerator(ParserGenerator):
+    def __init__(self, tokens: list, precedence: list = None, cache_id: str = "prism", cache_dir: str = TABLE_DIR) -> None:
+        super().__init__(tokens, precedence or [], cache_id)
+        self.cache_dir = cache_dir
+
+    def grammar(self) -> Grammar:
+        g = Grammar(self.tokens)
+
+        for level, (assoc, terms) in enumerate(self.precedence, 1):
+            for term in terms:
+                g.set_precedence(term, assoc, level)
+
+        for prod_name, syms, func, precedence in self.productions:
+            g.add_production(prod_name, syms, func, precedence)
+
+        g.set_start()
+
+        return g
+
+    def cacheFile(self, g: Grammar) -> str:
+        # the hash covers start symbol, terminals, precedence and every production,
+        # so any grammar change in _parser.py selects a different file
+        return os.path.join(self.cache_dir, f"{self.cache_id}-{self.VERSION}-{self.compute_grammar_hash(g)}.json")
+
+    def loadTable(self, g: Grammar) -> LRTable | None:
+        path = self.cacheFile(g)
+
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "r") as file:
+                data = json.load(file)
+
+        except (OSError, ValueError):
+            return None
+
+        if not self.data_is_valid(g, data):
+            return None
+
+        return LRTable.from_cache(g, data)
+
+    def storeTable(self, g: Grammar, table: LRTable) -> None:
+        path = self.cacheFile(g)
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, delete=False, mode="w") as file:
+                json.dump(self.serialize_table(table), file)
+
+            os.chmod(file.name, 0o644)
+            os.replace(file.name, path)
+
+            # drop tables of older grammar revisions
+            for name in os.listdir(self.cache_dir):
+                stale = os.path.join(self.cache_dir, name)
+
+                if name.startswith(f"{self.cache_id}-") and name.endswith(".json") and stale != path:
+                    os.remove(stale)
+
+        except OSError:
+            # read-only installs simply fall back to building the tables every time
+            pass
+
+    def build(self) -> RecoveringLRParser:
+        g = self.grammar()
+
+        for unused_term in g.unused_terminals():
+            warnings.warn(f"Token {unused_term!r} is unused", ParserGeneratorWarning, stacklevel=2)
+
+        for unused_prod in g.unused_productions():
+            warnings.warn(f"Production {unused_prod!r} is not reachable", ParserGeneratorWarning, stacklevel=2)
+
+        g.build_lritems()
+        g.compute_first()
+        g.compute_follow()
+
+        table = self.loadTable(g)
+
+        if table is None:
+            table = LRTable.from_grammar(g)
+            self.storeTable(g, table)
+
+        if table.sr_conflicts:
+            warnings.warn(f"{len(table.sr_conflicts)} shift/reduce conflicts", ParserGeneratorWarning, stacklevel=2)
+
+        if table.rr_conflicts:
+            warnings.warn(f"{len(table.rr_conflicts)} reduce/reduce conflicts", ParserGeneratorWarning, stacklevel=2)
+
+        return RecoveringLRParser(table, self.error_handler)
+
+
+if __name__ == "__main__":
+    # regenerate the prebuilt tables shipped in TABLE_DIR
+    from _parser import Parser
+    from lexer import TOKENTYPES
+    from lrparser import CompiledLRParser
+    from prebuilt import module_path, store_tables
+
+    parser = Parser(TOKENTYPES, driver="generic")
+    generator = parser.pg.generator()
+
+    store_tables(parser.pg, CompiledLRParser(parser.parser.lr_table, parser.parser.error_handler))
+
+    print(generator.cacheFile(parser.grammar))
+    print(module_path())
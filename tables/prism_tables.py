@@ -0,0 +1,925 @@
+# generated by prebuilt.py from the grammar in _parser.py, do not edit
+# rebuilt whenever the grammar changes, or with: python tablecache.py
+
+
+def table(text):
+    return [None if t == "." else int(t) for t in text.split()]
+
+
+SIGNATURE = [1,
+ ['SHORT', 'INT', 'LONG', 'FLOAT', 'DOUBLE', 'CHAR', 'VOID', 'ENUM', 'STRUCT', 'UNION', 'TYPEDEF', 'CONST', 'VOLATILE',
+  'EXTERN', 'STATIC', 'REGISTER', 'SIGNED', 'UNSIGNED', 'AUTO', 'RESTRICT', 'IF', 'ELSE', 'CASE', 'DEFAULT', 'CONTINUE',
+  'BREAK', 'FOR', 'DO', 'WHILE', 'SWITCH', 'RETURN', 'SIZEOF', '-', '+', '*', '&', '~', '!', '++', '--', '*', '/', '%',
+  '+', '-', '<<', '>>', '<', '<=', '>', '>=', '==', '!=', '&', '^', 'OR', '&&', 'LOR', '=', '+=', '-=', '/=', '*=',
+  '%=', '<<=', '>>=', '&=', '^=', 'OREQ', '.', '->', '?', 'DDOT', '...', 'IDENTIFIER', 'STRING', 'CONSTANT',
+  'TYPEDIDENT', 'INLINE', '[', ']', '(', ')', '{', '}', ';', ',', 'PRAGMA'],
+ [['left', ['LOR']], ['left', ['&&']], ['left', ['OR']], ['left', ['^']], ['left', ['&']], ['left', ['==', '!=']],
+  ['left', ['<', '>', '<=', '>=']], ['left', ['<<', '>>']], ['left', ['+', '-']], ['left', ['*', '/', '%']]],
+ ['translation-unit : external-declaration', 'translation-unit : translation-unit external-declaration',
+  'external-declaration : declaration', 'external-declaration : function-definition', 'external-declaration : PRAGMA',
+  'function-definition : declaration-specifiers declarator compound-statement',
+  'declaration-specifiers : declaration-qualifier',
+  'declaration-specifiers : declaration-qualifier declaration-specifiers', 'declaration-qualifier : function-specifier',
+  'declaration-qualifier : type-qualifier', 'declaration-qualifier : type-specifier',
+  'declaration-qualifier : storage-class-specifier', 'storage-class-specifier : REGISTER',
+  'storage-class-specifier : AUTO', 'storage-class-specifier : STATIC', 'storage-class-specifier : EXTERN',
+  'storage-class-specifier : TYPEDEF', 'type-specifier : UNSIGNED', 'type-specifier : SIGNED', 'type-specifier : VOID',
+  'type-specifier : CHAR', 'type-specifier : DOUBLE', 'type-specifier : FLOAT', 'type-specifier : INT',
+  'type-specifier : LONG', 'type-specifier : SHORT', 'type-specifier : typedef-name',
+  'type-specifier : struct-or-union-specifier',
+  'struct-or-union-specifier : struct-or-union IDENTIFIER { struct-declaration-list }',
+  'struct-or-union-specifier : struct-or-union { struct-declaration-list }',
+  'struct-or-union-specifier : struct-or-union IDENTIFIER', 'struct-or-union : STRUCT', 'struct-or-union : UNION',
+  'struct-declaration-list : struct-declaration',
+  'struct-declaration-list : struct-declaration-list struct-declaration',
+  'struct-declaration : specifier-qualifier-list struct-declarator-list ;',
+  'specifier-qualifier-list : specifier-qualifier',
+  'specifier-qualifier-list : specifier-qualifier specifier-qualifier-list', 'specifier-qualifier : type-qualifier',
+  'specifier-qualifier : type-specifier', 'type-qualifier : RESTRICT', 'type-qualifier : VOLATILE',
+  'type-qualifier : CONST', 'struct-declarator-list : struct-declarator',
+  'struct-declarator-list : struct-declarator-list , struct-declarator', 'struct-declarator : declarator',
+  'struct-declarator : declarator DDOT const-expr', 'declarator : direct-declarator',
+  'declarator : pointer direct-declarator', 'pointer : *', 'pointer : * type-qualifier-list', 'pointer : * pointer',
+  'pointer : * type-qualifier-list pointer', 'type-qualifier-list : type-qualifier',
+  'type-qualifier-list : type-qualifier-list type-qualifier', 'direct-declarator : IDENTIFIER',
+  'direct-declarator : ( declarator )', 'direct-declarator : direct-declarator [ ]',
+  'direct-declarator : direct-declarator ( )', 'direct-declarator : direct-declarator ( identifier-list )',
+  'direct-declarator : direct-declarator ( parameter-type-list )', 'assgn-expr : cond-expr',
+  'assgn-expr : unary-expr assgn-op assgn-expr', 'assgn-op : OREQ', 'assgn-op : ^=', 'assgn-op : &=', 'assgn-op : <<=',
+  'assgn-op : >>=', 'assgn-op : -=', 'assgn-op : +=', 'assgn-op : %=', 'assgn-op : /=', 'assgn-op : *=', 'assgn-op : =',
+  'cond-expr : binary-expr', 'cond-expr : binary-expr ? expr DDOT cond-expr', 'binary-expr : cast-expr',
+  'binary-expr : binary-expr % binary-expr', 'binary-expr : binary-expr / binary-expr',
+  'binary-expr : binary-expr * binary-expr', 'binary-expr : binary-expr - binary-expr',
+  'binary-expr : binary-expr + binary-expr', 'binary-expr : binary-expr >> binary-expr',
+  'binary-expr : binary-expr << binary-expr', 'binary-expr : binary-expr >= binary-expr',
+  'binary-expr : binary-expr <= binary-expr', 'binary-expr : binary-expr > binary-expr',
+  'binary-expr : binary-expr < binary-expr', 'binary-expr : binary-expr != binary-expr',
+  'binary-expr : binary-expr == binary-expr', 'binary-expr : binary-expr & binary-expr',
+  'binary-expr : binary-expr ^ binary-expr', 'binary-expr : binary-expr OR binary-expr',
+  'binary-expr : binary-expr && binary-expr', 'binary-expr : binary-expr LOR binary-expr', 'cast-expr : unary-expr',
+  'cast-expr : ( type-name ) cast-expr', 'unary-expr : postfix-expr', 'unary-expr : unary-op cast-expr',
+  'unary-expr : SIZEOF unary-expr', 'unary-expr : SIZEOF ( type-name )', 'unary-op : !', 'unary-op : ~', 'unary-op : -',
+  'unary-op : +', 'unary-op : *', 'unary-op : &', 'postfix-expr : primary-expr', 'postfix-expr : postfix-expr [ expr ]',
+  'postfix-expr : postfix-expr ( )', 'postfix-expr : postfix-expr ( argument-expression-list )',
+  'postfix-expr : postfix-expr . IDENTIFIER', 'postfix-expr : postfix-expr -> IDENTIFIER',
+  'postfix-expr : postfix-expr --', 'postfix-expr : postfix-expr ++',
+  'postfix-expr : ( type-name ) { initalizer-list , }', 'postfix-expr : ( type-name ) { initalizer-list }',
+  'argument-expression-list : assgn-expr', 'argument-expression-list : argument-expression-list , assgn-expr',
+  'primary-expr : STRING', 'primary-expr : CONSTANT', 'primary-expr : IDENTIFIER', 'primary-expr : ( expr )',
+  'expr : assgn-expr', 'expr : expr , assgn-expr', 'arg-expr-list : assgn-expr',
+  'arg-expr-list : arg-expr-list , assgn-expr', 'type-name : specifier-qualifier-list',
+  'type-name : specifier-qualifier-list abstract-declarator', 'abstract-declarator : direct-abstract-declarator',
+  'abstract-declarator : pointer', 'abstract-declarator : pointer direct-abstract-declarator',
+  'direct-abstract-declarator : ( abstract-declarator )', 'direct-abstract-declarator : [ ]',
+  'direct-abstract-declarator : [ assgn-expr ]', 'direct-abstract-declarator : direct-abstract-declarator [ ]',
+  'direct-abstract-declarator : direct-abstract-declarator [ assgn-expr ]', 'direct-abstract-declarator : [ * ]',
+  'direct-abstract-declarator : direct-abstract-declarator [ * ]', 'direct-abstract-declarator : ( )',
+  'direct-abstract-declarator : ( parameter-type-list )', 'direct-abstract-declarator : direct-abstract-declarator ( )',
+  'direct-abstract-declarator : direct-abstract-declarator ( parameter-type-list )',
+  'parameter-type-list : parameter-list', 'parameter-type-list : parameter-list , ...',
+  'parameter-list : parameter-declaration', 'parameter-list : parameter-list , parameter-declaration',
+  'parameter-declaration : declaration-specifiers',
+  'parameter-declaration : declaration-specifiers abstract-declarator',
+  'parameter-declaration : declaration-specifiers declarator', 'initalizer-list : init-qualifier',
+  'initalizer-list : initalizer-list , init-qualifier', 'init-qualifier : initalizer',
+  'init-qualifier : designation initalizer', 'designation : designator-list =', 'designator-list : designator',
+  'designator-list : designator-list designator', 'designator : [ const-expr ]', 'designator : . IDENTIFIER',
+  'const-expr : cond-expr', 'initalizer : assgn-expr', 'initalizer : { initalizer-list , }',
+  'initalizer : { initalizer-list }', 'identifier-list : IDENTIFIER', 'identifier-list : identifier-list , IDENTIFIER',
+  'typedef-name : TYPEDIDENT', 'function-specifier : INLINE', 'declaration-list : declaration',
+  'declaration-list : declaration-list declaration', 'declaration : declaration-specifiers init-declarator-list ;',
+  'init-declarator-list : init-declarator', 'init-declarator-list : init-declarator-list , init-declarator',
+  'init-declarator : declarator', 'init-declarator : declarator = initalizer', 'compound-statement : { }',
+  'compound-statement : { block-item-list }', 'block-item-list : block-item',
+  'block-item-list : block-item-list block-item', 'block-item : declaration', 'block-item : statement',
+  'block-item : PRAGMA', 'statement : jump-statement', 'statement : iteration-statement',
+  'statement : selection-statement', 'statement : labeled-statement', 'statement : compound-statement',
+  'statement : expression-statement', 'expression-statement : expr ;',
+  'labeled-statement : CASE const-expr DDOT statement', 'labeled-statement : DEFAULT DDOT statement',
+  'selection-statement : IF ( expr ) statement', 'selection-statement : IF ( expr ) compound-statement ELSE statement',
+  'selection-statement : SWITCH ( expr ) statement', 'iteration-statement : WHILE ( expr ) statement',
+  'iteration-statement : DO statement WHILE ( expr ) ;',
+  'iteration-statement : FOR ( declaration expr ; expr ) statement', 'jump-statement : BREAK ;',
+  'jump-statement : CONTINUE ;', 'jump-statement : RETURN expr ;']]
+
+KINDS = {'!': 0,
+ '!=': 1,
+ '$end': 2,
+ '%': 3,
+ '%=': 4,
+ '&': 5,
+ '&&': 6,
+ '&=': 7,
+ '(': 8,
+ ')': 9,
+ '*': 10,
+ '*=': 11,
+ '+': 12,
+ '++': 13,
+ '+=': 14,
+ ',': 15,
+ '-': 16,
+ '--': 17,
+ '-=': 18,
+ '->': 19,
+ '.': 20,
+ '...': 21,
+ '/': 22,
+ '/=': 23,
+ ';': 24,
+ '<': 25,
+ '<<': 26,
+ '<<=': 27,
+ '<=': 28,
+ '=': 29,
+ '==': 30,
+ '>': 31,
+ '>=': 32,
+ '>>': 33,
+ '>>=': 34,
+ '?': 35,
+ 'AUTO': 36,
+ 'BREAK': 37,
+ 'CASE': 38,
+ 'CHAR': 39,
+ 'CONST': 40,
+ 'CONSTANT': 41,
+ 'CONTINUE': 42,
+ 'DDOT': 43,
+ 'DEFAULT': 44,
+ 'DO': 45,
+ 'DOUBLE': 46,
+ 'ELSE': 47,
+ 'ENUM': 48,
+ 'EXTERN': 49,
+ 'FLOAT': 50,
+ 'FOR': 51,
+ 'IDENTIFIER': 52,
+ 'IF': 53,
+ 'INLINE': 54,
+ 'INT': 55,
+ 'LONG': 56,
+ 'LOR': 57,
+ 'OR': 58,
+ 'OREQ': 59,
+ 'PRAGMA': 60,
+ 'REGISTER': 61,
+ 'RESTRICT': 62,
+ 'RETURN': 63,
+ 'SHORT': 64,
+ 'SIGNED': 65,
+ 'SIZEOF': 66,
+ 'STATIC': 67,
+ 'STRING': 68,
+ 'STRUCT': 69,
+ 'SWITCH': 70,
+ 'TYPEDEF': 71,
+ 'TYPEDIDENT': 72,
+ 'UNION': 73,
+ 'UNSIGNED': 74,
+ 'VOID': 75,
+ 'VOLATILE': 76,
+ 'WHILE': 77,
+ '[': 78,
+ ']': 79,
+ '^': 80,
+ '^=': 81,
+ 'error': 82,
+ '{': 83,
+ '}': 84,
+ '~': 85}
+
+NONTERMINALS = {'abstract-declarator': 0,
+ 'arg-expr-list': 1,
+ 'argument-expression-list': 2,
+ 'assgn-expr': 3,
+ 'assgn-op': 4,
+ 'binary-expr': 5,
+ 'block-item': 6,
+ 'block-item-list': 7,
+ 'cast-expr': 8,
+ 'compound-statement': 9,
+ 'cond-expr': 10,
+ 'const-expr': 11,
+ 'declaration': 12,
+ 'declaration-list': 13,
+ 'declaration-qualifier': 14,
+ 'declaration-specifiers': 15,
+ 'declarator': 16,
+ 'designation': 17,
+ 'designator': 18,
+ 'designator-list': 19,
+ 'direct-abstract-declarator': 20,
+ 'direct-declarator': 21,
+ 'expr': 22,
+ 'expression-statement': 23,
+ 'external-declaration': 24,
+ 'function-definition': 25,
+ 'function-specifier': 26,
+ 'identifier-list': 27,
+ 'init-declarator': 28,
+ 'init-declarator-list': 29,
+ 'init-qualifier': 30,
+ 'initalizer': 31,
+ 'initalizer-list': 32,
+ 'iteration-statement': 33,
+ 'jump-statement': 34,
+ 'labeled-statement': 35,
+ 'parameter-declaration': 36,
+ 'parameter-list': 37,
+ 'parameter-type-list': 38,
+ 'pointer': 39,
+ 'postfix-expr': 40,
+ 'primary-expr': 41,
+ 'selection-statement': 42,
+ 'specifier-qualifier': 43,
+ 'specifier-qualifier-list': 44,
+ 'statement': 45,
+ 'storage-class-specifier': 46,
+ 'struct-declaration': 47,
+ 'struct-declaration-list': 48,
+ 'struct-declarator': 49,
+ 'struct-declarator-list': 50,
+ 'struct-or-union': 51,
+ 'struct-or-union-specifier': 52,
+ 'translation-unit': 53,
+ 'type-name': 54,
+ 'type-qualifier': 55,
+ 'type-qualifier-list': 56,
+ 'type-specifier': 57,
+ 'typedef-name': 58,
+ 'unary-expr': 59,
+ 'unary-op': 60}
+
+DEFAULTS = [0, -166, 0, -19, -16, -43, -17, -33, -23, -11, -25, -32, -9, -18, -42, -12, -28, -41, 0, -21, -24, -1, -27, -22, -5,
+ -4, -14, -15, 0, 0, -13, -3, -26, -167, -10, -20, -2, 0, 0, -171, -56, 0, 0, 0, 0, 0, 0, -8, 0, 0, 0, -40, -34, 0, -39,
+ -6, 0, 0, -52, 0, -54, 0, -170, 0, 0, 0, 0, 0, 0, 0, -44, -35, -30, -38, -122, -108, -77, -106, -161, 0, -107, -105,
+ -62, 0, -121, -103, 0, 0, 0, 0, 0, -104, -174, -102, -120, -180, -124, -185, -177, 0, 0, 0, -181, 0, 0, -183, 0, -186,
+ 0, 0, -175, -182, -184, -187, 0, -179, 0, 0, 0, 0, -53, -55, -172, 0, -57, -58, -164, 0, -146, 0, 0, -59, 0, -29, 0, 0,
+ -36, 0, -100, 0, -114, 0, -115, 0, 0, -68, 0, -69, -64, -65, -67, -71, -73, -74, -70, -72, -66, 0, 0, 0, 0, 0, 0, 0, 0,
+ 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -99, 0, -96, 0, 0, 0, 0, -151, -153, -156, 0, 0, 0, 0, 0, 0, -188, 0, -198,
+ 0, -197, 0, -178, -176, -160, 0, -61, 0, 0, -150, 0, 0, -149, 0, -60, 0, -47, -45, 0, 0, -113, 0, -118, -110, -112,
+ -63, 0, 0, -129, 0, -123, 0, -80, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -78, 0, 0, 0, -79, 0, 0, 0, -163, 0, -157, -155, -154,
+ 0, -159, -199, 0, 0, 0, -125, 0, 0, -190, 0, 0, 0, 0, -134, 0, 0, -140, 0, 0, -147, -145, -165, 0, -109, -111, 0, -97,
+ 0, 0, 0, -152, -162, -158, 0, 0, 0, 0, 0, -189, -138, -135, -141, -133, 0, 0, -136, 0, -142, -119, 0, -76, -193, -191,
+ 0, 0, -194, 0, -139, -137, -143, -117, 0, 0, 0, 0, -116, -192, 0, -195, -196]
+
+# state * len(KINDS) + kind -> shift to state (> 0), reduce by production (< 0), accept (0) or error (None)
+ACTION = table("""
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 26 . . 19 5 . . . . . 23 . . 4 8 . . . 33 20 10 . . . 24 30 17 . 32 3 . 27 . 11 . 6 1 7 13 35 14 . . . . . . . . .
+. . . . . . . . -166 -166 -166 . . . . -166 . . . . . . . . . . . . . . . . . . . . -166 . . -166 -166 . . . . . -166 . . -166 -166 . -166 . -166 -166 -166 . . . . -166 -166 . -166 -166 . -166 . -166 . -166 -166 -166 -166 -166 -166 . -166 . . . . . . .
+. . 0 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 26 . . 19 5 . . . . . 23 . . 4 8 . . . 33 20 10 . . . 24 30 17 . 32 3 . 27 . 11 . 6 1 7 13 35 14 . . . . . . . . .
+. . . . . . . . -19 -19 -19 . . . . -19 . . . . . . . . . . . . . . . . . . . . -19 . . -19 -19 . . . . . -19 . . -19 -19 . -19 . -19 -19 -19 . . . . -19 -19 . -19 -19 . -19 . -19 . -19 -19 -19 -19 -19 -19 . -19 . . . . . . .
+. . . . . . . . -16 -16 -16 . . . . -16 . . . . . . . . . . . . . . . . . . . . -16 . . -16 -16 . . . . . -16 . . -16 -16 . -16 . -16 -16 -16 . . . . -16 -16 . -16 -16 . -16 . -16 . -16 -16 -16 -16 -16 -16 . -16 . . . . . . .
+. . . . . . . . -43 -43 -43 . . . . -43 . . . . . . . . . . . . . . . . . . . . -43 . . -43 -43 . . . . . -43 . . -43 -43 . -43 . -43 -43 -43 . . . . -43 -43 . -43 -43 . -43 . -43 . -43 -43 -43 -43 -43 -43 . -43 . . . . . . .
+. . . . . . . . -17 -17 -17 . . . . -17 . . . . . . . . . . . . . . . . . . . . -17 . . -17 -17 . . . . . -17 . . -17 -17 . -17 . -17 -17 -17 . . . . -17 -17 . -17 -17 . -17 . -17 . -17 -17 -17 -17 -17 -17 . -17 . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -33 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -33 . .
+. . . . . . . . -23 -23 -23 . . . . -23 . . . . . . . . . . . . . . . . . . . . -23 . . -23 -23 . . . . . -23 . . -23 -23 . -23 . -23 -23 -23 . . . . -23 -23 . -23 -23 . -23 . -23 . -23 -23 -23 -23 -23 -23 . -23 . . . . . . .
+. . . . . . . . -11 -11 -11 . . . . -11 . . . . . . . . . . . . . . . . . . . . -11 . . -11 -11 . . . . . -11 . . -11 -11 . -11 . -11 -11 -11 . . . . -11 -11 . -11 -11 . -11 . -11 . -11 -11 -11 -11 -11 -11 . -11 . . . . . . .
+. . . . . . . . -25 -25 -25 . . . . -25 . . . . . . . . . . . . . . . . . . . . -25 . . -25 -25 . . . . . -25 . . -25 -25 . -25 . -25 -25 -25 . . . . -25 -25 . -25 -25 . -25 . -25 . -25 -25 -25 -25 -25 -25 . -25 . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -32 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -32 . .
+. . . . . . . . -9 -9 -9 . . . . -9 . . . . . . . . . . . . . . . . . . . . -9 . . -9 -9 . . . . . -9 . . -9 -9 . -9 . -9 -9 -9 . . . . -9 -9 . -9 -9 . -9 . -9 . -9 -9 -9 -9 -9 -9 . -9 . . . . . . .
+. . . . . . . . -18 -18 -18 . . . . -18 . . . . . . . . . . . . . . . . . . . . -18 . . -18 -18 . . . . . -18 . . -18 -18 . -18 . -18 -18 -18 . . . . -18 -18 . -18 -18 . -18 . -18 . -18 -18 -18 -18 -18 -18 . -18 . . . . . . .
+. . . . . . . . -42 -42 -42 . . . . -42 . . . . . . . . . . . . . . . . . . . . -42 . . -42 -42 . . . . . -42 . . -42 -42 . -42 . -42 -42 -42 . . . . -42 -42 . -42 -42 . -42 . -42 . -42 -42 -42 -42 -42 -42 . -42 . . . . . . .
+. . . . . . . . -12 -12 -12 . . . . -12 . . . . . . . . . . . . . . . . . . . . -12 . . -12 -12 . . . . . -12 . . -12 -12 . -12 . -12 -12 -12 . . . . -12 -12 . -12 -12 . -12 . -12 . -12 -12 -12 -12 -12 -12 . -12 . . . . . . .
+. . . . . . . . -28 -28 -28 . . . . -28 . . . . . . . . . . . . . . . . . . . . -28 . . -28 -28 . . . . . -28 . . -28 -28 . -28 . -28 -28 -28 . . . . -28 -28 . -28 -28 . -28 . -28 . -28 -28 -28 -28 -28 -28 . -28 . . . . . . .
+. . . . . . . . -41 -41 -41 . . . . -41 . . . . . . . . . . . . . . . . . . . . -41 . . -41 -41 . . . . . -41 . . -41 -41 . -41 . -41 -41 -41 . . . . -41 -41 . -41 -41 . -41 . -41 . -41 -41 -41 -41 -41 -41 . -41 . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 37 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 38 . .
+. . . . . . . . -21 -21 -21 . . . . -21 . . . . . . . . . . . . . . . . . . . . -21 . . -21 -21 . . . . . -21 . . -21 -21 . -21 . -21 -21 -21 . . . . -21 -21 . -21 -21 . -21 . -21 . -21 -21 -21 -21 -21 -21 . -21 . . . . . . .
+. . . . . . . . -24 -24 -24 . . . . -24 . . . . . . . . . . . . . . . . . . . . -24 . . -24 -24 . . . . . -24 . . -24 -24 . -24 . -24 -24 -24 . . . . -24 -24 . -24 -24 . -24 . -24 . -24 -24 -24 -24 -24 -24 . -24 . . . . . . .
+. . -1 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -1 . . -1 -1 . . . . . -1 . . -1 -1 . . . -1 -1 -1 . . . -1 -1 -1 . -1 -1 . -1 . -1 . -1 -1 -1 -1 -1 -1 . . . . . . . . .
+. . . . . . . . -27 -27 -27 . . . . -27 . . . . . . . . . . . . . . . . . . . . -27 . . -27 -27 . . . . . -27 . . -27 -27 . -27 . -27 -27 -27 . . . . -27 -27 . -27 -27 . -27 . -27 . -27 -27 -27 -27 -27 -27 . -27 . . . . . . .
+. . . . . . . . -22 -22 -22 . . . . -22 . . . . . . . . . . . . . . . . . . . . -22 . . -22 -22 . . . . . -22 . . -22 -22 . -22 . -22 -22 -22 . . . . -22 -22 . -22 -22 . -22 . -22 . -22 -22 -22 -22 -22 -22 . -22 . . . . . . .
+. . -5 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -5 . . -5 -5 . . . . . -5 . . -5 -5 . . . -5 -5 -5 . . . -5 -5 -5 . -5 -5 . -5 . -5 . -5 -5 -5 -5 -5 -5 . . . . . . . . .
+. . -4 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -4 . . -4 -4 . . . . . -4 . . -4 -4 . . . -4 -4 -4 . . . -4 -4 -4 . -4 -4 . -4 . -4 . -4 -4 -4 -4 -4 -4 . . . . . . . . .
+. . . . . . . . -14 -14 -14 . . . . -14 . . . . . . . . . . . . . . . . . . . . -14 . . -14 -14 . . . . . -14 . . -14 -14 . -14 . -14 -14 -14 . . . . -14 -14 . -14 -14 . -14 . -14 . -14 -14 -14 -14 -14 -14 . -14 . . . . . . .
+. . . . . . . . -15 -15 -15 . . . . -15 . . . . . . . . . . . . . . . . . . . . -15 . . -15 -15 . . . . . -15 . . -15 -15 . -15 . -15 -15 -15 . . . . -15 -15 . -15 -15 . -15 . -15 . -15 -15 -15 -15 -15 -15 . -15 . . . . . . .
+. . . . . . . . 45 . 42 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 40 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . -7 -7 -7 . . . . -7 . . . . . . . . . . . . . . . . . . . . 26 . . 19 5 . . . . . 23 . . 4 8 . -7 . 33 20 10 . . . . 30 17 . 32 3 . 27 . 11 . 6 1 7 13 35 14 . -7 . . . . . . .
+. . . . . . . . -13 -13 -13 . . . . -13 . . . . . . . . . . . . . . . . . . . . -13 . . -13 -13 . . . . . -13 . . -13 -13 . -13 . -13 -13 -13 . . . . -13 -13 . -13 -13 . -13 . -13 . -13 -13 -13 -13 -13 -13 . -13 . . . . . . .
+. . -3 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -3 . . -3 -3 . . . . . -3 . . -3 -3 . . . -3 -3 -3 . . . -3 -3 -3 . -3 -3 . -3 . -3 . -3 -3 -3 -3 -3 -3 . . . . . . . . .
+. . . . . . . . -26 -26 -26 . . . . -26 . . . . . . . . . . . . . . . . . . . . -26 . . -26 -26 . . . . . -26 . . -26 -26 . -26 . -26 -26 -26 . . . . -26 -26 . -26 -26 . -26 . -26 . -26 -26 -26 -26 -26 -26 . -26 . . . . . . .
+. . . . . . . . -167 -167 -167 . . . . -167 . . . . . . . . . . . . . . . . . . . . -167 . . -167 -167 . . . . . -167 . . -167 -167 . -167 . -167 -167 -167 . . . . -167 -167 . -167 -167 . -167 . -167 . -167 -167 -167 -167 -167 -167 . -167 . . . . . . .
+. . . . . . . . -10 -10 -10 . . . . -10 . . . . . . . . . . . . . . . . . . . . -10 . . -10 -10 . . . . . -10 . . -10 -10 . -10 . -10 -10 -10 . . . . -10 -10 . -10 -10 . -10 . -10 . -10 -10 -10 -10 -10 -10 . -10 . . . . . . .
+. . . . . . . . -20 -20 -20 . . . . -20 . . . . . . . . . . . . . . . . . . . . -20 . . -20 -20 . . . . . -20 . . -20 -20 . -20 . -20 -20 -20 . . . . -20 -20 . -20 -20 . -20 . -20 . -20 -20 -20 -20 -20 -20 . -20 . . . . . . .
+. . -2 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -2 . . -2 -2 . . . . . -2 . . -2 -2 . . . -2 -2 -2 . . . -2 -2 -2 . -2 -2 . -2 . -2 . -2 -2 -2 -2 -2 -2 . . . . . . . . .
+. . . . . . . . -31 -31 -31 . . . . -31 . . . . . . . . . . . . . . . . . . . . -31 . . -31 -31 . . . . . -31 . . -31 -31 . -31 . -31 -31 -31 . . . . -31 -31 . -31 -31 . -31 . -31 . -31 -31 -31 -31 -31 -31 . -31 . . . . 48 . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 19 5 . . . . . 23 . . . 8 . . . . 20 10 . . . . . 17 . 32 3 . . . 11 . . 1 7 13 35 14 . . . . . . . . .
+. . . . . . . . . . . . . . . -171 . . . . . . . . -171 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . -56 -56 . . . . . -56 . . . . . . . . -56 . . . . -56 . . . . . . . . . . . . . -56 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -56 . . . . -56 . .
+. . . . . . . . . . . . . . . -173 . . . . . . . . -173 . . . . 56 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 57 . .
+. . . . . . . . -50 -50 42 . . . . -50 . . . . . . . . . . . . . . . . . . . . . . . . 5 . . . . . . . . . . . -50 . . . . . . . . . 17 . . . . . . . . . . . . . 14 . -50 . . . . . . .
+. . . . . . . . . . . . . . . 61 . . . . . . . . 62 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . 45 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 40 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . 45 . 42 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 40 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . 66 -48 . . . . . -48 . . . . . . . . -48 . . . . -48 . . . . . . . . . . . . . -48 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 65 . . . . -48 . .
+. . . . . . . . -8 -8 -8 . . . . -8 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -8 . . . . . . . . . . . . . . . . . . . . . . . . . -8 . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 19 5 . . . . . 23 . . . 8 . . . . 20 10 . . . . . 17 . 32 3 . . . 11 . . 1 7 13 35 14 . . . . . . . . .
+. . . . . . . . 45 . 42 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 40 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 19 5 . . . . . 23 . . . 8 . . . . 20 10 . . . . . 17 . 32 3 . . . 11 . . 1 7 13 35 14 . . . . . . . 72 .
+. . . . . . . . -40 -40 -40 . . . . . . . . . . . . . . . . . . . . . . . . . . . . -40 -40 . . . . . -40 . . . -40 . -40 . . -40 -40 . . . . . -40 . -40 -40 . . . -40 . . -40 -40 -40 -40 -40 . -40 . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -34 -34 . . . . . -34 . . . -34 . . . . -34 -34 . . . . . -34 . -34 -34 . . . -34 . . -34 -34 -34 -34 -34 . . . . . . . -34 .
+. . . . . . . . -37 -37 -37 . . . . . . . . . . . . . . . . . . . . . . . . . . . . 19 5 . . . . . 23 . . . 8 . -37 . . 20 10 . . . . . 17 . 32 3 . . . 11 . . 1 7 13 35 14 . -37 . . . . . . .
+. . . . . . . . -39 -39 -39 . . . . . . . . . . . . . . . . . . . . . . . . . . . . -39 -39 . . . . . -39 . . . -39 . -39 . . -39 -39 . . . . . -39 . -39 -39 . . . -39 . . -39 -39 -39 -39 -39 . -39 . . . . . . .
+. . -6 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -6 . . -6 -6 . . . . . -6 . . -6 -6 . . . -6 -6 -6 . . . -6 -6 -6 . -6 -6 . -6 . -6 . -6 -6 -6 -6 -6 -6 . . . . . . . . .
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . 90 . 85
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . 26 116 119 19 5 84 109 . 117 114 23 . . 4 8 104 74 101 33 20 10 . . . 102 30 17 99 32 3 79 27 94 11 100 6 1 7 13 35 14 108 . . . . . 57 110 85
+. . . . . . . . -52 -52 . . . . . -52 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -52 . . . . . . . . . . . . . . . . . . . . . . . . . -52 . . . . . . .
+. . . . . . . . -51 -51 42 . . . . -51 . . . . . . . . . . . . . . . . . . . . . . . . 5 . . . . . . . . . . . -51 . . . . . . . . . 17 . . . . . . . . . . . . . 14 . -51 . . . . . . .
+. . . . . . . . -54 -54 -54 . . . . -54 . . . . . . . . . . . . . . . . . . . . . . . . -54 . . . . . . . . . . . -54 . . . . . . . . . -54 . . . . . . . . . . . . . -54 . -54 . . . . . . .
+. . . . . . . . 45 . 42 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 40 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+-170 . -170 . . -170 . . -170 . -170 . -170 . . . -170 . . . . . . . . . . . . . . . . . . . -170 -170 -170 -170 -170 -170 -170 . -170 -170 -170 . . -170 -170 -170 -170 -170 -170 -170 -170 . . . -170 -170 -170 -170 -170 -170 -170 -170 -170 -170 -170 -170 -170 -170 -170 -170 -170 -170 . . . . . -170 -170 -170
+. . . . . . . . 66 -49 . . . . . -49 . . . . . . . . -49 . . . . -49 . . . . . . . . . . . . . -49 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 65 . . . . -49 . .
+. . . . . . . . . 124 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 125 . . . . . .
+. . . . . . . . . 131 . . . . . . . . . . . . . . . . . . . . . . . . . . 26 . . 19 5 . . . . . 23 . . 4 8 . 126 . 33 20 10 . . . . 30 17 . 32 3 . 27 . 11 . 6 1 7 13 35 14 . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 19 5 . . . . . 23 . . . 8 . . . . 20 10 . . . . . 17 . 32 3 . . . 11 . . 1 7 13 35 14 . . . . . . . 133 .
+. . . . . . . . . . . . . . . -46 . . . . . . . . -46 . . . . . . . . . . . . . . . . . . 134 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . 135 . . . . . . . . 136 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . -44 . . . . . . . . -44 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -35 -35 . . . . . -35 . . . -35 . . . . -35 -35 . . . . . -35 . -35 -35 . . . -35 . . -35 -35 -35 -35 -35 . . . . . . . -35 .
+. . . . . . . . -30 -30 -30 . . . . -30 . . . . . . . . . . . . . . . . . . . . -30 . . -30 -30 . . . . . -30 . . -30 -30 . -30 . -30 -30 -30 . . . . -30 -30 . -30 -30 . -30 . -30 . -30 -30 -30 -30 -30 -30 . -30 . . . . . . .
+. . . . . . . . -38 -38 -38 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -38 . . . . . . . . . . . . . . . . . . . . . . . . . -38 . . . . . . .
+. -122 . -122 -122 -122 -122 -122 -122 -122 -122 -122 -122 -122 -122 -122 -122 -122 -122 -122 -122 . -122 -122 -122 -122 -122 -122 -122 -122 -122 -122 -122 -122 -122 -122 . . . . . . . -122 . . . . . . . . . . . . . -122 -122 -122 . . . . . . . . . . . . . . . . . . -122 -122 -122 -122 . . -122 .
+. -108 . -108 -108 -108 -108 -108 -108 -108 -108 -108 -108 -108 -108 -108 -108 -108 -108 -108 -108 . -108 -108 -108 -108 -108 -108 -108 -108 -108 -108 -108 -108 -108 -108 . . . . . . . -108 . . . . . . . . . . . . . -108 -108 -108 . . . . . . . . . . . . . . . . . . -108 -108 -108 -108 . . -108 .
+. -77 . -77 . -77 -77 . . -77 -77 . -77 . . -77 -77 . . . . . -77 . -77 -77 -77 . -77 . -77 -77 -77 -77 . -77 . . . . . . . -77 . . . . . . . . . . . . . -77 -77 . . . . . . . . . . . . . . . . . . . . -77 -77 . . . -77 .
+-106 . . . . -106 . . -106 . -106 . -106 . . . -106 . . . . . . . . . . . . . . . . . . . . . . . . -106 . . . . . . . . . . -106 . . . . . . . . . . . . . -106 . -106 . . . . . . . . . . . . . . . . -106
+. . . . . . . . . . . . . . . -161 . . . . . . . . -161 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -161 .
+93 . . . . 80 . . 137 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+-107 . . . . -107 . . -107 . -107 . -107 . . . -107 . . . . . . . . . . . . . . . . . . . . . . . . -107 . . . . . . . . . . -107 . . . . . . . . . . . . . -107 . -107 . . . . . . . . . . . . . . . . -107
+-105 . . . . -105 . . -105 . -105 . -105 . . . -105 . . . . . . . . . . . . . . . . . . . . . . . . -105 . . . . . . . . . . -105 . . . . . . . . . . . . . -105 . -105 . . . . . . . . . . . . . . . . -105
+. . . . . . . . . -62 . . . . . -62 . . . . . . . . -62 . . . . . . . . . . . . . . . . . . -62 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -62 . . . . -62 .
+. -98 . -98 -98 -98 -98 -98 143 -98 -98 -98 -98 142 -98 -98 -98 140 -98 141 144 . -98 -98 -98 -98 -98 -98 -98 -98 -98 -98 -98 -98 -98 -98 . . . . . . . -98 . . . . . . . . . . . . . -98 -98 -98 . . . . . . . . . . . . . . . . . . 139 -98 -98 -98 . . -98 .
+. -121 . -121 -121 -121 -121 -121 -121 -121 -121 -121 -121 -121 -121 -121 -121 -121 -121 -121 -121 . -121 -121 -121 -121 -121 -121 -121 -121 -121 -121 -121 -121 -121 -121 . . . . . . . -121 . . . . . . . . . . . . . -121 -121 -121 . . . . . . . . . . . . . . . . . . -121 -121 -121 -121 . . -121 .
+-103 . . . . -103 . . -103 . -103 . -103 . . . -103 . . . . . . . . . . . . . . . . . . . . . . . . -103 . . . . . . . . . . -103 . . . . . . . . . . . . . -103 . -103 . . . . . . . . . . . . . . . . -103
+. -96 . -96 151 -96 -96 156 . -96 -96 152 -96 . 154 -96 -96 . 147 . . . -96 155 -96 -96 -96 150 -96 153 -96 -96 -96 -96 145 -96 . . . . . . . -96 . . . . . . . . . . . . . -96 -96 148 . . . . . . . . . . . . . . . . . . . -96 -96 149 . . -96 .
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . 19 5 84 . . . . 23 . . . 8 . 74 . . 20 10 . . . . . 17 . 32 3 79 . 94 11 . . 1 7 13 35 14 . . . . . . . . 85
+. 160 . 172 . 167 171 . . -75 161 . 168 . . -75 175 . . . . . 176 . -75 164 169 . 162 . 177 174 163 173 . 170 . . . . . . . -75 . . . . . . . . . . . . . 178 166 . . . . . . . . . . . . . . . . . . . . -75 165 . . . -75 .
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . 189 . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . 185 . . . . 90 . 85
+-104 . . . . -104 . . -104 . -104 . -104 . . . -104 . . . . . . . . . . . . . . . . . . . . . . . . -104 . . . . . . . . . . -104 . . . . . . . . . . . . . -104 . -104 . . . . . . . . . . . . . . . . -104
+. . . . . . . . . . . . . . . -174 . . . . . . . . -174 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+-102 . . . . -102 . . -102 . -102 . -102 . . . -102 . . . . . . . . . . . . . . . . . . . . . . . . -102 . . . . . . . . . . -102 . . . . . . . . . . . . . -102 . -102 . . . . . . . . . . . . . . . . -102
+. -120 . -120 -120 -120 -120 -120 -120 -120 -120 -120 -120 -120 -120 -120 -120 -120 -120 -120 -120 . -120 -120 -120 -120 -120 -120 -120 -120 -120 -120 -120 -120 -120 -120 . . . . . . . -120 . . . . . . . . . . . . . -120 -120 -120 . . . . . . . . . . . . . . . . . . -120 -120 -120 -120 . . -120 .
+-180 . . . . -180 . . -180 . -180 . -180 . . . -180 . . . . . . . . . . . . . . . . . . . -180 -180 -180 -180 -180 -180 -180 . -180 -180 -180 . . -180 -180 -180 -180 -180 -180 -180 -180 . . . -180 -180 -180 -180 -180 -180 -180 -180 -180 -180 -180 -180 -180 -180 -180 -180 -180 -180 . . . . . -180 -180 -180
+. . . . . . . . . -124 . . . . . -124 . . . . . . . . -124 . . . . . . . . . . . . . . . . . . -124 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -124 . . . . . .
+-185 . . . . -185 . . -185 . -185 . -185 . . . -185 . . . . . . . . . . . . . . . . . . . -185 -185 -185 -185 -185 -185 -185 . -185 -185 -185 . . -185 -185 -185 -185 -185 -185 -185 -185 . . . -185 -185 -185 -185 -185 -185 -185 -185 -185 -185 -185 -185 -185 -185 -185 -185 -185 -185 . . . . . -185 -185 -185
+-177 . . . . -177 . . -177 . -177 . -177 . . . -177 . . . . . . . . . . . . . . . . . . . -177 -177 -177 -177 -177 -177 -177 . -177 -177 -177 . . -177 -177 -177 -177 -177 -177 -177 -177 . . . -177 -177 -177 -177 -177 -177 -177 -177 -177 -177 -177 -177 -177 -177 -177 -177 -177 -177 . . . . . -177 -177 -177
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+. . . . . . . . 191 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . 192 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+-181 . . . . -181 . . -181 . -181 . -181 . . . -181 . . . . . . . . . . . . . . . . . . . -181 -181 -181 -181 -181 -181 -181 . -181 -181 -181 . . -181 -181 -181 -181 -181 -181 -181 -181 . . . -181 -181 -181 -181 -181 -181 -181 -181 -181 -181 -181 -181 -181 -181 -181 -181 -181 -181 . . . . . -181 -181 -181
+. . . . . . . . 45 . 42 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 40 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . 193 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+-183 . . . . -183 . . -183 . -183 . -183 . . . -183 . . . . . . . . . . . . . . . . . . . -183 -183 -183 -183 -183 -183 -183 . -183 -183 -183 . . -183 -183 -183 -183 -183 -183 -183 -183 . . . -183 -183 -183 -183 -183 -183 -183 -183 -183 -183 -183 -183 -183 -183 -183 -183 -183 -183 . . . . . -183 -183 -183
+. . . . . . . . . . . . . . . 194 . . . . . . . . 195 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+-186 . . . . -186 . . -186 . -186 . -186 . . . -186 . . . . . . . . . . . . . . . . . . . -186 -186 -186 -186 -186 -186 -186 . -186 -186 -186 . . -186 -186 -186 -186 -186 -186 -186 -186 . . . -186 -186 -186 -186 -186 -186 -186 -186 -186 -186 -186 -186 -186 -186 -186 -186 -186 -186 . . . . . -186 -186 -186
+. . . . . . . . 196 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . 197 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+-175 . -175 . . -175 . . -175 . -175 . -175 . . . -175 . . . . . . . . . . . . . . . . . . . -175 -175 -175 -175 -175 -175 -175 . -175 -175 -175 -175 . -175 -175 -175 -175 -175 -175 -175 -175 . . . -175 -175 -175 -175 -175 -175 -175 -175 -175 -175 -175 -175 -175 -175 -175 -175 -175 -175 . . . . . -175 -175 -175
+-182 . . . . -182 . . -182 . -182 . -182 . . . -182 . . . . . . . . . . . . . . . . . . . -182 -182 -182 -182 -182 -182 -182 . -182 -182 -182 . . -182 -182 -182 -182 -182 -182 -182 -182 . . . -182 -182 -182 -182 -182 -182 -182 -182 -182 -182 -182 -182 -182 -182 -182 -182 -182 -182 . . . . . -182 -182 -182
+-184 . . . . -184 . . -184 . -184 . -184 . . . -184 . . . . . . . . . . . . . . . . . . . -184 -184 -184 -184 -184 -184 -184 . -184 -184 -184 . . -184 -184 -184 -184 -184 -184 -184 -184 . . . -184 -184 -184 -184 -184 -184 -184 -184 -184 -184 -184 -184 -184 -184 -184 -184 -184 -184 . . . . . -184 -184 -184
+-187 . . . . -187 . . -187 . -187 . -187 . . . -187 . . . . . . . . . . . . . . . . . . . -187 -187 -187 -187 -187 -187 -187 . -187 -187 -187 . . -187 -187 -187 -187 -187 -187 -187 -187 . . . -187 -187 -187 -187 -187 -187 -187 -187 -187 -187 -187 -187 -187 -187 -187 -187 -187 -187 . . . . . -187 -187 -187
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . 116 119 . . 84 109 . 117 114 . . . . . 104 74 101 . . . . . . . . . 99 . . 79 . 94 . 100 . . . . . . 108 . . . . . 57 . 85
+-179 . . . . -179 . . -179 . -179 . -179 . . . -179 . . . . . . . . . . . . . . . . . . . -179 -179 -179 -179 -179 -179 -179 . -179 -179 -179 . . -179 -179 -179 -179 -179 -179 -179 -179 . . . -179 -179 -179 -179 -179 -179 -179 -179 -179 -179 -179 -179 -179 -179 -179 -179 -179 -179 . . . . . -179 -179 -179
+. . . . . . . . . . . . . . . . . . . . . . . . 199 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 200 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . 26 116 119 19 5 84 109 . 117 114 23 . . 4 8 104 74 101 33 20 10 . . . 102 30 17 99 32 3 79 27 94 11 100 6 1 7 13 35 14 108 . . . . . 57 202 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+. . . . . . . . -53 -53 . . . . . -53 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -53 . . . . . . . . . . . . . . . . . . . . . . . . . -53 . . . . . . .
+. . . . . . . . -55 -55 -55 . . . . -55 . . . . . . . . . . . . . . . . . . . . . . . . -55 . . . . . . . . . . . -55 . . . . . . . . . -55 . . . . . . . . . . . . . -55 . -55 . . . . . . .
+. . . . . . . . . . . . . . . -172 . . . . . . . . -172 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . -173 . . . . . . . . -173 . . . . 56 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . -57 -57 . . . . . -57 . . . . . . . . -57 . . . . -57 . . . . . . . . . . . . . -57 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -57 . . . . -57 . .
+. . . . . . . . -58 -58 . . . . . -58 . . . . . . . . -58 . . . . -58 . . . . . . . . . . . . . -58 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -58 . . . . -58 . .
+. . . . . . . . . -164 . . . . . -164 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . 205 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . -146 . . . . . -146 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . 209 -148 42 . . . . -148 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 40 . . . . . . . . . . . . . . . . . . . . . . . . . 207 . . . . . . .
+. . . . . . . . . -144 . . . . . 212 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . -59 -59 . . . . . -59 . . . . . . . . -59 . . . . -59 . . . . . . . . . . . . . -59 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -59 . . . . -59 . .
+. . . . . . . . . 213 . . . . . 214 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . -29 -29 -29 . . . . -29 . . . . . . . . . . . . . . . . . . . . -29 . . -29 -29 . . . . . -29 . . -29 -29 . -29 . -29 -29 -29 . . . . -29 -29 . -29 -29 . -29 . -29 . -29 -29 -29 -29 -29 -29 . -29 . . . . . . .
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+. . . . . . . . 45 . 42 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 40 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -36 -36 . . . . . -36 . . . -36 . . . . -36 -36 . . . . . -36 . -36 -36 . . . -36 . . -36 -36 -36 -36 -36 . . . . . . . -36 .
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . 19 5 84 . . . . 23 . . . 8 . 74 . . 20 10 . . . . . 17 . 32 3 79 . 94 11 . . 1 7 13 35 14 . . . . . . . . 85
+. -100 . -100 -100 -100 -100 -100 . -100 -100 -100 -100 . -100 -100 -100 . -100 . . . -100 -100 -100 -100 -100 -100 -100 -100 -100 -100 -100 -100 -100 -100 . . . . . . . -100 . . . . . . . . . . . . . -100 -100 -100 . . . . . . . . . . . . . . . . . . . -100 -100 -100 . . -100 .
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+. -114 . -114 -114 -114 -114 -114 -114 -114 -114 -114 -114 -114 -114 -114 -114 -114 -114 -114 -114 . -114 -114 -114 -114 -114 -114 -114 -114 -114 -114 -114 -114 -114 -114 . . . . . . . -114 . . . . . . . . . . . . . -114 -114 -114 . . . . . . . . . . . . . . . . . . -114 -114 -114 -114 . . -114 .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 219 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. -115 . -115 -115 -115 -115 -115 -115 -115 -115 -115 -115 -115 -115 -115 -115 -115 -115 -115 -115 . -115 -115 -115 -115 -115 -115 -115 -115 -115 -115 -115 -115 -115 -115 . . . . . . . -115 . . . . . . . . . . . . . -115 -115 -115 . . . . . . . . . . . . . . . . . . -115 -115 -115 -115 . . -115 .
+93 . . . . 80 . . 87 222 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 223 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+-68 . . . . -68 . . -68 . -68 . -68 . . . -68 . . . . . . . . . . . . . . . . . . . . . . . . -68 . . . . . . . . . . -68 . . . . . . . . . . . . . -68 . -68 . . . . . . . . . . . . . . . . -68
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+-69 . . . . -69 . . -69 . -69 . -69 . . . -69 . . . . . . . . . . . . . . . . . . . . . . . . -69 . . . . . . . . . . -69 . . . . . . . . . . . . . -69 . -69 . . . . . . . . . . . . . . . . -69
+-64 . . . . -64 . . -64 . -64 . -64 . . . -64 . . . . . . . . . . . . . . . . . . . . . . . . -64 . . . . . . . . . . -64 . . . . . . . . . . . . . -64 . -64 . . . . . . . . . . . . . . . . -64
+-65 . . . . -65 . . -65 . -65 . -65 . . . -65 . . . . . . . . . . . . . . . . . . . . . . . . -65 . . . . . . . . . . -65 . . . . . . . . . . . . . -65 . -65 . . . . . . . . . . . . . . . . -65
+-67 . . . . -67 . . -67 . -67 . -67 . . . -67 . . . . . . . . . . . . . . . . . . . . . . . . -67 . . . . . . . . . . -67 . . . . . . . . . . . . . -67 . -67 . . . . . . . . . . . . . . . . -67
+-71 . . . . -71 . . -71 . -71 . -71 . . . -71 . . . . . . . . . . . . . . . . . . . . . . . . -71 . . . . . . . . . . -71 . . . . . . . . . . . . . -71 . -71 . . . . . . . . . . . . . . . . -71
+-73 . . . . -73 . . -73 . -73 . -73 . . . -73 . . . . . . . . . . . . . . . . . . . . . . . . -73 . . . . . . . . . . -73 . . . . . . . . . . . . . -73 . -73 . . . . . . . . . . . . . . . . -73
+-74 . . . . -74 . . -74 . -74 . -74 . . . -74 . . . . . . . . . . . . . . . . . . . . . . . . -74 . . . . . . . . . . -74 . . . . . . . . . . . . . -74 . -74 . . . . . . . . . . . . . . . . -74
+-70 . . . . -70 . . -70 . -70 . -70 . . . -70 . . . . . . . . . . . . . . . . . . . . . . . . -70 . . . . . . . . . . -70 . . . . . . . . . . . . . -70 . -70 . . . . . . . . . . . . . . . . -70
+-72 . . . . -72 . . -72 . -72 . -72 . . . -72 . . . . . . . . . . . . . . . . . . . . . . . . -72 . . . . . . . . . . -72 . . . . . . . . . . . . . -72 . -72 . . . . . . . . . . . . . . . . -72
+-66 . . . . -66 . . -66 . -66 . -66 . . . -66 . . . . . . . . . . . . . . . . . . . . . . . . -66 . . . . . . . . . . -66 . . . . . . . . . . . . . -66 . -66 . . . . . . . . . . . . . . . . -66
+. . . . . . . . 226 -128 42 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 207 . . . . . . .
+. . . . . . . . . 228 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . 229 . . . . . 194 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+. -99 . -99 -99 -99 -99 -99 . -99 -99 -99 -99 . -99 -99 -99 . -99 . . . -99 -99 -99 -99 -99 -99 -99 -99 -99 -99 -99 -99 -99 -99 . . . . . . . -99 . . . . . . . . . . . . . -99 -99 -99 . . . . . . . . . . . . . . . . . . . -99 -99 -99 . . -99 .
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . 19 5 84 . . . . 23 . . . 8 . 74 . . 20 10 . . . . . 17 . 32 3 79 . 94 11 . . 1 7 13 35 14 . . . . . . . . 85
+. -96 . -96 -96 -96 -96 -96 . -96 -96 -96 -96 . -96 -96 -96 . -96 . . . -96 -96 -96 -96 -96 -96 -96 -96 -96 -96 -96 -96 -96 -96 . . . . . . . -96 . . . . . . . . . . . . . -96 -96 -96 . . . . . . . . . . . . . . . . . . . -96 -96 -96 . . -96 .
+. . . . . . . . . . . . . . . 251 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 250 .
+. . . . . . . . . . . . . . . . . . . . 189 . . . . . . . . 253 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 185 . . . . . . .
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . 90 . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+. . . . . . . . . . . . . . . -151 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -151 .
+. . . . . . . . . . . . . . . -153 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -153 .
+. . . . . . . . . . . . . . . . . . . . -156 . . . . . . . . -156 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -156 . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 256 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . 194 . . . . . . . . 257 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 26 . . 19 5 . . . . . 23 . . 4 8 . . . 33 20 10 . . . . 30 17 . 32 3 . 27 . 11 . 6 1 7 13 35 14 . . . . . . . . .
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+-188 . . . . -188 . . -188 . -188 . -188 . . . -188 . . . . . . . . . . . . . . . . . . . -188 -188 -188 -188 -188 -188 -188 . -188 -188 -188 . . -188 -188 -188 -188 -188 -188 -188 -188 . . . -188 -188 -188 -188 -188 -188 -188 -188 -188 -188 -188 -188 -188 -188 -188 -188 -188 -188 . . . . . -188 -188 -188
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+-198 . . . . -198 . . -198 . -198 . -198 . . . -198 . . . . . . . . . . . . . . . . . . . -198 -198 -198 -198 -198 -198 -198 . -198 -198 -198 . . -198 -198 -198 -198 -198 -198 -198 -198 . . . -198 -198 -198 -198 -198 -198 -198 -198 -198 -198 -198 -198 -198 -198 -198 -198 -198 -198 . . . . . -198 -198 -198
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 263 . . . . . . . .
+-197 . . . . -197 . . -197 . -197 . -197 . . . -197 . . . . . . . . . . . . . . . . . . . -197 -197 -197 -197 -197 -197 -197 . -197 -197 -197 . . -197 -197 -197 -197 -197 -197 -197 -197 . . . -197 -197 -197 -197 -197 -197 -197 -197 -197 -197 -197 -197 -197 -197 -197 -197 -197 -197 . . . . . -197 -197 -197
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . 116 119 . . 84 109 . 117 114 . . . . . 104 74 101 . . . . . . . . . 99 . . 79 . 94 . 100 . . . . . . 108 . . . . . 57 . 85
+-178 . . . . -178 . . -178 . -178 . -178 . . . -178 . . . . . . . . . . . . . . . . . . . -178 -178 -178 -178 -178 -178 -178 . -178 -178 -178 . . -178 -178 -178 -178 -178 -178 -178 -178 . . . -178 -178 -178 -178 -178 -178 -178 -178 -178 -178 -178 -178 -178 -178 -178 -178 -178 -178 . . . . . -178 -178 -178
+-176 . -176 . . -176 . . -176 . -176 . -176 . . . -176 . . . . . . . . . . . . . . . . . . . -176 -176 -176 -176 -176 -176 -176 . -176 -176 -176 -176 . -176 -176 -176 -176 -176 -176 -176 -176 . . . -176 -176 -176 -176 -176 -176 -176 -176 -176 -176 -176 -176 -176 -176 -176 -176 -176 -176 . . . . . -176 -176 -176
+. . . . . . . . . . . . . . . -160 . . . . . . . . -160 . . . . . . . . . . . . . . . . . . -160 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -160 . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 265 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . -61 -61 . . . . . -61 . . . . . . . . -61 . . . . -61 . . . . . . . . . . . . . -61 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -61 . . . . -61 . .
+. . . . . . . . 209 -131 . . . . . -131 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 40 . . . . . . . . . . . . . . . . . . . . . . . . . 207 . . . . . . .
+93 . . . . 80 . . 87 . 267 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . 269 . . . . . 85
+. . . . . . . . . -150 . . . . . -150 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . 209 272 42 . . . . . . . . . . . . . . . . . . . . . . . . . 26 . . 19 5 . . . . . 23 . . 4 8 . 40 . 33 20 10 . . . . 30 17 . 32 3 . 27 . 11 . 6 1 7 13 35 14 . 207 . . . . . . .
+. . . . . . . . 274 -130 . . . . . -130 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 273 . . . . . . .
+. . . . . . . . . -149 . . . . . -149 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . 276 . . . . . . . . . . . . . . 26 . . 19 5 . . . . . 23 . . 4 8 . . . 33 20 10 . . . . 30 17 . 32 3 . 27 . 11 . 6 1 7 13 35 14 . . . . . . . . .
+. . . . . . . . -60 -60 . . . . . -60 . . . . . . . . -60 . . . . -60 . . . . . . . . . . . . . -60 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -60 . . . . -60 . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 277 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . -47 . . . . . . . . -47 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . -45 . . . . . . . . -45 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . 278 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . 194 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 279 . . . . . .
+. -113 . -113 -113 -113 -113 -113 -113 -113 -113 -113 -113 -113 -113 -113 -113 -113 -113 -113 -113 . -113 -113 -113 -113 -113 -113 -113 -113 -113 -113 -113 -113 -113 -113 . . . . . . . -113 . . . . . . . . . . . . . -113 -113 -113 . . . . . . . . . . . . . . . . . . -113 -113 -113 -113 . . -113 .
+. . . . . . . . . 280 . . . . . 281 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . -118 . . . . . -118 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. -110 . -110 -110 -110 -110 -110 -110 -110 -110 -110 -110 -110 -110 -110 -110 -110 -110 -110 -110 . -110 -110 -110 -110 -110 -110 -110 -110 -110 -110 -110 -110 -110 -110 . . . . . . . -110 . . . . . . . . . . . . . -110 -110 -110 . . . . . . . . . . . . . . . . . . -110 -110 -110 -110 . . -110 .
+. -112 . -112 -112 -112 -112 -112 -112 -112 -112 -112 -112 -112 -112 -112 -112 -112 -112 -112 -112 . -112 -112 -112 -112 -112 -112 -112 -112 -112 -112 -112 -112 -112 -112 . . . . . . . -112 . . . . . . . . . . . . . -112 -112 -112 . . . . . . . . . . . . . . . . . . -112 -112 -112 -112 . . -112 .
+. . . . . . . . . -63 . . . . . -63 . . . . . . . . -63 . . . . . . . . . . . . . . . . . . -63 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -63 . . . . -63 .
+. . . . . . . . 226 -131 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 207 . . . . . . .
+. . . . . . . . 226 272 42 . . . . . . . . . . . . . . . . . . . . . . . . . 26 . . 19 5 . . . . . 23 . . 4 8 . . . 33 20 10 . . . . 30 17 . 32 3 . 27 . 11 . 6 1 7 13 35 14 . 207 . . . . . . .
+. . . . . . . . . -129 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . 283 . 85
+. -123 . -123 -123 -123 -123 -123 -123 -123 -123 -123 -123 -123 -123 -123 -123 -123 -123 -123 -123 . -123 -123 -123 -123 -123 -123 -123 -123 -123 -123 -123 -123 -123 -123 . . . . . . . -123 . . . . . . . . . . . . . -123 -123 -123 . . . . . . . . . . . . . . . . . . -123 -123 -123 -123 . . -123 .
+. -89 . 172 . -89 -89 . . -89 161 . 168 . . -89 175 . . . . . 176 . -89 164 169 . 162 . -89 174 163 173 . -89 . . . . . . . -89 . . . . . . . . . . . . . -89 -89 . . . . . . . . . . . . . . . . . . . . -89 -89 . . . -89 .
+. -80 . -80 . -80 -80 . . -80 -80 . -80 . . -80 -80 . . . . . -80 . -80 -80 -80 . -80 . -80 -80 -80 -80 . -80 . . . . . . . -80 . . . . . . . . . . . . . -80 -80 . . . . . . . . . . . . . . . . . . . . -80 -80 . . . -80 .
+. -86 . 172 . -86 -86 . . -86 161 . 168 . . -86 175 . . . . . 176 . -86 -86 169 . -86 . -86 -86 -86 173 . -86 . . . . . . . -86 . . . . . . . . . . . . . -86 -86 . . . . . . . . . . . . . . . . . . . . -86 -86 . . . -86 .
+. -85 . 172 . -85 -85 . . -85 161 . 168 . . -85 175 . . . . . 176 . -85 -85 169 . -85 . -85 -85 -85 173 . -85 . . . . . . . -85 . . . . . . . . . . . . . -85 -85 . . . . . . . . . . . . . . . . . . . . -85 -85 . . . -85 .
+. -88 . 172 . -88 -88 . . -88 161 . 168 . . -88 175 . . . . . 176 . -88 -88 169 . -88 . -88 -88 -88 173 . -88 . . . . . . . -88 . . . . . . . . . . . . . -88 -88 . . . . . . . . . . . . . . . . . . . . -88 -88 . . . -88 .
+. 160 . 172 . 167 -92 . . -92 161 . 168 . . -92 175 . . . . . 176 . -92 164 169 . 162 . 177 174 163 173 . -92 . . . . . . . -92 . . . . . . . . . . . . . -92 -92 . . . . . . . . . . . . . . . . . . . . -92 -92 . . . -92 .
+. 160 . 172 . 167 -93 . . -93 161 . 168 . . -93 175 . . . . . 176 . -93 164 169 . 162 . 177 174 163 173 . -93 . . . . . . . -93 . . . . . . . . . . . . . -93 -93 . . . . . . . . . . . . . . . . . . . . -93 165 . . . -93 .
+. 160 . 172 . -91 -91 . . -91 161 . 168 . . -91 175 . . . . . 176 . -91 164 169 . 162 . 177 174 163 173 . -91 . . . . . . . -91 . . . . . . . . . . . . . -91 -91 . . . . . . . . . . . . . . . . . . . . -91 -91 . . . -91 .
+. -82 . 172 . -82 -82 . . -82 161 . -82 . . -82 -82 . . . . . 176 . -82 -82 -82 . -82 . -82 -82 -82 -82 . -82 . . . . . . . -82 . . . . . . . . . . . . . -82 -82 . . . . . . . . . . . . . . . . . . . . -82 -82 . . . -82 .
+. -84 . 172 . -84 -84 . . -84 161 . 168 . . -84 175 . . . . . 176 . -84 -84 -84 . -84 . -84 -84 -84 -84 . -84 . . . . . . . -84 . . . . . . . . . . . . . -84 -84 . . . . . . . . . . . . . . . . . . . . -84 -84 . . . -84 .
+. . . . . . . . . . . . . . . 194 . . . . . . . . . . . . . . . . . . . . . . . . . . . 284 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. 160 . 172 . 167 -94 . . -94 161 . 168 . . -94 175 . . . . . 176 . -94 164 169 . 162 . 177 174 163 173 . -94 . . . . . . . -94 . . . . . . . . . . . . . -94 166 . . . . . . . . . . . . . . . . . . . . -94 165 . . . -94 .
+. -78 . -78 . -78 -78 . . -78 -78 . -78 . . -78 -78 . . . . . -78 . -78 -78 -78 . -78 . -78 -78 -78 -78 . -78 . . . . . . . -78 . . . . . . . . . . . . . -78 -78 . . . . . . . . . . . . . . . . . . . . -78 -78 . . . -78 .
+. -83 . 172 . -83 -83 . . -83 161 . 168 . . -83 175 . . . . . 176 . -83 -83 -83 . -83 . -83 -83 -83 -83 . -83 . . . . . . . -83 . . . . . . . . . . . . . -83 -83 . . . . . . . . . . . . . . . . . . . . -83 -83 . . . -83 .
+. -87 . 172 . -87 -87 . . -87 161 . 168 . . -87 175 . . . . . 176 . -87 -87 169 . -87 . -87 -87 -87 173 . -87 . . . . . . . -87 . . . . . . . . . . . . . -87 -87 . . . . . . . . . . . . . . . . . . . . -87 -87 . . . -87 .
+. -81 . 172 . -81 -81 . . -81 161 . -81 . . -81 -81 . . . . . 176 . -81 -81 -81 . -81 . -81 -81 -81 -81 . -81 . . . . . . . -81 . . . . . . . . . . . . . -81 -81 . . . . . . . . . . . . . . . . . . . . -81 -81 . . . -81 .
+. -79 . -79 . -79 -79 . . -79 -79 . -79 . . -79 -79 . . . . . -79 . -79 -79 -79 . -79 . -79 -79 -79 -79 . -79 . . . . . . . -79 . . . . . . . . . . . . . -79 -79 . . . . . . . . . . . . . . . . . . . . -79 -79 . . . -79 .
+. -90 . 172 . -90 -90 . . -90 161 . 168 . . -90 175 . . . . . 176 . -90 164 169 . 162 . -90 174 163 173 . -90 . . . . . . . -90 . . . . . . . . . . . . . -90 -90 . . . . . . . . . . . . . . . . . . . . -90 -90 . . . -90 .
+. 160 . 172 . 167 171 . . -95 161 . 168 . . -95 175 . . . . . 176 . -95 164 169 . 162 . 177 174 163 173 . -95 . . . . . . . -95 . . . . . . . . . . . . . -95 166 . . . . . . . . . . . . . . . . . . . . -95 165 . . . -95 .
+. . . . . . . . . 285 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . -163 . . . . . . . . -163 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -163 .
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . 189 . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . 185 . . . . 90 287 85
+. . . . . . . . . . . . . . . . . . . . -157 . . . . . . . . -157 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -157 . . . . . . .
+-155 . . . . -155 . . -155 . -155 . -155 . . . -155 . . . . . . . . . . . . . . . . . . . . . . . . -155 . . . . . . . . . . -155 . . . . . . . . . . . . . -155 . -155 . . . . . . . . . . . . . . -155 . -155
+. . . . . . . . . . . . . . . -154 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -154 .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 288 . . . . . .
+. . . . . . . . . . . . . . . . . . . . -159 . . . . . . . . -159 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -159 . . . . . . .
+-199 . . . . -199 . . -199 . -199 . -199 . . . -199 . . . . . . . . . . . . . . . . . . . -199 -199 -199 -199 -199 -199 -199 . -199 -199 -199 . . -199 -199 -199 -199 -199 -199 -199 -199 . . . -199 -199 -199 -199 -199 -199 -199 -199 -199 -199 -199 -199 -199 -199 -199 -199 -199 -199 . . . . . -199 -199 -199
+. . . . . . . . . 289 . . . . . 194 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . 290 . . . . . 194 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+. . . . . . . . . -125 . . . . . -125 . . . . . . . . -125 . . . . . . . . . . . . . . . . . . -125 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -125 . . . . . .
+. . . . . . . . . 292 . . . . . 194 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . 293 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+-190 . . . . -190 . . -190 . -190 . -190 . . . -190 . . . . . . . . . . . . . . . . . . . -190 -190 -190 -190 -190 -190 -190 . -190 -190 -190 . . -190 -190 -190 -190 -190 -190 -190 -190 . . . -190 -190 -190 -190 -190 -190 -190 -190 -190 -190 -190 -190 -190 -190 -190 -190 -190 -190 . . . . . -190 -190 -190
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . 116 119 . . 84 109 . 117 114 . . . . . 104 74 101 . . . . . . . . . 99 . . 79 . 94 . 100 . . . . . . 108 . . . . . 57 . 85
+. . . . . . . . 274 -132 . . . . . -132 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 273 . . . . . . .
+-106 . . . . -106 . . -106 . -106 . -106 . . . -106 . . . . . . . . . . . . . . . . . . . . . . . . -106 . . . . . . . . . . -106 . . . . . . . . . . . . . -106 . -106 . . . . . . . . . . 295 . . . . . -106
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 296 . . . . . .
+. . . . . . . . -134 -134 . . . . . -134 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -134 . . . . . . .
+. . . . . . . . . 297 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . 298 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . -140 -140 . . . . . -140 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -140 . . . . . . .
+93 . . . . 80 . . 87 . 299 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . 301 . . . . . 85
+. . . . . . . . . 303 . . . . . . . . . . . . . . . . . . . . . . . . . . 26 . . 19 5 . . . . . 23 . . 4 8 . . . 33 20 10 . . . . 30 17 . 32 3 . 27 . 11 . 6 1 7 13 35 14 . . . . . . . . .
+. . . . . . . . . -147 . . . . . -147 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . -145 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . -165 . . . . . -165 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. -101 . -101 -101 -101 -101 -101 . -101 -101 -101 -101 . -101 -101 -101 . -101 . . . -101 -101 -101 -101 -101 -101 -101 -101 -101 -101 -101 -101 -101 -101 . . . . . . . -101 . . . . . . . . . . . . . -101 -101 -101 . . . . . . . . . . . . . . . . . . . -101 -101 -101 . 283 -101 .
+. -109 . -109 -109 -109 -109 -109 -109 -109 -109 -109 -109 -109 -109 -109 -109 -109 -109 -109 -109 . -109 -109 -109 -109 -109 -109 -109 -109 -109 -109 -109 -109 -109 -109 . . . . . . . -109 . . . . . . . . . . . . . -109 -109 -109 . . . . . . . . . . . . . . . . . . -109 -109 -109 -109 . . -109 .
+. -111 . -111 -111 -111 -111 -111 -111 -111 -111 -111 -111 -111 -111 -111 -111 -111 -111 -111 -111 . -111 -111 -111 -111 -111 -111 -111 -111 -111 -111 -111 -111 -111 -111 . . . . . . . -111 . . . . . . . . . . . . . -111 -111 -111 . . . . . . . . . . . . . . . . . . -111 -111 -111 -111 . . -111 .
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+. -97 . -97 -97 -97 -97 -97 . -97 -97 -97 -97 . -97 -97 -97 . -97 . . . -97 -97 -97 -97 -97 -97 -97 -97 -97 -97 -97 -97 -97 -97 . . . . . . . -97 . . . . . . . . . . . . . -97 -97 -97 . . . . . . . . . . . . . . . . . . . -97 -97 -97 . . -97 .
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . 189 . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . 185 . . . . 90 . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+93 . . . . 80 . . 180 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . 283 . 85
+. . . . . . . . . . . . . . . -152 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -152 .
+. . . . . . . . . . . . . . . -162 . . . . . . . . -162 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -162 .
+. . . . . . . . . . . . . . . . . . . . -158 . . . . . . . . -158 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -158 . . . . . . .
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . 116 119 . . 84 109 . 117 114 . . . . . 104 74 101 . . . . . . . . . 99 . . 79 . 94 . 100 . . . . . . 108 . . . . . 57 . 85
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . 116 119 . . 84 109 . 117 114 . . . . . 104 74 101 . . . . . . . . . 99 . . 79 . 94 . 100 . . . . . . 108 . . . . . 57 . 85
+. . . . . . . . . . . . . . . 194 . . . . . . . . 310 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . 116 119 . . 84 109 . 117 114 . . . . . 104 74 101 . . . . . . . . . 99 . . 79 . 94 . 100 . . . . . . 108 . . . . . 57 . 85
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+-189 . . . . -189 . . -189 . -189 . -189 . . . -189 . . . . . . . . . . . . . . . . . . . -189 -189 -189 -189 -189 -189 -189 . -189 -189 -189 . . -189 -189 -189 -189 -189 -189 -189 -189 . . . -189 -189 -189 -189 -189 -189 -189 -189 -189 -189 -189 -189 -189 -189 -189 -189 -189 -189 . . . . . -189 -189 -189
+. . . . . . . . -138 -138 . . . . . -138 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -138 . . . . . . .
+. . . . . . . . -135 -135 . . . . . -135 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -135 . . . . . . .
+. . . . . . . . -141 -141 . . . . . -141 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -141 . . . . . . .
+. . . . . . . . -133 -133 . . . . . -133 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -133 . . . . . . .
+-106 . . . . -106 . . -106 . -106 . -106 . . . -106 . . . . . . . . . . . . . . . . . . . . . . . . -106 . . . . . . . . . . -106 . . . . . . . . . . . . . -106 . -106 . . . . . . . . . . 313 . . . . . -106
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 314 . . . . . .
+. . . . . . . . -136 -136 . . . . . -136 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -136 . . . . . . .
+. . . . . . . . . 315 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . -142 -142 . . . . . -142 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -142 . . . . . . .
+. . . . . . . . . -119 . . . . . -119 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . 317 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 316 .
+. . . . . . . . . -76 . . . . . -76 . . . . . . . . -76 . . . . . . . . . . . . . . . . . . -76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -76 . . . . -76 .
+-193 . . . . -193 . . -193 . -193 . -193 . . . -193 . . . . . . . . . . . . . . . . . . . -193 -193 -193 -193 -193 -193 -193 . -193 -193 -193 . . -193 -193 -193 -193 -193 -193 -193 -193 . . . -193 -193 -193 -193 -193 -193 -193 -193 -193 -193 -193 -193 -193 -193 -193 -193 -193 -193 . . . . . -193 -193 -193
+-191 . . . . -191 . . -191 . -191 . -191 . . . -191 . . . . . . . . . . . . . . . . . . . -191 -191 -191 -191 -191 -191 -191 . -191 -191 -191 . . -191 -191 -191 -191 -191 -191 -191 -191 . . . -191 -191 -191 -191 -191 -191 -191 -191 -191 -191 -191 -191 -191 -191 -191 -191 -191 -191 . . . . . -191 -191 -191
+-186 . . . . -186 . . -186 . -186 . -186 . . . -186 . . . . . . . . . . . . . . . . . . . -186 -186 -186 -186 -186 -186 -186 . -186 -186 -186 318 . -186 -186 -186 -186 -186 -186 -186 -186 . . . -186 -186 -186 -186 -186 -186 -186 -186 -186 -186 -186 -186 -186 -186 -186 -186 -186 -186 . . . . . -186 -186 -186
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . . . . . . . . 85
+-194 . . . . -194 . . -194 . -194 . -194 . . . -194 . . . . . . . . . . . . . . . . . . . -194 -194 -194 -194 -194 -194 -194 . -194 -194 -194 . . -194 -194 -194 -194 -194 -194 -194 -194 . . . -194 -194 -194 -194 -194 -194 -194 -194 -194 -194 -194 -194 -194 -194 -194 -194 -194 -194 . . . . . -194 -194 -194
+. . . . . . . . . 320 . . . . . 194 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . -139 -139 . . . . . -139 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -139 . . . . . . .
+. . . . . . . . -137 -137 . . . . . -137 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -137 . . . . . . .
+. . . . . . . . -143 -143 . . . . . -143 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . -143 . . . . . . .
+. -117 . -117 -117 -117 -117 -117 -117 -117 -117 -117 -117 -117 -117 -117 -117 -117 -117 -117 -117 . -117 -117 -117 -117 -117 -117 -117 -117 -117 -117 -117 -117 -117 -117 . . . . . . . -117 . . . . . . . . . . . . . -117 -117 -117 . . . . . . . . . . . . . . . . . . -117 -117 -117 -117 . . -117 .
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . 189 . . . . . . . . . . . . . . . . . . . . 84 . . . . . . . . . . 74 . . . . . . . . . . . . . 79 . 94 . . . . . . . . . 185 . . . . 90 321 85
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . 116 119 . . 84 109 . 117 114 . . . . . 104 74 101 . . . . . . . . . 99 . . 79 . 94 . 100 . . . . . . 108 . . . . . 57 . 85
+. . . . . . . . . 323 . . . . . 194 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . 324 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. -116 . -116 -116 -116 -116 -116 -116 -116 -116 -116 -116 -116 -116 -116 -116 -116 -116 -116 -116 . -116 -116 -116 -116 -116 -116 -116 -116 -116 -116 -116 -116 -116 -116 . . . . . . . -116 . . . . . . . . . . . . . -116 -116 -116 . . . . . . . . . . . . . . . . . . -116 -116 -116 -116 . . -116 .
+-192 . . . . -192 . . -192 . -192 . -192 . . . -192 . . . . . . . . . . . . . . . . . . . -192 -192 -192 -192 -192 -192 -192 . -192 -192 -192 . . -192 -192 -192 -192 -192 -192 -192 -192 . . . -192 -192 -192 -192 -192 -192 -192 -192 -192 -192 -192 -192 -192 -192 -192 -192 -192 -192 . . . . . -192 -192 -192
+93 . . . . 80 . . 87 . 77 . 81 . . . 91 . . . . . . . . . . . . . . . . . . . . 116 119 . . 84 109 . 117 114 . . . . . 104 74 101 . . . . . . . . . 99 . . 79 . 94 . 100 . . . . . . 108 . . . . . 57 . 85
+-195 . . . . -195 . . -195 . -195 . -195 . . . -195 . . . . . . . . . . . . . . . . . . . -195 -195 -195 -195 -195 -195 -195 . -195 -195 -195 . . -195 -195 -195 -195 -195 -195 -195 -195 . . . -195 -195 -195 -195 -195 -195 -195 -195 -195 -195 -195 -195 -195 -195 -195 -195 -195 -195 . . . . . -195 -195 -195
+-196 . . . . -196 . . -196 . -196 . -196 . . . -196 . . . . . . . . . . . . . . . . . . . -196 -196 -196 -196 -196 -196 -196 . -196 -196 -196 . . -196 -196 -196 -196 -196 -196 -196 -196 . . . -196 -196 -196 -196 -196 -196 -196 -196 -196 -196 -196 -196 -196 -196 -196 -196 -196 -196 . . . . . -196 -196 -196
+""")
+
+# state * len(NONTERMINALS) + nonterminal -> state
+GOTO = table("""
+. . . . . . . . . . . . 31 . 29 28 . . . . . . . . 21 25 12 . . . . . . . . . . . . . . . . . . . 15 . . . . 18 16 2 . 34 . 9 22 . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . 31 . 29 28 . . . . . . . . 36 25 12 . . . . . . . . . . . . . . . . . . . 15 . . . . 18 16 . . 34 . 9 22 . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . 41 . . . . 46 . . . . . . 39 43 . . . . . . . . . 44 . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . 29 47 . . . . . . . . . . 12 . . . . . . . . . . . . . . . . . . . 15 . . . . 18 16 . . 34 . 9 22 . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 53 49 . . 52 50 . . 18 16 . . 54 . 51 22 . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . 55 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 58 . . . . . . . . . . . . . . . 60 59 . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . 63 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . 64 . . . . 46 . . . . . . . . . . . . . . . . . 44 . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 53 49 . . 52 67 . . 18 16 . . 54 . 51 22 . .
+. . . . . . . . . . . . . . . . 68 . . . . 46 . . . . . . . . . . . . . . . . . 44 . . . . . . . . . 70 69 . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 53 49 . . 71 . . . 18 16 . . 54 . 51 22 . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 53 73 . . . . . . 18 16 . . 54 . 51 22 . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 78 . 88 . . 76 . 82 . . . . . . . . . . . . . . . . . . . . 92 . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . 96 . 88 98 118 76 107 82 . 115 . 29 103 . . . . . . 106 113 . . 12 . . . . . . 105 111 97 . . . . 83 75 112 . . 95 15 . . . . 18 16 . . 34 . 9 22 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 120 . . . . . . . . . . . . . . . 121 . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . 123 . . . . 46 . . . . . . 122 . . . . . . . . . . 44 . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . 29 129 . . . . . . . . . . 12 132 . . . . . . . . 128 130 127 . . . . . . . 15 . . . . 18 16 . . 34 . 9 22 . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 53 49 . . 71 . . . 18 16 . . 54 . 51 22 . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 138 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . 146 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 96 . 88 . . 76 . 82 . . . . . . . . . . . 159 . . . . . . . . . . . . . . . . . 83 75 . 53 157 . . . . . . 18 16 . 158 54 . 51 22 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . 179 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . 78 . 88 . . 76 . 82 . . . . . . 184 188 183 . . . . . . . . . . 186 187 182 . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 96 . 88 . . 76 . 82 . . . . . . . . . . . 190 . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . 123 . . . . 46 . . . . . . 39 43 . . . . . . . . . 44 . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 96 . 88 . . 76 107 82 . . . . . . . . . . . 106 113 . . . . . . . . . 105 111 97 . . . . 83 75 112 . . 198 . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 96 . 88 201 . 76 107 82 . 115 . 29 103 . . . . . . 106 113 . . 12 . . . . . . 105 111 97 . . . . 83 75 112 . . 95 15 . . . . 18 16 . . 34 . 9 22 86 89
+. . . . . 88 . . 76 . 203 204 . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+211 . . . . . . . . . . . . . . . 208 . . . 210 46 . . . . . . . . . . . . . . . . . 206 . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . 88 . . 76 . 203 215 . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . . . . . . . . . . . . 68 . . . . 46 . . . . . . . . . . . . . . . . . 44 . . . . . . . . . 216 . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 96 . 88 . . 76 . 82 . . . . . . . . . . . 159 . . . . . . . . . . . . . . . . . 83 75 . 53 157 . . . . . . 18 16 . 217 54 . 51 22 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 96 . 88 . . 76 . 82 . . . . . . . . . . . 218 . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . 220 221 . 88 . . 76 . 82 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 224 . 88 . . 76 . 82 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+227 . . . . . . . . . . . . . . . . . . . 210 . . . . . . . . . . . . . . . . . . 225 . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . 230 . . 76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . 231 . . 76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . 232 . . 76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . 233 . . 76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . 234 . . 76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . 235 . . 76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . 236 . . 76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . 237 . . 76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . 238 . . 76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . 239 . . 76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . 96 . 88 . . 76 . 82 . . . . . . . . . . . 240 . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . . . 241 . . 76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . 242 . . 76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . 243 . . 76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . 244 . . 76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . 245 . . 76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . 246 . . 76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . 247 . . 76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . 248 . . 76 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 96 . 88 . . 76 . 82 . . . . . . . . . . . 159 . . . . . . . . . . . . . . . . . 83 75 . 53 157 . . . . . . 18 16 . 249 54 . 51 22 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . 252 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 78 . 88 . . 76 . 82 . . . . . . . . . . . . . . . . . . . . 254 . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . . . 88 . . 76 . 203 255 . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 96 . 88 . . 76 . 82 . . . . . . . . . . . 258 . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . 96 . 88 . . 76 . 82 . . . . . . . . . . . 259 . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . 260 . 29 103 . . . . . . . . . . 12 . . . . . . . . . . . . . . . . . . . 15 . . . . 18 16 . . 34 . 9 22 . .
+. . . 261 . 88 . . 76 . 82 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 96 . 88 . . 76 . 82 . . . . . . . . . . . 262 . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 96 . 88 . . 76 107 82 . . . . . . . . . . . 106 113 . . . . . . . . . 105 111 97 . . . . 83 75 112 . . 264 . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . 266 63 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 268 . 88 . . 76 . 82 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+271 . . . . . . . . . . . . . 29 129 64 . . . 210 46 . . . . 12 . . . . . . . . . 128 130 270 206 . . . . . . 15 . . . . 18 16 . . 34 . 9 22 . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . 29 129 . . . . . . . . . . 12 . . . . . . . . . 275 . . . . . . . . . 15 . . . . 18 16 . . 34 . 9 22 . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . 266 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+271 . . . . . . . . . . . . . 29 129 . . . . 210 . . . . . 12 . . . . . . . . . 128 130 270 225 . . . . . . 15 . . . . 18 16 . . 34 . 9 22 . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . 282 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 78 . 88 . . 76 . 82 . . . . . . 184 188 183 . . . . . . . . . . 286 187 . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 96 . 88 . . 76 . 82 . . . . . . . . . . . 291 . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 96 . 88 . . 76 107 82 . . . . . . . . . . . 106 113 . . . . . . . . . 105 111 97 . . . . 83 75 112 . . 294 . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 300 . 88 . . 76 . 82 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . 29 129 . . . . . . . . . . 12 . . . . . . . . . 128 130 302 . . . . . . . 15 . . . . 18 16 . . 34 . 9 22 . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 304 . 88 . . 76 . 82 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 78 . 88 . . 76 . 82 . . . . . . 184 188 183 . . . . . . . . . . 186 187 305 . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . . . 88 . . 76 . 306 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . . . . 282 . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 181 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 96 . 88 . . 76 107 82 . . . . . . . . . . . 106 113 . . . . . . . . . 105 111 97 . . . . 83 75 112 . . 307 . . . . . . . . . . . . . 86 89
+. . . 96 . 88 . . 76 309 82 . . . . . . . . . . . 106 113 . . . . . . . . . 105 111 97 . . . . 83 75 112 . . 308 . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 96 . 88 . . 76 107 82 . . . . . . . . . . . 106 113 . . . . . . . . . 105 111 97 . . . . 83 75 112 . . 311 . . . . . . . . . . . . . 86 89
+. . . 96 . 88 . . 76 . 82 . . . . . . . . . . . 312 . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 96 . 88 . . 76 . 82 . . . . . . . . . . . 319 . . . . . . . . . . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 78 . 88 . . 76 . 82 . . . . . . 184 188 183 . . . . . . . . . . 286 187 . . . . . . . . 83 75 . . . . . . . . . . . . . . . . . 86 89
+. . . 96 . 88 . . 76 107 82 . . . . . . . . . . . 106 113 . . . . . . . . . 105 111 97 . . . . 83 75 112 . . 322 . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . 96 . 88 . . 76 107 82 . . . . . . . . . . . 106 113 . . . . . . . . . 105 111 97 . . . . 83 75 112 . . 325 . . . . . . . . . . . . . 86 89
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+""")
@@ -1,7 +1,83 @@
+from errors import Diagnostics
+from source import LineIndex
+
+
+class SymbolTable:
+    # visible typedef names map to True, ordinary identifiers hiding one of them to False;
+    # each brace scope keeps an undo log of what it declared, so a lookup is a single
+    # dict access and pop restores the enclosing meaning
+    def __init__(self) -> None:
+        self.names = {}
+        self.scopes = []
+
+    @property
+    def depth(self) -> int:
+        return len(self.scopes)
+
+    def push(self) -> None:
+        self.scopes.append([])
+
+    def pop(self) -> list:
+        # the names the scope declared; unbalanced "}" are left for the parser to report
+        if not self.scopes:
+            return []
+
+        scope = self.scopes.pop()
+
+        for name, previous in reversed(scope):
+            if previous is None:
+                del self.names[name]
+
+            else:
+                self.names[name] = previous
+
+        return [name for name, _ in scope]
+
+    def declare(self, name: str, isType: bool) -> None:
+        if self.scopes:
+            self.scopes[-1].append((name, self.names.get(name)))
+
+        self.names[name] = isType
+
+    def declareType(self, name: str) -> None:
+        self.declare(name, True)
+
+    def declareObject(self, name: str) -> None:
+        self.declare(name, False)
+
+    def isType(self, name: str) -> bool:
+        return self.names.get(name, False)
+
 
 class ParserState:
-    def __init__(self, filename: str, source: str):
+    def __init__(self, filename: str, source: str, diagnostics: Diagnostics = None):
         self.filename = filename
         self.source = source
 
+        # collects errors for recovery, None stops at the first one
+        self.diagnostics = diagnostics
+
         self.traceback = ""
+
+        # lexer feedback for typedef names: scope depth of the typedef being declared
+        # (None outside of one), whether the next identifier is a declarator or a struct tag
+        self.typedef = None
+        self.declarator = False
+        self.tag = False
+        self.symbols = SymbolTable()
+
+        # whether a "(" here opens a parameter list, which gets a scope of its own, whether
+        # each open "(" did, and the names of the list just closed for a function body
+        self.parameters = False
+        self.parens = []
+        self.body = []
+
+        self._lines = None
+
+    @property
+    def lines(self) -> LineIndex:
+        # built on first use, shared by the lexer and the error messages
+        if self._lines is None:
+            self._lines = LineIndex(self.source)
+
+        return self._lines